@@ -74,7 +74,7 @@ class ReportGenerator:
             "total_score": score_breakdown.get("total_score", 0) if score_breakdown else 0,
             
             "reasoning_summary": self._generate_reasoning_summary(
-                score_breakdown, semantic_analysis, validation_flags
+                score_breakdown, semantic_analysis, validation_flags, github_data
             ),
             
             "verified_skills": self._extract_verified_skills(
@@ -95,6 +95,12 @@ class ReportGenerator:
             # AI insights
             "ai_analysis": self._format_ai_analysis(semantic_analysis),
             
+            # Where the scrapes spent their time
+            "scrape_timings": {
+                "github": self._summarize_timings(github_data),
+                "linkedin": self._summarize_timings(linkedin_data)
+            },
+            
             # Raw data (for debugging/audit)
             "raw_data": {
                 "github": github_data,
@@ -136,7 +142,8 @@ class ReportGenerator:
         self,
         score_breakdown: Optional[Dict],
         semantic_analysis: Optional[Dict],
-        validation_flags: Optional[List[Dict]]
+        validation_flags: Optional[List[Dict]],
+        github_data: Optional[Dict] = None
     ) -> str:
         """Generate a human-readable reasoning summary."""
         parts = []
@@ -168,6 +175,10 @@ class ReportGenerator:
             if high_flags:
                 parts.append(f"⚠️ Found {len(high_flags)} critical discrepancy(ies) in claims.")
         
+        incomplete = self._incomplete_github_phases(github_data)
+        if incomplete:
+            parts.append(f"GitHub data is incomplete ({', '.join(incomplete)}); activity was scored on what was gathered.")
+        
         return " ".join(parts) if parts else "Analysis completed. Please review individual sections."
     
     def _extract_verified_skills(
@@ -234,6 +245,8 @@ class ReportGenerator:
         if not github_data:
             return None
         
+        history = github_data.get("contribution_history") or {}
+        
         return {
             "username": github_data.get("username"),
             "commits_12_months": github_data.get("commits_12_months", 0),
@@ -244,7 +257,39 @@ class ReportGenerator:
             ],
             "readme_quality": github_data.get("readme_complexity_score", 0),
             "contribution_streak": github_data.get("contribution_streak", 0),
-            "followers": github_data.get("followers", 0)
+            "followers": github_data.get("followers", 0),
+            "first_contribution_year": history.get("first_year"),
+            "years_active": history.get("years_active"),
+            "completeness": github_data.get("completeness"),
+            "incomplete_phases": self._incomplete_github_phases(github_data)
+        }
+    
+    def _incomplete_github_phases(self, github_data: Optional[Dict]) -> List[str]:
+        """GitHub scrape phases that did not gather all of their data."""
+        completeness = (github_data or {}).get("completeness") or {}
+        return [phase for phase, value in completeness.items() if value < 1.0]
+    
+    def _summarize_timings(self, scrape_data: Optional[Dict]) -> Optional[Dict[str, Any]]:
+        """Summarize a scrape's timings block (the full block stays in raw_data)."""
+        timings = (scrape_data or {}).get("timings")
+        if not timings:
+            return None
+        
+        navigations = timings.get("navigations", [])
+        slowest = max(navigations, key=lambda entry: entry.get("total_ms") or 0, default=None)
+        
+        return {
+            "cache_hit": timings.get("cache_hit", False),
+            "total_ms": timings.get("total_ms"),
+            "slowest_phase": timings.get("slowest_phase"),
+            "phases": timings.get("phases", {}),
+            "extraction_ms": round(sum(timings.get("extraction", {}).values()), 1),
+            "navigations": len(navigations),
+            "slowest_navigation": (
+                {"url": slowest.get("url"), "total_ms": slowest.get("total_ms"), "ttfb_ms": slowest.get("ttfb_ms")}
+                if slowest else None
+            ),
+            "bytes_transferred": timings.get("bytes_transferred", 0)
         }
     
     def _summarize_linkedin(self, linkedin_data: Optional[Dict]) -> Optional[Dict[str, Any]]:
@@ -41,6 +41,15 @@ class Scorer:
         "repos_fair": 5             # 5+ repos = 6/10
     }
     
+    # Activity components used when the scrape phase behind them ran out of
+    # time (they add up to the 5.0 given when there is no GitHub data at all)
+    ACTIVITY_NEUTRAL = {
+        "commits": 2.0,
+        "repos": 1.5,
+        "readme": 1.0,
+        "streak": 0.5
+    }
+    
     def __init__(self):
         """Initialize the scorer."""
         pass
@@ -97,6 +106,7 @@ class Scorer:
                 "credibility": round(credibility_score, 1)
             },
             "weights": self.WEIGHTS,
+            "data_completeness": (github_data or {}).get("completeness"),
             "interpretation": self._interpret_score(total_score)
         }
     
@@ -204,10 +214,17 @@ class Scorer:
         - Number of public repositories
         - README quality
         - Contribution streak
+        
+        Components whose scrape phase gathered nothing (see the scrape
+        result's "completeness" map) get a neutral value instead of being
+        scored as zero activity.
         """
         if not github_data:
             return 5.0  # Neutral if no GitHub data
         
+        completeness = github_data.get("completeness") or {}
+        missing = {phase for phase, value in completeness.items() if value == 0}
+        
         # Commits score (max 4 points)
         commits = github_data.get("commits_12_months", 0)
         if commits >= self.ACTIVITY_BENCHMARKS["commits_excellent"]:
@@ -237,6 +254,15 @@ class Scorer:
         streak = github_data.get("contribution_streak", 0)
         streak_score = min(1.0, streak / 30)  # 30+ day streak = 1 point
         
+        # Missing phases: profile -> repos, contributions -> commits/streak, readmes -> README
+        if "contributions" in missing:
+            commits_score = self.ACTIVITY_NEUTRAL["commits"]
+            streak_score = self.ACTIVITY_NEUTRAL["streak"]
+        if "profile" in missing:
+            repos_score = self.ACTIVITY_NEUTRAL["repos"]
+        if "readmes" in missing:
+            readme_score = self.ACTIVITY_NEUTRAL["readme"]
+        
         total = commits_score + repos_score + readme_score + streak_score
         
         return max(0, min(10, total))
@@ -0,0 +1,535 @@
+"""
+Browser Pool - Shared Chromium for the Researcher Agent
+
+Launching Chromium costs 1-3 seconds per scrape. This module keeps one
+process-wide browser alive for the lifetime of the API and hands out
+isolated BrowserContexts to the scrapers:
+1. Contexts are reused across candidates: on release their pages are
+   closed and their cookies, routes and the storage of every origin they
+   visited (localStorage, sessionStorage, IndexedDB, Cache Storage,
+   service workers) are wiped
+2. The number of concurrently leased contexts is capped by the pool size
+3. The browser is health-checked on every lease and relaunched if it died
+4. A memory governor recycles the browser once it has served too many pages
+   or its Chromium process tree grows past an RSS limit: a fresh browser
+   takes new leases while the old one drains and is closed after its last
+   in-flight scrape releases its context
+
+The pool is started/stopped by the FastAPI lifespan in app/main.py.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+
+from ..config import settings
+
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Process names (/proc/<pid>/comm) of Chromium's browser, renderer and helper processes
+CHROMIUM_PROCESS_NAMES = ("chrome", "chromium", "headless_shell")
+
+
+def _read_processes() -> Optional[Dict[int, Tuple[int, str, int]]]:
+    """Every readable /proc entry as pid -> (ppid, name, RSS pages), or None without /proc."""
+    try:
+        pids = [int(entry) for entry in os.listdir("/proc") if entry.isdigit()]
+    except OSError:
+        return None
+    
+    processes = {}
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat", "r") as f:
+                stat = f.read()
+            with open(f"/proc/{pid}/statm", "r") as f:
+                rss_pages = int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        # comm is parenthesised and may contain spaces; ppid follows the state field
+        name = stat[stat.index("(") + 1:stat.rindex(")")].lower()
+        ppid = int(stat[stat.rindex(")") + 2:].split()[1])
+        processes[pid] = (ppid, name, rss_pages)
+    return processes
+
+
+def _descendants(processes: Dict[int, Tuple[int, str, int]], root_pid: int) -> List[int]:
+    """Pids below root_pid in the process tree."""
+    children: Dict[int, List[int]] = {}
+    for pid, (ppid, _, _) in processes.items():
+        children.setdefault(ppid, []).append(pid)
+    
+    found = []
+    stack = list(children.get(root_pid, []))
+    while stack:
+        pid = stack.pop()
+        found.append(pid)
+        stack.extend(children.get(pid, []))
+    return found
+
+
+def chromium_rss_mb(root_pid: Optional[int] = None) -> Optional[float]:
+    """
+    Resident memory of the Chromium processes in root_pid's process tree.
+    
+    Args:
+        root_pid: A browser process (see launch_chromium), measured with its
+            renderers and helpers; defaults to this process, which sums
+            every Chromium launched from it
+    
+    Returns:
+        RSS in megabytes, or None where /proc is unavailable (non-Linux)
+    """
+    root_pid = root_pid or os.getpid()
+    processes = _read_processes()
+    if processes is None:
+        return None
+    
+    total_pages = 0
+    for pid in [root_pid, *_descendants(processes, root_pid)]:
+        if pid in processes:
+            _, name, rss_pages = processes[pid]
+            if name.startswith(CHROMIUM_PROCESS_NAMES):
+                total_pages += rss_pages
+    
+    return round(total_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+
+
+def _chromium_browser_pids() -> Optional[Dict[int, int]]:
+    """Chromium browser processes under this process (parent is not Chromium), as pid -> ppid."""
+    processes = _read_processes()
+    if processes is None:
+        return None
+    
+    browsers = {}
+    for pid in _descendants(processes, os.getpid()):
+        ppid, name, _ = processes[pid]
+        parent_name = processes.get(ppid, (0, "", 0))[1]
+        if name.startswith(CHROMIUM_PROCESS_NAMES) and not parent_name.startswith(CHROMIUM_PROCESS_NAMES):
+            browsers[pid] = ppid
+    return browsers
+
+
+async def launch_chromium(
+    playwright: Playwright,
+    driver_pid: Optional[int] = None,
+    **launch_options: Any
+) -> Tuple[Browser, Optional[int], Optional[int]]:
+    """
+    Launch Chromium and find the pid of its browser process.
+    
+    Playwright does not expose the pid, so the Chromium browser processes
+    under this process are listed before and after the launch. The pool
+    and the LinkedIn session each run their own Playwright driver and may
+    launch at the same time; passing the driver pid of an earlier launch
+    keeps the other driver's browser out.
+    
+    Args:
+        playwright: Started Playwright driver
+        driver_pid: Parent of this driver's earlier browser, if known
+        **launch_options: Keyword arguments for chromium.launch()
+    
+    Returns:
+        (browser, browser pid, driver pid); the pids are None if the
+        browser process could not be told apart or /proc is unavailable
+    """
+    before = _chromium_browser_pids()
+    browser = await playwright.chromium.launch(**launch_options)
+    after = _chromium_browser_pids()
+    if before is None or after is None:
+        return browser, None, None
+    
+    launched = {pid: ppid for pid, ppid in after.items() if pid not in before}
+    if driver_pid:
+        launched = {pid: ppid for pid, ppid in launched.items() if ppid == driver_pid}
+    if len(launched) != 1:
+        return browser, None, driver_pid
+    
+    (browser_pid, driver_pid), = launched.items()
+    return browser, browser_pid, driver_pid
+
+
+class BrowserPool:
+    """
+    Process-wide pool of reusable Playwright BrowserContexts.
+    
+    Usage:
+        pool = BrowserPool(size=4)
+        await pool.start()
+        async with pool.context() as context:
+            page = await context.new_page()
+        await pool.close()
+    """
+    
+    def __init__(
+        self,
+        size: int = 4,
+        headless: bool = True,
+        slow_mo: int = 0,
+        user_agent: str = DEFAULT_USER_AGENT,
+        max_pages: int = 0,
+        max_rss_mb: int = 0,
+        memory_check_interval: float = 5.0
+    ):
+        """
+        Initialize the browser pool.
+        
+        Args:
+            size: Maximum number of contexts leased at the same time
+            headless: Run browser in headless mode
+            slow_mo: Slow down operations by specified milliseconds (for debugging)
+            user_agent: User agent applied to every pooled context
+            max_pages: Recycle the browser after serving this many pages (0 = never)
+            max_rss_mb: Recycle the browser when its Chromium process tree
+                exceeds this resident memory in MB (0 = never)
+            memory_check_interval: Minimum seconds between RSS measurements
+        """
+        self.size = max(1, size)
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.user_agent = user_agent
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.memory_check_interval = memory_check_interval
+        
+        self.browser: Optional[Browser] = None
+        self._playwright: Optional[Playwright] = None
+        self._idle: List[BrowserContext] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._leased = 0
+        
+        # Origins each context's pages navigated to, wiped on release; pages
+        # opened for the wipe itself are not counted as served
+        self._origins: Dict[BrowserContext, Set[str]] = {}
+        self._wiping: Set[BrowserContext] = set()
+        
+        # Memory governor state: leases per browser, browsers being drained
+        self._leases: Dict[Browser, int] = {}
+        self._draining: List[Browser] = []
+        self._pages_served = 0
+        self._browser_pid: Optional[int] = None
+        self._driver_pid: Optional[int] = None
+        self._rss_mb: Optional[float] = None
+        self._rss_checked_at = 0.0
+        self.recycle_events: List[Dict[str, Any]] = []
+        
+        self.stats = {
+            "contexts_created": 0,
+            "contexts_reused": 0,
+            "contexts_discarded": 0,
+            "browser_launches": 0,
+            "browser_recycles": 0
+        }
+    
+    @property
+    def running(self) -> bool:
+        """True once start() has been called and close() has not."""
+        return self._playwright is not None
+    
+    async def start(self) -> None:
+        """Start Playwright and launch the shared browser."""
+        if self.running:
+            return
+        
+        self._slots = asyncio.Semaphore(self.size)
+        self._lock = asyncio.Lock()
+        self._playwright = await async_playwright().start()
+        try:
+            await self._launch_browser()
+        except Exception:
+            await self._playwright.stop()
+            self._playwright = None
+            raise
+    
+    async def close(self) -> None:
+        """Close every pooled context, the browser and Playwright."""
+        if not self.running:
+            return
+        
+        for context in self._idle:
+            await self._discard_context(context)
+        self._idle.clear()
+        
+        for browser in [*self._draining, self.browser]:
+            if browser:
+                await self._close_browser(browser)
+        self._draining.clear()
+        self._leases.clear()
+        self.browser = None
+        
+        await self._playwright.stop()
+        self._playwright = None
+    
+    @asynccontextmanager
+    async def context(self, **context_options: Any) -> AsyncIterator[BrowserContext]:
+        """
+        Lease an isolated BrowserContext from the pool.
+        
+        Contexts created with the pool defaults are returned to the pool on
+        exit. Passing context_options (e.g. java_script_enabled=False) creates
+        a dedicated context that is closed on exit instead of being reused.
+        
+        A lease always finishes on the browser it started on, even if the
+        memory governor recycles the browser in the meantime.
+        
+        Args:
+            **context_options: Extra keyword arguments for browser.new_context()
+        """
+        if not self.running:
+            raise RuntimeError("BrowserPool is not started")
+        
+        async with self._slots:
+            context = await self._acquire(context_options)
+            browser = context.browser
+            self._leased += 1
+            self._leases[browser] = self._leases.get(browser, 0) + 1
+            try:
+                yield context
+            finally:
+                self._leased -= 1
+                self._leases[browser] = self._leases.get(browser, 1) - 1
+                if self._leases[browser] <= 0 and browser is not self.browser and browser not in self._draining:
+                    # Last lease on a browser that died and was replaced
+                    del self._leases[browser]
+                if context_options:
+                    await self._discard_context(context)
+                else:
+                    await self._release(context)
+                await self._close_drained()
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Return pool health, relaunching the browser if it has died."""
+        if not self.running:
+            return {"status": "stopped"}
+        
+        async with self._lock:
+            await self._ensure_browser()
+        
+        return {
+            "status": "healthy" if self.browser and self.browser.is_connected() else "unhealthy",
+            "size": self.size,
+            "leased": self._leased,
+            "idle": len(self._idle),
+            "draining": len(self._draining),
+            "pages_served": self._pages_served,
+            "browser_pid": self._browser_pid,
+            "rss_mb": self._rss_mb,
+            "max_pages": self.max_pages,
+            "max_rss_mb": self.max_rss_mb,
+            **self.stats,
+            "recycle_events": self.recycle_events[-10:]
+        }
+    
+    async def _acquire(self, context_options: Dict[str, Any]) -> BrowserContext:
+        """Return a healthy idle context or create a new one."""
+        async with self._lock:
+            await self._ensure_browser()
+            await self._govern()
+            
+            if not context_options:
+                while self._idle:
+                    context = self._idle.pop()
+                    if context.browser is self.browser:
+                        self.stats["contexts_reused"] += 1
+                        return context
+                    await self._discard_context(context)
+            
+            options = {"user_agent": self.user_agent, **context_options}
+            context = await self.browser.new_context(**options)
+            context.on("page", self._on_page)
+            self.stats["contexts_created"] += 1
+            return context
+    
+    async def _release(self, context: BrowserContext) -> None:
+        """Wipe a context and return it to the idle list."""
+        try:
+            await self._clear_storage(context)
+            for page in list(context.pages):
+                await page.close()
+            await context.clear_cookies()
+            await context.unroute("**/*")
+        except Exception:
+            await self._discard_context(context)
+            return
+        
+        if self.browser and context.browser is self.browser and len(self._idle) < self.size:
+            self._idle.append(context)
+        else:
+            await self._discard_context(context)
+    
+    async def _clear_storage(self, context: BrowserContext) -> None:
+        """
+        Clear every storage type of the origins the lease's pages visited.
+        
+        Cookies and closed pages do not cover localStorage, IndexedDB or
+        registered service workers, which would otherwise carry over to the
+        next candidate's lease. Storage.clearDataForOrigin needs a page
+        target, so one is opened if the scraper closed its own.
+        """
+        origins = self._origins.pop(context, set())
+        if not origins:
+            return
+        
+        self._wiping.add(context)
+        try:
+            page = context.pages[0] if context.pages else await context.new_page()
+            session = await context.new_cdp_session(page)
+            try:
+                for origin in sorted(origins):
+                    await session.send("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            finally:
+                await session.detach()
+        finally:
+            self._wiping.discard(context)
+    
+    async def _discard_context(self, context: BrowserContext) -> None:
+        """Close a context, ignoring errors from an already-dead browser."""
+        self._origins.pop(context, None)
+        self.stats["contexts_discarded"] += 1
+        try:
+            await context.close()
+        except Exception:
+            pass
+    
+    async def _ensure_browser(self) -> None:
+        """Relaunch the browser if it is missing or disconnected."""
+        if self.browser and self.browser.is_connected():
+            return
+        
+        if self.browser:
+            print("⚠️ Pooled browser disconnected, relaunching...")
+            # Leases still in flight on the dead browser drop its entry on release
+            if not self._leases.get(self.browser):
+                self._leases.pop(self.browser, None)
+        self._idle.clear()
+        await self._launch_browser()
+    
+    def _on_page(self, page: Page) -> None:
+        """
+        Count pages opened on the current browser and track the origins they
+        navigate to (context "page" event).
+        """
+        context = page.context
+        if context in self._wiping:
+            return
+        if context.browser is self.browser:
+            self._pages_served += 1
+        page.on("framenavigated", lambda frame: self._on_navigation(context, frame.url))
+    
+    def _on_navigation(self, context: BrowserContext, url: str) -> None:
+        """Remember the origin of a frame navigation for the release wipe."""
+        parts = urlsplit(url)
+        if parts.scheme in ("http", "https") and parts.netloc:
+            self._origins.setdefault(context, set()).add(f"{parts.scheme}://{parts.netloc}")
+    
+    def _measure_rss(self) -> Optional[float]:
+        """RSS of the current browser in MB, re-measured at most every memory_check_interval."""
+        if self._browser_pid is None:
+            return None
+        
+        now = time.monotonic()
+        if now - self._rss_checked_at >= self.memory_check_interval:
+            self._rss_mb = chromium_rss_mb(self._browser_pid)
+            self._rss_checked_at = now
+        return self._rss_mb
+    
+    async def _govern(self) -> None:
+        """Recycle the browser if it crossed the page-count or RSS threshold."""
+        # One recycle at a time: wait for the previous browser to drain
+        if self._draining:
+            return
+        
+        reason = None
+        if self.max_pages and self._pages_served >= self.max_pages:
+            reason = "pages"
+        elif self.max_rss_mb and self._pages_served:
+            # A browser that has served nothing yet has nothing to reclaim
+            rss_mb = self._measure_rss()
+            if rss_mb is not None and rss_mb >= self.max_rss_mb:
+                reason = "rss"
+        
+        if reason:
+            await self._recycle(reason)
+    
+    async def _recycle(self, reason: str) -> None:
+        """Launch a fresh browser and drain the current one."""
+        event = {
+            "reason": reason,
+            "pages_served": self._pages_served,
+            "rss_mb": self._rss_mb,
+            "in_flight": self._leases.get(self.browser, 0),
+            "at": datetime.utcnow().isoformat()
+        }
+        print(
+            f"♻️ Recycling pooled browser ({reason}): {event['pages_served']} pages served, "
+            f"{event['rss_mb']} MB RSS, {event['in_flight']} scrapes draining"
+        )
+        
+        for context in self._idle:
+            await self._discard_context(context)
+        self._idle.clear()
+        
+        self._draining.append(self.browser)
+        await self._launch_browser()
+        
+        self.stats["browser_recycles"] += 1
+        self.recycle_events.append(event)
+        del self.recycle_events[:-50]
+        
+        await self._close_drained()
+    
+    async def _close_drained(self) -> None:
+        """Close drained browsers whose last lease has been released."""
+        for browser in list(self._draining):
+            if self._leases.get(browser, 0) > 0:
+                continue
+            self._draining.remove(browser)
+            self._leases.pop(browser, None)
+            await self._close_browser(browser)
+    
+    async def _close_browser(self, browser: Browser) -> None:
+        """Close a browser, ignoring errors from an already-dead process."""
+        try:
+            await browser.close()
+        except Exception as e:
+            print(f"Warning: Error closing pooled browser: {e}")
+    
+    async def _launch_browser(self) -> None:
+        """Launch a fresh Chromium instance."""
+        self.browser, self._browser_pid, self._driver_pid = await launch_chromium(
+            self._playwright,
+            self._driver_pid,
+            headless=self.headless,
+            slow_mo=self.slow_mo
+        )
+        if self._browser_pid is None and self.max_rss_mb:
+            print("⚠️ Could not find the pooled browser's process, its RSS is not governed")
+        self._pages_served = 0
+        self._rss_mb = None
+        self._rss_checked_at = 0.0
+        self.stats["browser_launches"] += 1
+
+
+# Singleton instance
+_browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get the process-wide browser pool instance."""
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool(
+            size=settings.browser_pool_size,
+            headless=settings.browser_headless,
+            max_pages=settings.browser_max_pages,
+            max_rss_mb=settings.browser_max_rss_mb
+        )
+    return _browser_pool
@@ -0,0 +1,229 @@
+"""
+Circuit Breaker - Fail-fast scraping of blocked or degraded targets
+
+When GitHub serves its abuse page or LinkedIn shows the auth wall, every
+queued candidate would otherwise still run the full scrape and wait out its
+timeouts. The scraper service keeps one CircuitBreaker per source:
+
+1. Closed: scrapes run; each blocked, timeout or 5xx outcome adds to a
+   consecutive-failure count, any other outcome resets it
+2. Open: after failure_threshold consecutive failures, scrapes are refused
+   at once and the caller gets the source's fallback
+3. Half-open: once probe_interval has passed, the next scrape goes through
+   as a probe (others keep failing fast); success closes the circuit, a
+   failure re-opens it for another interval
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import itertools
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import httpx
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from .rate_limiter import HostRateLimiter
+
+
+# Outcomes that count towards opening the circuit
+FAILURE_OUTCOMES = ("blocked", "timeout", "server_error")
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class ScrapeTargetError(Exception):
+    """A scrape failed because its target blocked it, timed out or returned a 5xx."""
+    
+    def __init__(self, outcome: str, message: str):
+        # Both in args, so the error survives pickling back from a scraper worker
+        super().__init__(outcome, message)
+        self.outcome = outcome
+        self.message = message
+    
+    def __str__(self) -> str:
+        return f"{self.outcome}: {self.message}"
+
+
+class CircuitOpenError(Exception):
+    """A scrape was refused because its source's circuit is open."""
+
+
+def classify_error(error: BaseException) -> Optional[str]:
+    """
+    Map a scrape exception to a failure outcome.
+    
+    Returns:
+        "blocked", "timeout" or "server_error", or None if the error says
+        nothing about the target's health (e.g. profile not found)
+    """
+    if isinstance(error, ScrapeTargetError):
+        return error.outcome
+    if isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException, PlaywrightTimeout)):
+        return "timeout"
+    if isinstance(error, httpx.HTTPStatusError):
+        response = error.response
+        if response.status_code >= 500:
+            return "server_error"
+        if response.status_code == 403 or HostRateLimiter.is_throttled(response.status_code, response.headers):
+            return "blocked"
+    return None
+
+
+def classify_result(result: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Map a scrape result to a failure outcome.
+    
+    A LinkedIn fallback response carries the failure "reason"; a GitHub
+    result whose profile page never loaded within the deadline is a timeout.
+    
+    Returns:
+        "blocked", "timeout" or "server_error", or None for a usable result
+    """
+    if not result:
+        return None
+    if result.get("status") == "scraping_failed":
+        reason = result.get("reason")
+        return reason if reason in FAILURE_OUTCOMES else None
+    if "profile" in (result.get("deadline") or {}).get("timed_out", []):
+        return "timeout"
+    return None
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one scrape source.
+    
+    Usage:
+        breaker = CircuitBreaker("github", failure_threshold=5, probe_interval=120)
+        call = breaker.allow()
+        if call is None:
+            return fallback()
+        result = await scrape()
+        breaker.record(call, classify_result(result))
+    """
+    
+    def __init__(self, name: str, failure_threshold: int = 5, probe_interval: float = 120):
+        """
+        Initialize a closed circuit.
+        
+        Args:
+            name: Source the breaker guards (for reports and log lines)
+            failure_threshold: Consecutive failures that open the circuit
+            probe_interval: Seconds the circuit stays open before a probe
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.probe_interval = probe_interval
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_failure: Optional[Dict[str, Any]] = None
+        # Token of the half-open probe in flight (None when no probe is out)
+        self._probe: Optional[int] = None
+        self._calls = itertools.count(1)
+        
+        self.stats = {
+            "successes": 0,
+            "failures": 0,
+            "short_circuited": 0,
+            "probes": 0,
+            "times_opened": 0
+        }
+    
+    def allow(self) -> Optional[int]:
+        """
+        Whether a scrape may run now.
+        
+        An open circuit that has waited probe_interval lets one scrape
+        through as the half-open probe.
+        
+        Returns:
+            A call token to pass to record() or release(), or None if the
+            scrape is refused
+        """
+        if self.state == STATE_OPEN and time.monotonic() - self.opened_at >= self.probe_interval:
+            self.state = STATE_HALF_OPEN
+        
+        if self.state == STATE_CLOSED:
+            return next(self._calls)
+        if self.state == STATE_HALF_OPEN and self._probe is None:
+            self._probe = next(self._calls)
+            self.stats["probes"] += 1
+            return self._probe
+        
+        self.stats["short_circuited"] += 1
+        return None
+    
+    def record(self, call: int, outcome: Optional[str], detail: str = "") -> None:
+        """
+        Record the outcome of an allowed scrape.
+        
+        Args:
+            call: Token allow() returned for the scrape
+            outcome: A FAILURE_OUTCOMES entry, or None for success
+            detail: Error message or URL for the report
+        """
+        # Only the probe itself frees the half-open slot; a late result of a
+        # scrape started before the circuit opened does not
+        self.release(call)
+        
+        if outcome not in FAILURE_OUTCOMES:
+            self.stats["successes"] += 1
+            self.consecutive_failures = 0
+            if self.state != STATE_CLOSED:
+                print(f"♻️ {self.name} scrapes recovered, closing the circuit")
+            self.state = STATE_CLOSED
+            self.opened_at = None
+            return
+        
+        self.stats["failures"] += 1
+        self.consecutive_failures += 1
+        self.last_failure = {
+            "outcome": outcome,
+            "detail": detail,
+            "at": datetime.utcnow().isoformat()
+        }
+        
+        if self.state == STATE_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != STATE_OPEN:
+                self.stats["times_opened"] += 1
+                print(
+                    f"⚠️ {self.name} scrapes failing ({outcome}, {self.consecutive_failures} in a row), "
+                    f"opening the circuit for {self.probe_interval:.0f}s"
+                )
+            self.state = STATE_OPEN
+            self.opened_at = time.monotonic()
+    
+    def release(self, call: int) -> None:
+        """End an allowed scrape that says nothing about the target (crash, cancellation)."""
+        if call == self._probe:
+            self._probe = None
+    
+    def reset(self) -> None:
+        """Close the circuit by hand (e.g. after refreshing LinkedIn cookies)."""
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._probe = None
+    
+    def retry_in(self) -> Optional[float]:
+        """Seconds until the next probe (None unless the circuit is open)."""
+        if self.state != STATE_OPEN:
+            return None
+        return max(0.0, round(self.opened_at + self.probe_interval - time.monotonic(), 1))
+    
+    def report(self) -> Dict[str, Any]:
+        """State, failure streak, last failure and counters."""
+        return {
+            **self.stats,
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "probe_interval_seconds": self.probe_interval,
+            "next_probe_in_seconds": self.retry_in(),
+            "last_failure": self.last_failure
+        }
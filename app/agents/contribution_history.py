@@ -0,0 +1,176 @@
+"""
+Contribution History - The Researcher Agent
+
+Multi-year contribution history, so a consistent long-time contributor can
+be told apart from an account that started last year. Each year's
+calendar is kept in compact form:
+
+    levels  bytearray, one uint8 per day of the year (GitHub's 0-4 level)
+    mask    int bitmask, bit i set when day i of the year was active
+
+That is under half a kilobyte per year. The summaries are computed with
+whole-array operations instead of per-day Python loops:
+- active days: popcount of the mask
+- longest streak: repeated mask &= mask >> 1 (one step per day of the run)
+- active weeks: the mask OR-folded over 7 days, sampled at week starts
+- lifetime streak: the yearly masks concatenated into one integer
+
+Author: Recruiter Copilot
+"""
+import base64
+import re
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+
+# bytes.translate table turning levels into "0"/"1" digits for int(..., 2)
+_ACTIVE_DIGITS = bytes([ord("0")] + [ord("1")] * 255)
+
+# Bit 0 of every 7-bit week in a (week-aligned) year mask
+_WEEK_STARTS = sum(1 << (7 * week) for week in range(54))
+
+
+def longest_run(mask: int) -> int:
+    """Length of the longest run of set bits in mask."""
+    run = 0
+    while mask:
+        mask &= mask >> 1
+        run += 1
+    return run
+
+
+class YearCalendar:
+    """One year of daily contribution levels, stored as a uint8 array plus a bitmask."""
+    
+    __slots__ = ("year", "levels", "mask", "total")
+    
+    def __init__(self, year: int, levels: bytearray, total: int):
+        """
+        Initialize the calendar.
+        
+        Args:
+            year: Calendar year
+            levels: One 0-4 level per day of the year
+            total: Contributions in the year
+        """
+        self.year = year
+        self.levels = levels
+        self.total = total
+        # Day 0 is the lowest bit, so the digit string is built last day first
+        self.mask = int(bytes(reversed(levels)).translate(_ACTIVE_DIGITS) or b"0", 2)
+    
+    @classmethod
+    def from_days(cls, year: int, days: Sequence[Sequence[Any]], total: Optional[int] = None) -> "YearCalendar":
+        """
+        Pack per-day (date, level, count) entries of one year.
+        
+        Cells outside the year (GitHub pads the first and last week) are
+        ignored. Without a total, the daily counts are summed.
+        """
+        start = date(year, 1, 1).toordinal()
+        levels = bytearray(date(year, 12, 31).toordinal() - start + 1)
+        counted = 0
+        
+        for day in days:
+            if not day or not day[0] or not day[0].startswith(f"{year}-"):
+                continue
+            level, count = int(day[1] or 0), day[2]
+            if count:
+                counted += count
+            # A count without a level still marks the day active
+            levels[date.fromisoformat(day[0]).toordinal() - start] = min(4, level or (1 if count else 0))
+        
+        return cls(year, levels, counted if total is None else total)
+    
+    @classmethod
+    def from_calendar(cls, year: int, raw: Dict[str, Any]) -> "YearCalendar":
+        """Pack parse_contribution_calendar output for one year."""
+        match = re.search(r"([\d,]+)\s+contributions?", raw.get("heading") or "")
+        total = int(match.group(1).replace(",", "")) if match else None
+        return cls.from_days(year, raw["days"], total)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "YearCalendar":
+        """Restore a calendar serialized by to_dict()."""
+        return cls(data["year"], bytearray(base64.b64decode(data["levels"])), data["contributions"])
+    
+    @property
+    def start(self) -> date:
+        """First day of the year."""
+        return date(self.year, 1, 1)
+    
+    def active_days(self) -> int:
+        """Days with at least one contribution."""
+        return self.mask.bit_count()
+    
+    def longest_streak(self) -> int:
+        """Longest run of consecutive active days within the year."""
+        return longest_run(self.mask)
+    
+    def active_weeks(self) -> int:
+        """Calendar weeks (Sunday to Saturday, as on GitHub) with any activity."""
+        # Align bit 0 to the Sunday on or before January 1st
+        aligned = self.mask << ((self.start.weekday() + 1) % 7)
+        folded = aligned
+        for shift in range(1, 7):
+            folded |= aligned >> shift
+        return (folded & _WEEK_STARTS).bit_count()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary plus the base64 uint8 levels (restorable with from_dict)."""
+        return {
+            "year": self.year,
+            "contributions": self.total,
+            "active_days": self.active_days(),
+            "active_weeks": self.active_weeks(),
+            "longest_streak": self.longest_streak(),
+            "levels": base64.b64encode(self.levels).decode("ascii")
+        }
+
+
+def summarize_history(calendars: List[YearCalendar], trim_empty: bool = False) -> Dict[str, Any]:
+    """
+    Summarize a contribution history.
+    
+    Args:
+        calendars: Year calendars, in any order; missing years count as empty
+        trim_empty: Drop empty years before the first active one (used when
+            the account's years were guessed rather than read from the profile)
+    
+    Returns:
+        Dictionary containing:
+        - years: Per-year to_dict() entries, oldest first
+        - first_year: Oldest year with any contribution
+        - years_active: Years with any contribution
+        - lifetime_contributions: Sum of the yearly totals
+        - lifetime_longest_streak: Longest streak, across year boundaries
+        - mean_active_weeks: Active weeks per year since first_year
+        - packed_bytes: Size of the packed daily arrays
+    """
+    calendars = sorted(calendars, key=lambda calendar: calendar.year)
+    active = [calendar for calendar in calendars if calendar.mask or calendar.total]
+    if trim_empty and active:
+        calendars = [calendar for calendar in calendars if calendar.year >= active[0].year]
+    
+    lifetime_mask = 0
+    if calendars:
+        first_day = calendars[0].start.toordinal()
+        for calendar in calendars:
+            lifetime_mask |= calendar.mask << (calendar.start.toordinal() - first_day)
+    
+    # Years with no calendar (gaps in contributionYears, failed fetches) are empty
+    since_first = [calendar for calendar in calendars if active and calendar.year >= active[0].year]
+    span_years = calendars[-1].year - active[0].year + 1 if active else 0
+    
+    return {
+        "years": [calendar.to_dict() for calendar in calendars],
+        "first_year": active[0].year if active else None,
+        "years_active": len(active),
+        "lifetime_contributions": sum(calendar.total for calendar in calendars),
+        "lifetime_longest_streak": longest_run(lifetime_mask),
+        "mean_active_weeks": (
+            round(sum(calendar.active_weeks() for calendar in since_first) / span_years, 1)
+            if span_years else 0.0
+        ),
+        "packed_bytes": sum(len(calendar.levels) + (calendar.mask.bit_length() + 7) // 8 for calendar in calendars)
+    }
@@ -0,0 +1,110 @@
+"""
+Contribution Calendar Statistics - The Researcher Agent
+
+Pure-Python summaries of a GitHub contribution calendar. The scrapers pull
+the whole calendar in one go as a compact per-day array:
+
+    [["2025-01-01", 2, 5], ["2025-01-02", 0, 0], ...]   # date, level, count
+
+where level is GitHub's 0-4 intensity bucket and count is the number of
+contributions that day (None when the page only exposes the level).
+Everything the Scorer needs is then computed here without touching the
+browser again.
+
+Author: Recruiter Copilot
+"""
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def summarize_calendar(days: Sequence[Sequence[Any]], today: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Compute streak, monthly, weekday and gap statistics for a calendar.
+    
+    Days without an exact count are weighted as one contribution when they
+    are active (level > 0), so the statistics degrade gracefully on pages
+    that only expose intensity levels.
+    
+    Args:
+        days: Per-day entries of (date "YYYY-MM-DD", level, count or None)
+        today: Reference date for the current streak (defaults to today)
+    
+    Returns:
+        Dictionary containing:
+        - contribution_streak: Consecutive active days up to today
+        - longest_streak: Longest run of active days in the calendar
+        - longest_gap_days: Longest run of inactive days in the calendar
+        - active_days: Number of days with at least one contribution
+        - contributions_by_month: [{"month": "YYYY-MM", "contributions", "active_days"}]
+        - weekday_distribution: Contributions per weekday name
+        - calendar_total: Sum of daily contributions
+    """
+    today = today or date.today()
+    parsed = sorted(
+        (date.fromisoformat(day[0]), int(day[1] or 0), day[2])
+        for day in days
+        if day and day[0]
+    )
+    # Future cells (GitHub pads the last week) carry no information
+    parsed = [day for day in parsed if day[0] <= today]
+    
+    stats = {
+        "contribution_streak": 0,
+        "longest_streak": 0,
+        "longest_gap_days": 0,
+        "active_days": 0,
+        "contributions_by_month": [],
+        "weekday_distribution": {weekday: 0 for weekday in WEEKDAYS},
+        "calendar_total": 0
+    }
+    
+    months: Dict[str, Dict[str, Any]] = {}
+    streak = gap = 0
+    
+    for day, level, count in parsed:
+        active = level > 0 or bool(count)
+        weight = count if count is not None else (1 if active else 0)
+        
+        month = months.setdefault(day.strftime("%Y-%m"), {
+            "month": day.strftime("%Y-%m"),
+            "contributions": 0,
+            "active_days": 0
+        })
+        month["contributions"] += weight
+        stats["weekday_distribution"][WEEKDAYS[day.weekday()]] += weight
+        stats["calendar_total"] += weight
+        
+        if active:
+            month["active_days"] += 1
+            stats["active_days"] += 1
+            streak += 1
+            gap = 0
+        else:
+            gap += 1
+            streak = 0
+        
+        stats["longest_streak"] = max(stats["longest_streak"], streak)
+        stats["longest_gap_days"] = max(stats["longest_gap_days"], gap)
+    
+    stats["contributions_by_month"] = list(months.values())
+    stats["contribution_streak"] = _current_streak(parsed, today)
+    
+    return stats
+
+
+def _current_streak(parsed: List[tuple], today: date) -> int:
+    """Count active days backwards from today (an empty today does not break it)."""
+    streak = 0
+    
+    for index, (day, level, count) in enumerate(reversed(parsed)):
+        active = level > 0 or bool(count)
+        if not active:
+            if index == 0 and day == today:
+                continue
+            break
+        streak += 1
+    
+    return streak
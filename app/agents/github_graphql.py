@@ -0,0 +1,428 @@
+"""
+GitHub GraphQL Client - The Researcher Agent
+
+Fetches everything the GitHub scraper needs for a profile (profile fields,
+pinned repositories with their README, per-repository language sizes and
+the contribution calendar) in a single GraphQL request. Several users are
+batched into one request with aliases:
+
+    query($u0: String!, $u1: String!) {
+        u0: user(login: $u0) { ...UserFields }
+        u1: user(login: $u1) { ...UserFields }
+    }
+
+Owned repositories come 100 per page: users with more are paged through
+with fetch_repositories, following the connection's endCursor.
+
+Pinned repositories come with their activity (last commit, commit count,
+language sizes); other repositories can be sampled in one aliased request
+with fetch_repo_activity.
+
+Earlier years of the contribution calendar are fetched with one more
+request per user, one aliased contributionsCollection per year (see
+fetch_contribution_history).
+
+The GraphQL API requires a token (settings.github_token).
+
+Author: Recruiter Copilot
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import httpx
+
+from .http_client import get_http_client
+from ..config import settings
+
+
+USER_FIELDS_FRAGMENT = """
+fragment UserFields on User {
+    login
+    name
+    bio
+    location
+    company
+    websiteUrl
+    followers { totalCount }
+    following { totalCount }
+    repositories(first: 100, privacy: PUBLIC, ownerAffiliations: OWNER, orderBy: {field: PUSHED_AT, direction: DESC}) {
+        ...RepositoryPage
+    }
+    pinnedItems(first: 6, types: REPOSITORY) {
+        nodes {
+            ... on Repository {
+                name
+                description
+                stargazerCount
+                forkCount
+                primaryLanguage { name }
+                ...RepoActivity
+                readme: object(expression: "HEAD:README.md") {
+                    ... on Blob { text }
+                }
+                readmeLower: object(expression: "HEAD:readme.md") {
+                    ... on Blob { text }
+                }
+            }
+        }
+    }
+    contributionsCollection {
+        contributionYears
+        contributionCalendar {
+            totalContributions
+            weeks {
+                contributionDays { date contributionCount contributionLevel }
+            }
+        }
+    }
+}
+"""
+
+REPOSITORY_PAGE_FRAGMENT = """
+fragment RepositoryPage on RepositoryConnection {
+    totalCount
+    pageInfo { hasNextPage endCursor }
+    nodes {
+        name
+        isFork
+        isArchived
+        primaryLanguage { name }
+        languages(first: 10, orderBy: {field: SIZE, direction: DESC}) {
+            edges { size node { name } }
+        }
+    }
+}
+"""
+
+REPOSITORIES_QUERY = """
+query($login: String!, $after: String!) {
+    user(login: $login) {
+        repositories(first: 100, after: $after, privacy: PUBLIC, ownerAffiliations: OWNER, orderBy: {field: PUSHED_AT, direction: DESC}) {
+            ...RepositoryPage
+        }
+    }
+}
+""" + REPOSITORY_PAGE_FRAGMENT
+
+REPO_ACTIVITY_FRAGMENT = """
+fragment RepoActivity on Repository {
+    nameWithOwner
+    pushedAt
+    defaultBranchRef {
+        target {
+            ... on Commit { committedDate history { totalCount } }
+        }
+    }
+    languages(first: 10, orderBy: {field: SIZE, direction: DESC}) {
+        edges { size node { name } }
+    }
+}
+"""
+
+CALENDAR_FIELDS = """
+contributionCalendar {
+    totalContributions
+    weeks {
+        contributionDays { date contributionCount contributionLevel }
+    }
+}
+"""
+
+# GraphQL ContributionLevel enum -> the 0-4 data-level of the HTML calendar
+CONTRIBUTION_LEVELS = {
+    "NONE": 0,
+    "FIRST_QUARTILE": 1,
+    "SECOND_QUARTILE": 2,
+    "THIRD_QUARTILE": 3,
+    "FOURTH_QUARTILE": 4
+}
+
+
+def build_batch_query(usernames: Sequence[str]) -> Tuple[str, Dict[str, str]]:
+    """
+    Build one aliased query fetching several users.
+    
+    Args:
+        usernames: GitHub logins, aliased u0, u1, ... in order
+    
+    Returns:
+        (query, variables) ready to POST
+    """
+    aliases = [f"u{index}" for index in range(len(usernames))]
+    
+    params = ", ".join(f"${alias}: String!" for alias in aliases)
+    fields = "\n".join(
+        f"    {alias}: user(login: ${alias}) {{ ...UserFields }}"
+        for alias in aliases
+    )
+    query = f"query({params}) {{\n{fields}\n}}\n{USER_FIELDS_FRAGMENT}\n{REPOSITORY_PAGE_FRAGMENT}\n{REPO_ACTIVITY_FRAGMENT}"
+    
+    return query, dict(zip(aliases, usernames))
+
+
+def build_repo_activity_query(repos: Sequence[Tuple[str, str]]) -> Tuple[str, Dict[str, str]]:
+    """
+    Build one aliased query fetching the activity of several repositories.
+    
+    Args:
+        repos: (owner, name) pairs, aliased r0, r1, ... in order
+    
+    Returns:
+        (query, variables) ready to POST
+    """
+    params = ", ".join(f"$o{index}: String!, $n{index}: String!" for index in range(len(repos)))
+    fields = "\n".join(
+        f"    r{index}: repository(owner: $o{index}, name: $n{index}) {{ ...RepoActivity }}"
+        for index in range(len(repos))
+    )
+    variables = {}
+    for index, (owner, name) in enumerate(repos):
+        variables[f"o{index}"] = owner
+        variables[f"n{index}"] = name
+    
+    return f"query({params}) {{\n{fields}\n}}\n{REPO_ACTIVITY_FRAGMENT}", variables
+
+
+def build_history_query(years: Sequence[int]) -> str:
+    """
+    Build a query fetching one user's contribution calendar for several years.
+    
+    Args:
+        years: Calendar years, aliased y<year>
+    
+    Returns:
+        Query taking a $login variable
+    """
+    collections = "\n".join(
+        f'        y{year}: contributionsCollection(from: "{year}-01-01T00:00:00Z", to: "{year}-12-31T23:59:59Z") {{'
+        f"{CALENDAR_FIELDS}}}"
+        for year in years
+    )
+    return f"query($login: String!) {{\n    user(login: $login) {{\n{collections}\n    }}\n}}"
+
+
+async def fetch_users(
+    usernames: Sequence[str],
+    token: Optional[str] = None,
+    url: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Fetch several GitHub users in one GraphQL request.
+    
+    Args:
+        usernames: GitHub logins
+        token: API token (defaults to settings.github_token)
+        url: GraphQL endpoint (defaults to settings.github_graphql_url)
+        client: HTTP client to use (defaults to the shared pooled client)
+    
+    Returns:
+        Mapping of username to its user node (None if the user does not exist)
+    
+    Raises:
+        RuntimeError: If the request failed, or a user came back empty for
+            any reason but NOT_FOUND
+    """
+    token = token or settings.github_token
+    if not token:
+        raise ValueError("The GitHub GraphQL backend requires GITHUB_TOKEN")
+    
+    query, variables = build_batch_query(usernames)
+    
+    response = await (client or get_http_client()).post(
+        url or settings.github_graphql_url,
+        json={"query": query, "variables": variables},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    response.raise_for_status()
+    payload = response.json()
+    
+    data = payload.get("data") or {}
+    errors = payload.get("errors") or []
+    
+    # A response with errors and no data at all is a failed request
+    failures = [error for error in errors if error.get("type") != "NOT_FOUND"]
+    if failures and not data:
+        raise RuntimeError(f"GitHub GraphQL error: {failures[0].get('message')}")
+    
+    # Unknown logins come back as null with a NOT_FOUND error on their alias;
+    # a null alias for any other reason (rate limits, timeouts) is a failure,
+    # not a missing user
+    not_found = {
+        error["path"][0] for error in errors
+        if error.get("type") == "NOT_FOUND" and error.get("path")
+    }
+    users = {}
+    for alias, username in variables.items():
+        user = data.get(alias)
+        if user is None and alias not in not_found:
+            error = next(
+                (error for error in errors if (error.get("path") or [None])[0] == alias),
+                failures[0] if failures else {}
+            )
+            raise RuntimeError(f"GitHub GraphQL error for {username}: {error.get('message') or 'no data'}")
+        users[username] = user
+    return users
+
+
+async def fetch_repositories(
+    username: str,
+    after: str,
+    max_pages: int,
+    token: Optional[str] = None,
+    url: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Page through a user's owned repositories after the first page.
+    
+    Args:
+        username: GitHub login
+        after: endCursor of the page already fetched
+        max_pages: Cap on further pages (100 repositories each)
+        token: API token (defaults to settings.github_token)
+        url: GraphQL endpoint (defaults to settings.github_graphql_url)
+        client: HTTP client to use (defaults to the shared pooled client)
+    
+    Returns:
+        (repository nodes, truncated), truncated being True if pages were
+        left unread after max_pages
+    """
+    token = token or settings.github_token
+    if not token:
+        raise ValueError("The GitHub GraphQL backend requires GITHUB_TOKEN")
+    
+    nodes: List[Dict[str, Any]] = []
+    for _ in range(max_pages):
+        response = await (client or get_http_client()).post(
+            url or settings.github_graphql_url,
+            json={"query": REPOSITORIES_QUERY, "variables": {"login": username, "after": after}},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        payload = response.json()
+        
+        user = (payload.get("data") or {}).get("user")
+        if user is None:
+            errors = payload.get("errors") or [{}]
+            raise RuntimeError(f"GitHub GraphQL error: {errors[0].get('message')}")
+        
+        connection = user["repositories"]
+        nodes.extend(connection["nodes"])
+        if not connection["pageInfo"]["hasNextPage"]:
+            return nodes, False
+        after = connection["pageInfo"]["endCursor"]
+    
+    return nodes, True
+
+
+async def fetch_contribution_history(
+    username: str,
+    years: Sequence[int],
+    token: Optional[str] = None,
+    url: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Fetch a user's contribution calendars for several years in one request.
+    
+    Args:
+        username: GitHub login
+        years: Calendar years to fetch
+        token: API token (defaults to settings.github_token)
+        url: GraphQL endpoint (defaults to settings.github_graphql_url)
+        client: HTTP client to use (defaults to the shared pooled client)
+    
+    Returns:
+        Mapping of year to its contributionCalendar node
+    """
+    token = token or settings.github_token
+    if not token:
+        raise ValueError("The GitHub GraphQL backend requires GITHUB_TOKEN")
+    
+    response = await (client or get_http_client()).post(
+        url or settings.github_graphql_url,
+        json={"query": build_history_query(years), "variables": {"login": username}},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    response.raise_for_status()
+    payload = response.json()
+    
+    user = (payload.get("data") or {}).get("user")
+    if user is None:
+        errors = payload.get("errors") or [{}]
+        raise RuntimeError(f"GitHub GraphQL error: {errors[0].get('message')}")
+    
+    return {
+        year: user[f"y{year}"]["contributionCalendar"]
+        for year in years
+        if user.get(f"y{year}")
+    }
+
+
+async def fetch_repo_activity(
+    repos: Sequence[Tuple[str, str]],
+    token: Optional[str] = None,
+    url: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+    """
+    Fetch the RepoActivity fields of several repositories in one request.
+    
+    Args:
+        repos: (owner, name) pairs
+        token: API token (defaults to settings.github_token)
+        url: GraphQL endpoint (defaults to settings.github_graphql_url)
+        client: HTTP client to use (defaults to the shared pooled client)
+    
+    Returns:
+        Mapping of (owner, name) to its repository node (None if not found)
+    """
+    token = token or settings.github_token
+    if not token:
+        raise ValueError("The GitHub GraphQL API requires GITHUB_TOKEN")
+    
+    query, variables = build_repo_activity_query(repos)
+    
+    response = await (client or get_http_client()).post(
+        url or settings.github_graphql_url,
+        json={"query": query, "variables": variables},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    response.raise_for_status()
+    payload = response.json()
+    
+    data = payload.get("data") or {}
+    errors = [
+        error for error in payload.get("errors") or []
+        if error.get("type") != "NOT_FOUND"
+    ]
+    if errors and not data:
+        raise RuntimeError(f"GitHub GraphQL error: {errors[0].get('message')}")
+    
+    return {repo: data.get(f"r{index}") for index, repo in enumerate(repos)}
+
+
+def calendar_days(calendar: Dict[str, Any]) -> List[List[Any]]:
+    """Flatten a contributionCalendar node into (date, level, count) entries."""
+    return [
+        [day["date"], CONTRIBUTION_LEVELS.get(day["contributionLevel"], 0), day["contributionCount"]]
+        for week in calendar["weeks"]
+        for day in week["contributionDays"]
+    ]
+
+
+def readme_text(repo: Dict[str, Any]) -> Optional[str]:
+    """README source of a pinned repository node (None if it has none)."""
+    blob = repo.get("readme") or repo.get("readmeLower")
+    return blob.get("text") if blob else None
+
+
+def language_bytes(repositories: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Sum language sizes (bytes of code) across repositories."""
+    totals: Dict[str, int] = {}
+    
+    for repo in repositories:
+        for edge in repo["languages"]["edges"]:
+            name = edge["node"]["name"]
+            totals[name] = totals.get(name, 0) + edge["size"]
+    
+    return totals
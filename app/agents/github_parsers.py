@@ -0,0 +1,104 @@
+"""
+GitHub HTML Parsers - The Researcher Agent
+
+The extractors of every HTML-based GitHubScraper backend. GitHub profile,
+repositories-tab and contribution-graph pages are server-rendered, so they
+are parsed with selectolax (lexbor backend) from the HTTP response, or from
+one page.content() snapshot of the rendered page with Playwright.
+
+Both backends therefore extract exactly the same raw structures, and
+GitHubScraper post-processes them with the same code.
+
+Author: Recruiter Copilot
+"""
+import re
+from typing import Any, Dict, List
+from selectolax.lexbor import LexborHTMLParser
+
+from .html_parsing import node_text, select_text
+
+
+def parse_profile_overview(html: str) -> Dict[str, Any]:
+    """Parse the profile sidebar."""
+    tree = LexborHTMLParser(html)
+    return {
+        "name": select_text(tree, "span.p-name"),
+        "bio": select_text(tree, "div.p-note"),
+        "location": select_text(tree, "li[itemprop='homeLocation'] span"),
+        "company": select_text(tree, "li[itemprop='worksFor'] span"),
+        "nav_items": [node_text(node) for node in tree.css("a.UnderlineNav-item")],
+        "followers": select_text(tree, "a[href$='?tab=followers'] span"),
+        "following": select_text(tree, "a[href$='?tab=following'] span"),
+        "years": [
+            int(text) for text in (node_text(node) for node in tree.css("a.js-year-link"))
+            if text and text.isdigit()
+        ]
+    }
+
+
+def parse_pinned_repos(html: str) -> List[Dict[str, Any]]:
+    """Parse pinned repository cards."""
+    tree = LexborHTMLParser(html)
+    return [
+        {
+            "name": select_text(item, "span.repo"),
+            "description": select_text(item, "p.pinned-item-desc"),
+            "language": select_text(item, "[itemprop='programmingLanguage']"),
+            "stars": select_text(item, "a[href*='/stargazers']"),
+            "forks": select_text(item, "a[href*='/forks']")
+        }
+        for item in tree.css("div.pinned-item-list-item-content")
+    ]
+
+
+def parse_contribution_calendar(html: str) -> Dict[str, Any]:
+    """Parse the contribution graph."""
+    tree = LexborHTMLParser(html)
+    
+    tooltips = {
+        tip.attributes.get("for"): node_text(tip)
+        for tip in tree.css("tool-tip[for]")
+    }
+    
+    days = []
+    for cell in tree.css("td.ContributionCalendar-day[data-date]"):
+        attrs = cell.attributes
+        count = None
+        if attrs.get("data-count") is not None:
+            count = int(attrs["data-count"])
+        else:
+            tip = tooltips.get(attrs.get("id")) or node_text(cell) or ""
+            match = re.match(r"([\d,]+) contributions?", tip)
+            if match:
+                count = int(match.group(1).replace(",", ""))
+            elif tip.startswith("No contributions"):
+                count = 0
+        days.append([attrs.get("data-date"), int(attrs.get("data-level") or 0), count])
+    
+    return {"heading": select_text(tree, "h2.f4.text-normal.mb-2"), "days": days}
+
+
+def parse_repository_list(html: str) -> Dict[str, Any]:
+    """Parse one repositories-tab page."""
+    tree = LexborHTMLParser(html)
+    
+    current = tree.css_first(".pagination em.current[data-total-pages]")
+    if current is not None:
+        total_pages = int(current.attributes["data-total-pages"])
+    else:
+        page_links = [node_text(link) for link in tree.css(".pagination a")]
+        total_pages = max([1] + [int(text) for text in page_links if text.isdigit()])
+    
+    repos = []
+    for item in tree.css("li[itemprop='owns']"):
+        classes = (item.attributes.get("class") or "").split()
+        repos.append({
+            "language": select_text(item, "[itemprop='programmingLanguage']"),
+            "fork": "fork" in classes or "Forked from" in item.text(),
+            "archived": "archived" in classes or any(
+                "archive" in node_text(label).lower()
+                for label in item.css("span.Label")
+            )
+        })
+    
+    return {"total_pages": total_pages, "repos": repos}
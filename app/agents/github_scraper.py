@@ -1,7 +1,8 @@
 """
 GitHub Scraper - The Researcher Agent
 
-This module uses Playwright to navigate to a GitHub profile and extract:
+This module navigates to a GitHub profile (with Playwright, or with plain
+HTTP requests for the browserless backend) and extracts:
 1. Commit history from the last 12 months (contribution graph)
 2. Top 3 most used programming languages
 3. README complexity analysis from pinned/popular repositories
@@ -10,37 +11,296 @@ This module uses Playwright to navigate to a GitHub profile and extract:
 Author: Recruiter Copilot
 """
 import asyncio
+import hashlib
+import json
 import re
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Any, Tuple
+from urllib.parse import urlsplit
+import httpx
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Response, TimeoutError as PlaywrightTimeout
+
+from .browser_pool import BrowserPool, DEFAULT_USER_AGENT, get_browser_pool
+from .contribution_history import YearCalendar, summarize_history
+from .contributions import summarize_calendar
+from .github_parsers import (
+    parse_contribution_calendar,
+    parse_pinned_repos,
+    parse_profile_overview,
+    parse_repository_list
+)
+from .github_graphql import (
+    calendar_days,
+    fetch_contribution_history,
+    fetch_repositories,
+    fetch_users,
+    language_bytes,
+    readme_text
+)
+from .har_archive import HarRecorder, HarReplayer
+from .http_client import get_http_client
+from .rate_limiter import get_rate_limiter
+from .readiness import goto_ready, wait_ready
+from .readme_analyzer import markdown_features
+from .repo_activity import RepoActivitySampler, activity_from_graphql, with_recency
+from .resource_blocker import ResourceBlocker
+from .scrape_cache import ScrapeCache, get_scrape_cache
+from .scrape_deadline import ScrapeDeadline
+from .scrape_timings import ScrapeTimings, measure
+from .single_flight import get_single_flight
+from ..config import settings
 
 
 class GitHubScraper:
     """
-    Playwright-based GitHub profile scraper.
+    GitHub profile scraper with three interchangeable backends.
+    
+    - "playwright": renders the pages in a pooled Chromium context
+    - "http": fetches the server-rendered pages with the pooled httpx client
+      and parses them with selectolax, without a browser
+    - "graphql": fetches everything in one GitHub GraphQL request (needs a
+      token); several profiles can share a request via scrape_graphql_batch()
     
     Extracts comprehensive developer activity data from public GitHub profiles.
+    All backends return the same result dictionary.
     """
     
-    def __init__(self, headless: bool = True, slow_mo: int = 0):
+    BACKENDS = ("playwright", "http", "graphql")
+    
+    # First-party hosts allowed through the resource blocker
+    ALLOWED_HOSTS = ("github.com", "githubassets.com")
+    
+    # Page URL templates, overridable so a static mirror can stand in for GitHub
+    PAGE_URLS = {
+        "profile": "{base}/{username}",
+        "contributions": "{base}/users/{username}/contributions",
+        "contributions_year": "{base}/users/{username}/contributions?from={year}-01-01&to={year}-12-31",
+        "repositories": "{base}/{username}?tab=repositories&page={page}",
+        "readme": "{raw}/{username}/{repo}/HEAD/{filename}"
+    }
+    
+    # README file names tried in order without an API token
+    # (raw.githubusercontent.com is case-sensitive)
+    README_FILENAMES = ("README.md", "readme.md", "Readme.md", "README.rst", "README")
+    
+    # Selectors each phase needs before extraction starts (see readiness.py)
+    READINESS = {
+        "profile": {
+            "selectors": ["div.js-profile-editable-area"],
+            "terminal": ["img[alt='404']"],
+            "timeout": 15000
+        },
+        "contributions": {
+            "selectors": ["h2.f4.text-normal.mb-2", "td.ContributionCalendar-day"],
+            "terminal": [],
+            "timeout": 10000
+        },
+        "repositories": {
+            "selectors": ["li[itemprop='owns']"],
+            "terminal": ["img[alt='404']", "div.blankslate"],
+            "timeout": 15000
+        }
+    }
+    
+    # Share of the overall scrape deadline each phase may take, counted from
+    # when it starts; the repositories tab runs alongside the other phases
+    PHASE_BUDGETS = {
+        "profile": 0.4,
+        "contributions": 0.3,
+        "languages": 0.9,
+        "readmes": 0.3,
+        "history": 0.3,
+        "activity": 0.2
+    }
+    
+    # Fingerprint fields each expensive phase depends on; an incremental
+    # re-scrape reuses a phase's previous data while these are unchanged
+    # (the profile and contribution graph are the fingerprint itself)
+    PHASE_INPUTS = {
+        "languages": ("public_repos",),
+        "readmes": ("pinned_repos",),
+        "history": ("contributions", "contribution_years"),
+        "activity": ("pinned_repos", "contributions")
+    }
+    
+    def __init__(
+        self,
+        headless: bool = True,
+        slow_mo: int = 0,
+        pool: Optional[BrowserPool] = None,
+        block_resources: Optional[bool] = None,
+        allowed_hosts: Optional[List[str]] = None,
+        javascript_enabled: bool = True,
+        phase_timeouts: Optional[Dict[str, int]] = None,
+        backend: Optional[str] = None,
+        base_url: Optional[str] = None,
+        raw_base_url: Optional[str] = None,
+        page_urls: Optional[Dict[str, str]] = None,
+        github_token: Optional[str] = None,
+        graphql_url: Optional[str] = None,
+        exclude_forks: bool = False,
+        exclude_archived: bool = False,
+        max_repo_pages: Optional[int] = None,
+        repo_page_concurrency: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+        cache: Optional[ScrapeCache] = None,
+        har_mode: Optional[str] = None,
+        har_path: Optional[str] = None,
+        har_latency_ms: int = 0,
+        har_jitter_ms: int = 0,
+        deadline_seconds: Optional[float] = None,
+        phase_budgets: Optional[Dict[str, float]] = None,
+        contribution_history: Optional[bool] = None,
+        history_max_years: Optional[int] = None,
+        history_concurrency: Optional[int] = None,
+        repo_activity: Optional[bool] = None,
+        activity_top_n: Optional[int] = None,
+        activity_concurrency: Optional[int] = None,
+        api_url: Optional[str] = None,
+        incremental: Optional[bool] = None
+    ):
         """
         Initialize the GitHub scraper.
         
         Args:
             headless: Run browser in headless mode (default True)
             slow_mo: Slow down operations by specified milliseconds (for debugging)
+            pool: Browser pool to lease contexts from (defaults to the shared pool)
+            block_resources: Abort images/fonts/css/media and third-party hosts
+                (defaults to settings.scraper_block_resources)
+            allowed_hosts: Host allow-list for the resource blocker
+            javascript_enabled: Set False to load the server-rendered HTML only
+            phase_timeouts: Per-phase readiness timeouts in ms, overriding READINESS
+            backend: "playwright", "http" or "graphql" (defaults to settings.github_scraper_backend)
+            base_url: GitHub origin (defaults to settings.github_base_url)
+            raw_base_url: Raw file origin for READMEs (defaults to settings.github_raw_base_url)
+            page_urls: URL templates overriding PAGE_URLS
+            github_token: GraphQL and REST API token (defaults to settings.github_token)
+            graphql_url: GraphQL endpoint (defaults to settings.github_graphql_url)
+            exclude_forks: Leave forked repos out of the language statistics
+            exclude_archived: Leave archived repos out of the language statistics
+            max_repo_pages: Cap on repositories-tab pages read
+                (defaults to settings.github_repo_max_pages)
+            repo_page_concurrency: Repositories-tab pages fetched at once
+                (defaults to settings.github_repo_page_concurrency)
+            use_cache: Serve results from the scrape cache
+                (defaults to settings.scrape_cache_enabled, off in HAR modes)
+            cache: Scrape cache to use (defaults to the shared cache)
+            har_mode: "record" to save every exchange to har_path, "replay"
+                to serve them from har_path with no network
+            har_path: HAR file for har_mode
+            har_latency_ms: Artificial latency per replayed response
+            har_jitter_ms: Extra random (seeded) latency per replayed response
+            deadline_seconds: Overall time budget per scrape, after which the
+                data gathered so far is returned (defaults to
+                settings.github_scrape_deadline, 0 for no deadline)
+            phase_budgets: Per-phase shares of the deadline, overriding PHASE_BUDGETS
+            contribution_history: Also fetch the calendars of earlier years
+                (defaults to settings.github_contribution_history)
+            history_max_years: Cap on calendar years fetched
+                (defaults to settings.github_history_max_years)
+            history_concurrency: Year calendars fetched at once
+                (defaults to settings.github_history_concurrency)
+            repo_activity: Sample last commit, commit count and language
+                bytes of the top pinned repos (defaults to settings.github_repo_activity)
+            activity_top_n: Pinned repos sampled, by stars
+                (defaults to settings.github_activity_top_n)
+            activity_concurrency: Repos sampled at once per candidate
+                (defaults to settings.github_activity_concurrency)
+            api_url: GitHub REST API origin (defaults to settings.github_api_url)
+            incremental: Re-scrape cached profiles from a fingerprint, re-running
+                only the phases whose inputs changed (defaults to
+                settings.github_incremental_scrape)
         """
         self.headless = headless
         self.slow_mo = slow_mo
+        self.pool = pool
+        self.block_resources = settings.scraper_block_resources if block_resources is None else block_resources
+        self.allowed_hosts = allowed_hosts or list(self.ALLOWED_HOSTS)
+        self.javascript_enabled = javascript_enabled
+        self.readiness = {
+            phase: {**spec, "timeout": (phase_timeouts or {}).get(phase, spec["timeout"])}
+            for phase, spec in self.READINESS.items()
+        }
+        self.backend = backend or settings.github_scraper_backend
+        self.base_url = (base_url or settings.github_base_url).rstrip("/")
+        self.raw_base_url = (raw_base_url or settings.github_raw_base_url).rstrip("/")
+        self.page_urls = {**self.PAGE_URLS, **(page_urls or {})}
+        self.github_token = github_token or settings.github_token
+        self.graphql_url = graphql_url or settings.github_graphql_url
+        self.exclude_forks = exclude_forks
+        self.exclude_archived = exclude_archived
+        self.max_repo_pages = max_repo_pages or settings.github_repo_max_pages
+        self.repo_page_concurrency = repo_page_concurrency or settings.github_repo_page_concurrency
+        self.cache = cache
+        self.deadline_seconds = settings.github_scrape_deadline if deadline_seconds is None else deadline_seconds
+        self.phase_budgets = {**self.PHASE_BUDGETS, **(phase_budgets or {})}
+        self.contribution_history = (
+            settings.github_contribution_history if contribution_history is None else contribution_history
+        )
+        self.history_max_years = history_max_years or settings.github_history_max_years
+        self.history_concurrency = history_concurrency or settings.github_history_concurrency
+        if not self.contribution_history:
+            self.phase_budgets.pop("history", None)
+        self.repo_activity = settings.github_repo_activity if repo_activity is None else repo_activity
+        self.activity_top_n = activity_top_n or settings.github_activity_top_n
+        self.activity_concurrency = activity_concurrency or settings.github_activity_concurrency
+        self.api_url = (api_url or settings.github_api_url).rstrip("/")
+        if not self.repo_activity:
+            self.phase_budgets.pop("activity", None)
+        self.incremental = settings.github_incremental_scrape if incremental is None else incremental
+        
+        if har_mode not in (None, "record", "replay"):
+            raise ValueError(f"Unknown HAR mode: {har_mode}")
+        if har_mode and not har_path:
+            raise ValueError("har_path is required with har_mode")
+        self.har_mode = har_mode
+        self.har_path = har_path
+        self.har_recorder = HarRecorder(har_path) if har_mode == "record" else None
+        self.har_replayer = (
+            HarReplayer(har_path, latency_ms=har_latency_ms, jitter_ms=har_jitter_ms)
+            if har_mode == "replay" else None
+        )
+        # Recording and replaying must hit the (real or recorded) network
+        if use_cache is None:
+            use_cache = settings.scrape_cache_enabled and har_mode is None
+        self.use_cache = use_cache
+        self.batch_stats: Dict[str, Any] = {}
         self.browser: Optional[Browser] = None
     
-    async def scrape(self, github_url: str) -> Dict[str, Any]:
+    async def scrape(
+        self,
+        github_url: str,
+        backend: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Scrape a GitHub profile and extract developer data.
         
+        Results are cached per username (see scrape_cache.py): a fresh
+        cached result is returned without scraping, a stale one is returned
+        while a background refresh runs. Concurrent scrapes of the same
+        username with the same backend share one in-flight scrape (see
+        single_flight.py); a call that joins one waits no longer than its
+        own deadline.
+        
+        The scrape is bounded by an overall deadline split into per-phase
+        budgets (see scrape_deadline.py). When a phase runs out of time the
+        data gathered so far is returned, and "completeness" tells how much
+        of each phase made it in. Results that hit the deadline are not cached.
+        
+        When a cached http result is refreshed, only a fingerprint (profile
+        page and contribution graph) is fetched first, and the phases whose
+        inputs did not change are copied from the cached result (see
+        PHASE_INPUTS); "incremental" lists the refreshed and reused phases.
+        
         Args:
             github_url: Full GitHub profile URL (e.g., https://github.com/username)
+            backend: "playwright", "http" or "graphql" for this call (defaults to self.backend)
+            deadline: Overall time budget in seconds for this call
+                (defaults to self.deadline_seconds)
         
         Returns:
             Dictionary containing:
@@ -54,7 +314,828 @@ class GitHubScraper:
             - contribution_streak: Current contribution streak
             - pinned_repos: List of pinned repository data
             - recent_activity: Recent commit/PR activity
+            - resource_blocking: Blocked request statistics (fast mode only)
+            - contribution_history: Per-year calendars and lifetime summary
+              (only with contribution_history, see contribution_history.py)
+            - completeness: Share of each phase's data gathered (0.0 - 1.0)
+            - deadline: Deadline, elapsed time and phases that timed out
+            - incremental: Changed fingerprint fields and the refreshed and
+              reused phases (incremental re-scrapes only)
+            - timings: Per-navigation timing breakdown, bytes transferred and
+              time per phase and extraction step (see scrape_timings.py)
+        """
+        backend = backend or self.backend
+        deadline = self.deadline_seconds if deadline is None else deadline
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown GitHub scraper backend: {backend}")
+        
+        # Extract username from URL
+        username = self._extract_username(github_url)
+        key = self._cache_key(username, backend)
+        
+        # Only scrapes with the same options and backend share a flight
+        return await get_single_flight().do(
+            key,
+            lambda: self._scrape_cached(key, username, backend, deadline),
+            timeout=deadline or None
+        )
+    
+    def cached(self, github_url: str) -> Optional[Dict[str, Any]]:
+        """
+        The last cached result for a profile, however old, without scraping
+        (the scraper service's fallback while GitHub scrapes are failing).
+        
+        Returns:
+            The cached result, or None if it is not cached or caching is off
+        """
+        if not self.use_cache:
+            return None
+        lookup = ScrapeTimings()
+        entry = (self.cache or get_scrape_cache()).peek(self._cache_key(self._extract_username(github_url)))
+        if entry is None:
+            return None
+        self._mark_cache_hit(entry[0], lookup)
+        return entry[0]
+    
+    def _cache_key(self, username: str, backend: Optional[str] = None) -> str:
+        """
+        Scrape cache (and single-flight) key for a profile scraped with
+        backend (defaults to self.backend).
+        
+        Every option that changes the result is part of the key, so a result
+        scraped with one set of options never serves a scrape with another:
+        a mirror, a HAR replay or a token-less scraper never shares entries
+        with live github.com scrapes. Options at their defaults are left
+        out, keeping the common key "github:<username>"; URL templates and
+        HAR paths go in as short digests to keep keys within the column.
+        """
+        options = {
+            # The backends return different fields (graphql_fallback, resource_blocking)
+            "backend": backend or self.backend,
+            "origin": urlsplit(self.base_url).netloc,
+            "urls": self._digest(self._url_config()),
+            "javascript": self.javascript_enabled,
+            "blocking": self.block_resources,
+            "har": self._digest([self.har_mode, str(self.har_path)]) if self.har_mode else None,
+            "token": bool(self.github_token),
+            "exclude_archived": self.exclude_archived,
+            "exclude_forks": self.exclude_forks,
+            "history": self.history_max_years if self.contribution_history else 0,
+            "pages": self.max_repo_pages,
+            "activity": self.activity_top_n if self.repo_activity else 0
+        }
+        defaults = {
+            "backend": settings.github_scraper_backend,
+            "origin": urlsplit(settings.github_base_url).netloc,
+            "urls": self._digest(self._url_config(defaults=True)),
+            "javascript": True,
+            "blocking": settings.scraper_block_resources,
+            "har": None,
+            "token": bool(settings.github_token),
+            "exclude_archived": False,
+            "exclude_forks": False,
+            "history": 0,
+            "pages": settings.github_repo_max_pages,
+            "activity": settings.github_activity_top_n if settings.github_repo_activity else 0
+        }
+        # GitHub logins are case-insensitive
+        key = f"github:{username.lower()}"
+        for name in sorted(options):
+            value = options[name]
+            if value != defaults[name]:
+                key += f":{name}" if value is True else f":{name}={value}"
+        return key
+    
+    def _url_config(self, defaults: bool = False) -> List[Any]:
+        """Every URL a scrape reads from besides the base origin (settings' when defaults)."""
+        if defaults:
+            return [
+                settings.github_raw_base_url.rstrip("/"),
+                settings.github_api_url.rstrip("/"),
+                settings.github_graphql_url,
+                sorted(self.PAGE_URLS.items())
+            ]
+        return [self.raw_base_url, self.api_url, self.graphql_url, sorted(self.page_urls.items())]
+    
+    def _digest(self, value: Any) -> str:
+        """Short stable digest of a JSON-serializable value, for cache keys."""
+        return hashlib.sha1(json.dumps(value).encode()).hexdigest()[:10]
+    
+    async def _scrape_cached(self, key: str, username: str, backend: str, deadline: Optional[float]) -> Dict[str, Any]:
+        """Serve a profile from the scrape cache, scraping it when needed."""
+        if not self.use_cache:
+            return await self._timed(self._scrape_backend(username, backend, deadline))
+        
+        cache = self.cache or get_scrape_cache()
+        lookup = ScrapeTimings()
+        scraped: List[Dict[str, Any]] = []
+        
+        async def fetch() -> Dict[str, Any]:
+            result = await self._scrape_fresh(cache, key, username, backend, deadline)
+            scraped.append(result)
+            return result
+        
+        result = await cache.get_or_fetch(
+            key,
+            fetch,
+            # Partial results would be served as fresh for the whole TTL
+            should_store=lambda result: not result.get("deadline", {}).get("timed_out")
+        )
+        # A hit (or stale hit, refreshed later) was not scraped by this call
+        if not scraped:
+            self._mark_cache_hit(result, lookup)
+        return result
+    
+    def _mark_cache_hit(self, result: Dict[str, Any], lookup: ScrapeTimings) -> None:
+        """Replace the stored timings, which describe the scrape that filled the cache."""
+        if settings.scraper_timings_enabled:
+            result["timings"] = {**lookup.report(), "cache_hit": True}
+        else:
+            result.pop("timings", None)
+    
+    async def _scrape_fresh(
+        self,
+        cache: ScrapeCache,
+        key: str,
+        username: str,
+        backend: str,
+        deadline: Optional[float]
+    ) -> Dict[str, Any]:
+        """Scrape a profile, incrementally if an earlier result is cached."""
+        # Only the http backend can re-run single phases; a graphql scrape is
+        # a single request already and a playwright one renders every page,
+        # so a fingerprint would only add two requests to their full scrape
+        if self.incremental and backend == "http":
+            cached = cache.peek(key)
+            if cached is not None:
+                try:
+                    result = await self._timed(self._scrape_incremental(username, cached[0], deadline))
+                finally:
+                    # The fingerprint requests; a full scrape saves its own
+                    if self.har_recorder:
+                        self.har_recorder.save()
+                if result is not None:
+                    if self.har_replayer:
+                        result["har_replay"] = self.har_replayer.report()
+                    return result
+        
+        return await self._timed(self._scrape_backend(username, backend, deadline))
+    
+    async def _timed(self, scrape: Awaitable[Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """Await a scrape and attach its "timings" block (settings.scraper_timings_enabled)."""
+        if not settings.scraper_timings_enabled:
+            return await scrape
+        
+        timings = ScrapeTimings()
+        with timings.active():
+            result = await scrape
+        if result is not None:
+            result["timings"] = timings.report()
+        return result
+    
+    async def _scrape_backend(self, username: str, backend: str, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """Scrape a profile with the given backend, bypassing the cache."""
+        scrape_deadline = ScrapeDeadline(deadline, self.phase_budgets)
+        
+        try:
+            if backend == "graphql":
+                result = await self._scrape_graphql_or_http(username, scrape_deadline)
+            elif backend == "http":
+                result = await self._scrape_http(username, scrape_deadline)
+            else:
+                result = await self._scrape_playwright(username, scrape_deadline)
+        finally:
+            if self.har_recorder:
+                self.har_recorder.save()
+        
+        result["completeness"] = scrape_deadline.completeness()
+        result["deadline"] = scrape_deadline.report()
+        
+        if self.har_replayer:
+            result["har_replay"] = self.har_replayer.report()
+        return result
+    
+    async def _scrape_graphql_or_http(self, username: str, deadline: ScrapeDeadline) -> Dict[str, Any]:
+        """
+        Scrape a profile with the GraphQL backend, falling back to the HTML pages.
+        
+        A missing token, a GraphQL error or an API outage leaves the public
+        pages readable, so those scrapes are retried with the http backend
+        and the result records why. An unknown login is not retried.
+        """
+        try:
+            # One request fetches every phase, bounded by the HTTP timeout
+            result = (await self.scrape_graphql_batch([username]))[username]
+        except (ValueError, RuntimeError, httpx.HTTPError) as e:
+            reason = str(e) or type(e).__name__
+            print(f"⚠️ GitHub GraphQL backend failed for {username} ({reason}), falling back to HTML")
+            result = await self._scrape_http(username, deadline)
+            result["graphql_fallback"] = reason
+            return result
+        
+        if result is None:
+            raise ValueError(f"GitHub profile not found: {username}")
+        for phase in self.phase_budgets:
+            deadline.mark(phase, 1.0)
+        return result
+    
+    async def close(self) -> None:
+        """Close the HTTP clients owned by the HAR recorder/replayer."""
+        if self.har_recorder:
+            await self.har_recorder.close()
+        if self.har_replayer:
+            await self.har_replayer.close()
+    
+    async def scrape_many(
+        self,
+        github_urls: List[str],
+        concurrency: Optional[int] = None,
+        backend: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Scrape many profiles concurrently, yielding each as it completes.
+        
+        Up to `concurrency` profiles are scraped at once, each in its own
+        pooled context. The shared browser pool is started for the batch
+        if it is not running yet. A failing profile is yielded as an error
+        item and does not stop the batch. Aggregate throughput is kept in
+        self.batch_stats while the batch runs.
+        
+        Usage:
+            async for item in scraper.scrape_many(urls, concurrency=4):
+                if item["status"] == "ok":
+                    save(item["data"])
+        
+        Args:
+            github_urls: GitHub profile URLs
+            concurrency: Profiles scraped at once (defaults to the pool size)
+            backend: Backend for every profile (defaults to self.backend)
+        
+        Yields:
+            {"url", "username", "status": "ok" | "error", "data", "error",
+             "elapsed_seconds"} in completion order
+        """
+        backend = backend or self.backend
+        pool = self.pool or get_browser_pool()
+        concurrency = max(1, concurrency or pool.size)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # Fan out across pooled contexts instead of one browser per profile
+        started_pool = False
+        if backend == "playwright" and not pool.running:
+            try:
+                await pool.start()
+                started_pool = True
+            except Exception as e:
+                print(f"⚠️ Browser pool failed to start, each profile will launch its own browser: {e}")
+        
+        batch_started = time.monotonic()
+        self.batch_stats = {
+            "total": len(github_urls),
+            "completed": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "concurrency": concurrency,
+            "elapsed_seconds": 0.0,
+            "profiles_per_minute": 0.0,
+            "mean_profile_seconds": 0.0
+        }
+        profile_seconds = 0.0
+        
+        async def scrape_one(github_url: str) -> Dict[str, Any]:
+            async with semaphore:
+                started = time.monotonic()
+                item = {
+                    "url": github_url,
+                    "username": self._extract_username(github_url),
+                    "status": "ok",
+                    "data": None,
+                    "error": None
+                }
+                try:
+                    item["data"] = await self.scrape(github_url, backend=backend)
+                except Exception as e:
+                    item["status"] = "error"
+                    item["error"] = str(e) or type(e).__name__
+                item["elapsed_seconds"] = round(time.monotonic() - started, 2)
+                return item
+        
+        tasks = [asyncio.create_task(scrape_one(url)) for url in github_urls]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                item = await next_done
+                
+                stats = self.batch_stats
+                stats["completed"] += 1
+                stats["succeeded" if item["status"] == "ok" else "failed"] += 1
+                profile_seconds += item["elapsed_seconds"]
+                elapsed = time.monotonic() - batch_started
+                stats["elapsed_seconds"] = round(elapsed, 2)
+                stats["profiles_per_minute"] = round(stats["completed"] / elapsed * 60, 1) if elapsed > 0 else 0.0
+                stats["mean_profile_seconds"] = round(profile_seconds / stats["completed"], 2)
+                
+                yield item
+            
+            print(
+                f"📊 Scraped {self.batch_stats['succeeded']}/{self.batch_stats['total']} profiles "
+                f"in {self.batch_stats['elapsed_seconds']}s ({self.batch_stats['profiles_per_minute']}/min)"
+            )
+        finally:
+            # Caller stopped early: do not leave scrapes running in the background
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if started_pool:
+                await pool.close()
+    
+    async def scrape_graphql_batch(self, github_urls: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Scrape several profiles with one aliased GitHub GraphQL request.
+        
+        Users owning more than 100 repositories get their further
+        repository pages in follow-up requests (up to max_repo_pages pages
+        in all); a result whose repositories were cut off there carries
+        "repositories_truncated": True.
+        
+        Args:
+            github_urls: GitHub profile URLs
+        
+        Returns:
+            Mapping of username to its scrape result (None if the profile
+            does not exist)
+        """
+        usernames = [self._extract_username(url) for url in github_urls]
+        users = await fetch_users(usernames, token=self.github_token, url=self.graphql_url, client=self._http_client())
+        
+        semaphore = asyncio.Semaphore(self.repo_page_concurrency)
+        
+        async def add_repositories(username: str, repositories: Dict[str, Any]) -> None:
+            async with semaphore:
+                nodes, truncated = await fetch_repositories(
+                    username, repositories["pageInfo"]["endCursor"], self.max_repo_pages - 1,
+                    token=self.github_token, url=self.graphql_url, client=self._http_client()
+                )
+            repositories["nodes"].extend(nodes)
+            repositories["truncated"] = truncated
+        
+        await asyncio.gather(*[
+            add_repositories(username, user["repositories"])
+            for username, user in users.items()
+            if user is not None and (user["repositories"].get("pageInfo") or {}).get("hasNextPage")
+        ])
+        
+        results = {
+            username: self._result_from_graphql(username, user) if user else None
+            for username, user in users.items()
+        }
+        
+        if self.contribution_history:
+            semaphore = asyncio.Semaphore(self.history_concurrency)
+            
+            async def add_history(username: str, result: Dict[str, Any]) -> None:
+                async with semaphore:
+                    result["contribution_history"] = await self._scrape_history_graphql(
+                        username, result["contribution_years"]
+                    )
+            
+            await asyncio.gather(*[
+                add_history(username, result)
+                for username, result in results.items()
+                if result is not None
+            ])
+        
+        if self.har_recorder:
+            self.har_recorder.save()
+        return results
+    
+    def _result_from_graphql(self, username: str, user: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a GraphQL user node onto the scrape result keys."""
+        repositories = user["repositories"]
+        repo_nodes = [
+            repo for repo in repositories["nodes"]
+            if self._include_repo(repo["isFork"], repo["isArchived"])
+        ]
+        
+        profile_data = {
+            "name": user["name"],
+            "bio": user["bio"],
+            "location": user["location"],
+            "company": user["company"],
+            "website": user["websiteUrl"],
+            "public_repos": repositories["totalCount"],
+            "repositories_truncated": repositories.get("truncated", False),
+            "followers": user["followers"]["totalCount"],
+            "following": user["following"]["totalCount"],
+            "contribution_years": user["contributionsCollection"].get("contributionYears") or []
+        }
+        
+        calendar = user["contributionsCollection"]["contributionCalendar"]
+        contribution_data = self._contributions_from_raw({"heading": None, "days": calendar_days(calendar)})
+        contribution_data["commits_12_months"] = calendar["totalContributions"]
+        
+        language_data = self._aggregate_languages(
+            [repo["primaryLanguage"]["name"] for repo in repo_nodes if repo["primaryLanguage"]],
+            language_bytes(repo_nodes)
+        )
+        
+        pinned_nodes = [node for node in user["pinnedItems"]["nodes"] if node and node.get("name")]
+        pinned_repos = []
+        for node in pinned_nodes:
+            repo_data = {"name": node["name"]}
+            if node["description"] is not None:
+                repo_data["description"] = node["description"]
+            if node["primaryLanguage"]:
+                repo_data["language"] = node["primaryLanguage"]["name"]
+            repo_data["stars"] = node["stargazerCount"]
+            repo_data["forks"] = node["forkCount"]
+            if self.repo_activity and "defaultBranchRef" in node:
+                repo_data["activity"] = with_recency(activity_from_graphql(node))
+            pinned_repos.append(repo_data)
+        
+        # README markdown comes with the query, scored like the raw fetches
+        readme_scores = [
+            self._score_readme_content(markdown_features(readme_text(node)))
+            for node in pinned_nodes
+        ]
+        readme_score = round(sum(readme_scores) / len(readme_scores), 1) if readme_scores else 0.0
+        
+        return self._combine(
+            username, profile_data, contribution_data, language_data, pinned_repos, readme_score
+        )
+    
+    async def _scrape_playwright(self, username: str, deadline: ScrapeDeadline) -> Dict[str, Any]:
+        """Scrape a profile by rendering its pages in a browser context."""
+        blocker = ResourceBlocker(self.allowed_hosts) if self.block_resources else None
+        
+        async with self._browser_context() as context:
+            if blocker:
+                await blocker.attach(context)
+            
+            # The repositories tab does not depend on the profile page, so it
+            # loads in its own page while the profile and READMEs are scraped
+            repo_pages: List[Dict[str, Any]] = []
+            languages_task = asyncio.create_task(deadline.run(
+                "languages",
+                self._scrape_languages(context, username, repo_pages),
+                partial=lambda: self._languages_from_repo_pages(repo_pages),
+                completeness=lambda: self._repo_pages_completeness(repo_pages)
+            ))
+            
+            try:
+                profile_data, contribution_data, pinned_repos = await self._scrape_profile(context, username, deadline)
+                readme_score, history, _ = await asyncio.gather(
+                    self._readmes_within_deadline(username, pinned_repos, deadline),
+                    self._history_within_deadline(username, profile_data, deadline),
+                    self._activity_within_deadline(username, pinned_repos, deadline)
+                )
+                language_data = await languages_task
+            finally:
+                if not languages_task.done():
+                    languages_task.cancel()
+                    await asyncio.gather(languages_task, return_exceptions=True)
+            
+            result = self._combine(
+                username, profile_data, contribution_data, language_data, pinned_repos, readme_score, history
+            )
+            
+            if blocker:
+                result["resource_blocking"] = blocker.report()
+            
+            return result
+    
+    async def _scrape_http(self, username: str, deadline: ScrapeDeadline) -> Dict[str, Any]:
+        """
+        Scrape a profile from its server-rendered HTML, without a browser.
+        
+        The profile, contribution graph fragment and repositories tab are
+        fetched concurrently over the pooled HTTP client, then the raw
+        READMEs of the pinned repositories.
+        """
+        repo_pages: List[Dict[str, Any]] = []
+        
+        # Every fetch runs to completion before a failure is raised, so none
+        # is left running after the scrape has failed
+        profile_html, calendar_html, language_data = await asyncio.gather(
+            deadline.run("profile", self._fetch_profile_html(username), partial=lambda: None),
+            deadline.run(
+                "contributions",
+                self._fetch_html(self._page_url("contributions", username), "contribution graph"),
+                partial=lambda: None
+            ),
+            deadline.run(
+                "languages",
+                self._scrape_languages_http(username, repo_pages),
+                partial=lambda: self._languages_from_repo_pages(repo_pages),
+                completeness=lambda: self._repo_pages_completeness(repo_pages)
+            ),
+            return_exceptions=True
+        )
+        
+        # A missing or failing profile page fails the scrape
+        if isinstance(profile_html, BaseException):
+            raise profile_html
+        if isinstance(calendar_html, BaseException):
+            print(f"Warning: Error fetching contribution graph: {calendar_html}")
+            calendar_html = None
+        if isinstance(language_data, BaseException):
+            print(f"Warning: Error scraping languages: {language_data}")
+            language_data = self._languages_from_repo_pages(repo_pages)
+            deadline.mark("languages", self._repo_pages_completeness(repo_pages))
+        
+        # Other fetch failures (None) are reported as missing data, like timeouts
+        if profile_html is None:
+            deadline.mark("profile", 0.0)
+        if calendar_html is None:
+            deadline.mark("contributions", 0.0)
+        
+        profile_data = self._parse_html("profile overview", parse_profile_overview, profile_html, self._profile_overview_from_raw)
+        pinned_repos = self._parse_html("pinned repos", parse_pinned_repos, profile_html, self._pinned_repos_from_raw)
+        contribution_data = self._parse_html("contributions", parse_contribution_calendar, calendar_html, self._contributions_from_raw)
+        
+        readme_score, history, _ = await asyncio.gather(
+            self._readmes_within_deadline(username, pinned_repos, deadline),
+            self._history_within_deadline(username, profile_data, deadline),
+            self._activity_within_deadline(username, pinned_repos, deadline)
+        )
+        
+        return self._combine(
+            username, profile_data, contribution_data, language_data, pinned_repos, readme_score, history
+        )
+    
+    async def _scrape_incremental(
+        self,
+        username: str,
+        previous: Dict[str, Any],
+        deadline: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Re-scrape a profile, re-running only the phases whose inputs changed.
+        
+        The profile page and contribution graph are fetched (two requests)
+        and fingerprinted; each phase of PHASE_INPUTS whose inputs match the
+        previous result's fingerprint keeps its previous data instead of
+        fetching the repositories tab, READMEs, year calendars or repo
+        activity again. The changed phases re-run over HTTP.
+        
+        Returns:
+            The scrape result, or None if the fingerprint could not be
+            fetched (the caller then runs a full scrape)
+        """
+        scrape_deadline = ScrapeDeadline(deadline, self.phase_budgets)
+        
+        profile_html, calendar_html = await asyncio.gather(
+            scrape_deadline.run("profile", self._fetch_profile_html(username), partial=lambda: None),
+            scrape_deadline.run(
+                "contributions",
+                self._fetch_html(self._page_url("contributions", username), "contribution graph"),
+                partial=lambda: None
+            ),
+            return_exceptions=True
+        )
+        # A deleted profile fails the refresh; other failures fall back to a full scrape
+        if isinstance(profile_html, ValueError):
+            raise profile_html
+        if isinstance(profile_html, BaseException):
+            print(f"Warning: Error fetching profile: {profile_html}")
+            profile_html = None
+        if profile_html is None or calendar_html is None:
+            print(f"⚠️ Could not fingerprint {username}, running a full scrape")
+            return None
+        
+        profile_data = self._parse_html("profile overview", parse_profile_overview, profile_html, self._profile_overview_from_raw)
+        pinned_repos = self._parse_html("pinned repos", parse_pinned_repos, profile_html, self._pinned_repos_from_raw)
+        contribution_data = self._parse_html("contributions", parse_contribution_calendar, calendar_html, self._contributions_from_raw)
+        
+        fingerprint = self._fingerprint({**profile_data, **contribution_data, "pinned_repos": pinned_repos})
+        previous_fingerprint = self._fingerprint(previous)
+        changed = [field for field in fingerprint if fingerprint[field] != previous_fingerprint[field]]
+        
+        # Phases that timed out or did not exist in the previous scrape have nothing to reuse
+        previous_completeness = previous.get("completeness") or {}
+        previous_timed_out = (previous.get("deadline") or {}).get("timed_out") or []
+        stale = {
+            phase for phase, inputs in self.PHASE_INPUTS.items()
+            if phase in self.phase_budgets and (
+                set(inputs) & set(changed)
+                or phase not in previous_completeness
+                or phase in previous_timed_out
+            )
+        }
+        repo_pages: List[Dict[str, Any]] = []
+        languages = (
+            scrape_deadline.run(
+                "languages",
+                self._scrape_languages_http(username, repo_pages),
+                partial=lambda: self._languages_from_repo_pages(repo_pages),
+                completeness=lambda: self._repo_pages_completeness(repo_pages)
+            )
+            if "languages" in stale else self._reused(previous.get("all_languages") or [])
+        )
+        readmes = (
+            self._readmes_within_deadline(username, pinned_repos, scrape_deadline)
+            if "readmes" in stale else self._reused(previous.get("readme_complexity_score", 0.0))
+        )
+        history = (
+            self._history_within_deadline(username, profile_data, scrape_deadline)
+            if "history" in stale else self._reused(previous.get("contribution_history"))
+        )
+        activity = (
+            self._activity_within_deadline(username, pinned_repos, scrape_deadline)
+            if "activity" in stale else self._reused(None)
+        )
+        language_data, readme_score, history, _ = await asyncio.gather(languages, readmes, history, activity)
+        
+        reused = [phase for phase in self.PHASE_INPUTS if phase in self.phase_budgets and phase not in stale]
+        for phase in reused:
+            scrape_deadline.mark(phase, previous_completeness[phase])
+        if "activity" in reused:
+            self._reuse_activity(previous.get("pinned_repos") or [], pinned_repos)
+        
+        result = self._combine(
+            username, profile_data, contribution_data, language_data, pinned_repos, readme_score, history
+        )
+        result["completeness"] = scrape_deadline.completeness()
+        result["deadline"] = scrape_deadline.report()
+        result["incremental"] = {
+            "previous_scraped_at": previous.get("scraped_at"),
+            "changed": changed,
+            "refreshed": ["profile", "contributions"] + [phase for phase in self.PHASE_INPUTS if phase in stale],
+            "reused": reused
+        }
+        return result
+    
+    def _fingerprint(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Cheap profile fingerprint the expensive phases are keyed on (see PHASE_INPUTS)."""
+        return {
+            "contributions": result.get("commits_12_months"),
+            "public_repos": result.get("public_repos"),
+            "followers": result.get("followers"),
+            "pinned_repos": sorted(repo.get("name") or "" for repo in result.get("pinned_repos") or []),
+            "contribution_years": sorted(result.get("contribution_years") or [])
+        }
+    
+    async def _reused(self, value: Any) -> Any:
+        """Previous phase data, awaitable alongside the phases that re-run."""
+        return value
+    
+    def _reuse_activity(self, previous_repos: List[Dict[str, Any]], pinned_repos: List[Dict[str, Any]]) -> None:
+        """Copy the previous activity samples onto the re-scraped pinned repos."""
+        activity = {repo.get("name"): repo["activity"] for repo in previous_repos if "activity" in repo}
+        for repo in pinned_repos:
+            if repo.get("name") in activity:
+                repo["activity"] = with_recency(activity[repo["name"]])
+    
+    async def _fetch_profile_html(self, username: str) -> str:
+        """Fetch the profile page HTML, raising ValueError if it does not exist."""
+        response = await self._http_client().get(self._page_url("profile", username))
+        
+        # Check if profile exists
+        if response.status_code == 404:
+            raise ValueError(f"GitHub profile not found: {username}")
+        response.raise_for_status()
+        return response.text
+    
+    async def _scrape_languages_http(
+        self,
+        username: str,
+        pages: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
         """
+        Language statistics from every repositories-tab page, over HTTP.
+        
+        Parsed pages are appended to pages as they arrive, so a caller that
+        times out can still aggregate the ones already read.
+        """
+        pages = [] if pages is None else pages
+        
+        first_page = await self._fetch_repository_page(username, 1)
+        if first_page is None:
+            return []
+        
+        pages.append(first_page)
+        await self._repository_pages(
+            first_page,
+            lambda number: self._fetch_repository_page(username, number),
+            pages
+        )
+        return self._languages_from_repo_pages(pages)
+    
+    async def _fetch_repository_page(self, username: str, number: int) -> Optional[Dict[str, Any]]:
+        """Fetch and parse one repositories-tab page (None on failure)."""
+        html = await self._fetch_html(
+            self._page_url("repositories", username, page=number),
+            f"repositories page {number}"
+        )
+        if html is None:
+            return None
+        
+        try:
+            with measure("extraction", "repositories page"):
+                return parse_repository_list(html)
+        except Exception as e:
+            print(f"Warning: Error parsing repositories page {number}: {e}")
+            return None
+    
+    async def _fetch_html(self, url: str, label: str) -> Optional[str]:
+        """GET a page over the pooled HTTP client (None on failure)."""
+        try:
+            response = await self._http_client().get(url)
+            response.raise_for_status()
+            return response.text
+        except Exception as e:
+            print(f"Warning: Error fetching {label}: {e}")
+            return None
+    
+    def _parse_html(self, label: str, parser, html: Optional[str], build) -> Any:
+        """Run an HTML parser and its post-processing, falling back to defaults."""
+        try:
+            with measure("extraction", label):
+                return build(parser(html) if html else None)
+        except Exception as e:
+            print(f"Warning: Error parsing {label}: {e}")
+            return build(None)
+    
+    def _http_client(self) -> httpx.AsyncClient:
+        """The pooled HTTP client, or the HAR recorder/replayer client."""
+        if self.har_replayer:
+            return self.har_replayer.http_client()
+        if self.har_recorder:
+            return self.har_recorder.http_client()
+        return get_http_client()
+    
+    def _page_url(self, name: str, username: str, **params: Any) -> str:
+        """Build a GitHub page URL from the configured templates."""
+        return self.page_urls[name].format(base=self.base_url, raw=self.raw_base_url, username=username, **params)
+    
+    def _combine(
+        self,
+        username: str,
+        profile_data: Dict[str, Any],
+        contribution_data: Dict[str, Any],
+        language_data: List[Dict[str, Any]],
+        pinned_repos: List[Dict[str, Any]],
+        readme_score: float,
+        history: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Combine all phase results into the scrape result."""
+        result = {
+            "username": username,
+            "scraped_at": datetime.utcnow().isoformat(),
+            **profile_data,
+            **contribution_data,
+            "top_languages": language_data[:3],  # Top 3
+            "all_languages": language_data,
+            "readme_complexity_score": readme_score,
+            "pinned_repos": pinned_repos
+        }
+        if history is not None:
+            result["contribution_history"] = history
+        return result
+    
+    @asynccontextmanager
+    async def _browser_context(self) -> AsyncIterator[BrowserContext]:
+        """
+        Yield a BrowserContext for one scrape.
+        
+        In HAR modes the context is recorded, or answered from the archive;
+        otherwise its requests are paced by the shared per-host rate limiter.
+        """
+        context_options = {} if self.javascript_enabled else {"java_script_enabled": False}
+        if self.har_recorder:
+            context_options.update(self.har_recorder.context_options())
+        
+        try:
+            async with self._open_context(context_options) as context:
+                limiter = None
+                if self.har_replayer:
+                    await self.har_replayer.attach(context)
+                elif settings.scraper_rate_limit_enabled:
+                    limiter = get_rate_limiter()
+                    await limiter.attach(context)
+                
+                try:
+                    yield context
+                finally:
+                    if limiter:
+                        limiter.detach(context)
+        finally:
+            if self.har_recorder:
+                self.har_recorder.collect(context_options)
+    
+    @asynccontextmanager
+    async def _open_context(self, context_options: Dict[str, Any]) -> AsyncIterator[BrowserContext]:
+        """
+        Lease a context from the shared BrowserPool when it is running
+        (started by the FastAPI lifespan). Standalone runs without a pool
+        fall back to launching a private browser for this scrape only.
+        """
+        pool = self.pool or get_browser_pool()
+        if pool.running:
+            async with pool.context(**context_options) as context:
+                yield context
+            return
+        
         async with async_playwright() as p:
             # Launch browser
             self.browser = await p.chromium.launch(
@@ -63,47 +1144,109 @@ class GitHubScraper:
             )
             
             try:
-                page = await self.browser.new_page()
-                
                 # Set a realistic user agent
-                await page.set_extra_http_headers({
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                })
-                
-                # Extract username from URL
-                username = self._extract_username(github_url)
-                
-                # Navigate to profile
-                await page.goto(f"https://github.com/{username}", wait_until="networkidle")
-                
-                # Check if profile exists
-                if await page.query_selector("img[alt='404']"):
-                    raise ValueError(f"GitHub profile not found: {username}")
-                
-                # Gather all data
-                profile_data = await self._scrape_profile_overview(page, username)
-                contribution_data = await self._scrape_contributions(page, username)
-                language_data = await self._scrape_languages(page, username)
-                pinned_repos = await self._scrape_pinned_repos(page)
-                readme_score = await self._analyze_readme_complexity(page, username, pinned_repos)
-                
-                # Combine all data
-                result = {
-                    "username": username,
-                    "scraped_at": datetime.utcnow().isoformat(),
-                    **profile_data,
-                    **contribution_data,
-                    "top_languages": language_data[:3],  # Top 3
-                    "all_languages": language_data,
-                    "readme_complexity_score": readme_score,
-                    "pinned_repos": pinned_repos
-                }
-                
-                return result
-                
+                context = await self.browser.new_context(user_agent=DEFAULT_USER_AGENT, **context_options)
+                yield context
+                # The HAR is written when the context closes
+                await context.close()
             finally:
                 await self.browser.close()
     
+    async def _scrape_profile(
+        self,
+        context: BrowserContext,
+        username: str,
+        deadline: ScrapeDeadline
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Load the profile page once and extract everything it shows.
+        
+        Without JavaScript the contribution graph (an include-fragment) is not
+        rendered into the profile, so it is loaded from its fragment URL in a
+        parallel page instead.
+        
+        Returns:
+            Tuple of (profile overview, contribution data, pinned repos)
+        """
+        page = await context.new_page()
+        calendar_task = None
+        if not self.javascript_enabled:
+            calendar_task = asyncio.create_task(self._scrape_contribution_fragment(context, username))
+        
+        try:
+            profile_data, pinned_repos = await deadline.run(
+                "profile",
+                self._load_profile(page, username),
+                partial=lambda: (self._profile_overview_from_raw(None), [])
+            )
+            if calendar_task is None and "profile" in deadline.timed_out:
+                # The graph is part of the profile page, which never loaded
+                contribution_data = self._contributions_from_raw(None)
+            else:
+                contribution_data = await deadline.run(
+                    "contributions",
+                    calendar_task or self._wait_contributions(page, username),
+                    partial=lambda: self._contributions_from_raw(None)
+                )
+            
+            return profile_data, contribution_data, pinned_repos
+            
+        finally:
+            if calendar_task and not calendar_task.done():
+                calendar_task.cancel()
+                await asyncio.gather(calendar_task, return_exceptions=True)
+            await page.close()
+    
+    async def _load_profile(self, page: Page, username: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Navigate to the profile and extract its overview and pinned repos."""
+        url = self._page_url("profile", username)
+        response = await goto_ready(page, url, self.readiness["profile"])
+        self._raise_for_navigation(response, url)
+        
+        # Check if profile exists
+        if await page.query_selector("img[alt='404']"):
+            raise ValueError(f"GitHub profile not found: {username}")
+        
+        html = await self._page_html(page)
+        profile_data = self._parse_html("profile overview", parse_profile_overview, html, self._profile_overview_from_raw)
+        pinned_repos = self._parse_html("pinned repos", parse_pinned_repos, html, self._pinned_repos_from_raw)
+        return profile_data, pinned_repos
+    
+    def _raise_for_navigation(self, response: Optional[Response], url: str) -> None:
+        """
+        Raise what the http backend's raise_for_status() would for an abuse,
+        rate-limit or 5xx page, so the circuit breaker classifies it the same.
+        """
+        if response is None or not (response.status in (403, 429) or response.status >= 500):
+            return
+        httpx.Response(
+            response.status,
+            headers=response.headers,
+            request=httpx.Request("GET", url)
+        ).raise_for_status()
+    
+    async def _wait_contributions(self, page: Page, username: str) -> Dict[str, Any]:
+        """Wait for the include-fragment contribution graph, then extract it."""
+        await wait_ready(page, self.readiness["contributions"])
+        return await self._scrape_contributions(page, username)
+    
+    async def _scrape_contribution_fragment(self, context: BrowserContext, username: str) -> Dict[str, Any]:
+        """Load the server-rendered contribution graph fragment in its own page."""
+        page = await context.new_page()
+        
+        try:
+            try:
+                await goto_ready(
+                    page,
+                    self._page_url("contributions", username),
+                    self.readiness["contributions"]
+                )
+            except Exception as e:
+                print(f"Warning: Error loading contribution graph: {e}")
+            return await self._scrape_contributions(page, username)
+        finally:
+            await page.close()
+    
     def _extract_username(self, github_url: str) -> str:
         """Extract username from GitHub URL."""
         # Handle various URL formats
@@ -121,8 +1264,20 @@ class GitHubScraper:
         # Assume it's just the username
         return url
     
-    async def _scrape_profile_overview(self, page: Page, username: str) -> Dict[str, Any]:
-        """Scrape basic profile information."""
+    async def _page_html(self, page: Page) -> Optional[str]:
+        """
+        One snapshot of the rendered page for the HTML parsers, which the
+        http backend shares (None if the page cannot be read).
+        """
+        try:
+            with measure("extraction", "page content"):
+                return await page.content()
+        except Exception as e:
+            print(f"Warning: Error reading page content: {e}")
+            return None
+    
+    def _profile_overview_from_raw(self, raw: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build profile fields from parse_profile_overview output."""
         data = {
             "name": None,
             "bio": None,
@@ -131,185 +1286,382 @@ class GitHubScraper:
             "website": None,
             "public_repos": 0,
             "followers": 0,
-            "following": 0
+            "following": 0,
+            "contribution_years": []
         }
+        if not raw:
+            return data
         
-        try:
-            # Name
-            name_elem = await page.query_selector("span.p-name")
-            if name_elem:
-                data["name"] = await name_elem.inner_text()
-            
-            # Bio
-            bio_elem = await page.query_selector("div.p-note")
-            if bio_elem:
-                data["bio"] = await bio_elem.inner_text()
-            
-            # Location
-            location_elem = await page.query_selector("li[itemprop='homeLocation'] span")
-            if location_elem:
-                data["location"] = await location_elem.inner_text()
-            
-            # Company
-            company_elem = await page.query_selector("li[itemprop='worksFor'] span")
-            if company_elem:
-                data["company"] = await company_elem.inner_text()
-            
-            # Stats (repos, followers, following)
-            nav_items = await page.query_selector_all("a.UnderlineNav-item")
-            for item in nav_items:
-                text = await item.inner_text()
-                if "Repositories" in text:
-                    match = re.search(r"(\d+)", text)
-                    if match:
-                        data["public_repos"] = int(match.group(1))
-            
-            # Followers/Following from the sidebar
-            followers_elem = await page.query_selector("a[href$='?tab=followers'] span")
-            if followers_elem:
-                text = await followers_elem.inner_text()
-                data["followers"] = self._parse_count(text)
-            
-            following_elem = await page.query_selector("a[href$='?tab=following'] span")
-            if following_elem:
-                text = await following_elem.inner_text()
-                data["following"] = self._parse_count(text)
-                
-        except Exception as e:
-            print(f"Warning: Error scraping profile overview: {e}")
+        data["name"] = raw["name"]
+        data["bio"] = raw["bio"]
+        data["location"] = raw["location"]
+        data["company"] = raw["company"]
+        
+        # Stats (repos) from the profile tabs
+        for text in raw["nav_items"]:
+            if "Repositories" in text:
+                match = re.search(r"(\d+)", text)
+                if match:
+                    data["public_repos"] = int(match.group(1))
+        
+        # Followers/Following from the sidebar
+        if raw["followers"] is not None:
+            data["followers"] = self._parse_count(raw["followers"])
+        if raw["following"] is not None:
+            data["following"] = self._parse_count(raw["following"])
+        
+        data["contribution_years"] = sorted(set(raw.get("years") or []), reverse=True)
         
         return data
     
     async def _scrape_contributions(self, page: Page, username: str) -> Dict[str, Any]:
-        """Scrape contribution graph data."""
+        """
+        Scrape contribution graph data.
+        
+        The calendar is parsed from one snapshot of the page into a per-day
+        array of (date, level, count); streaks, monthly totals, weekday
+        distribution and gaps are computed from it in Python.
+        """
+        html = await self._page_html(page)
+        return self._parse_html("contributions", parse_contribution_calendar, html, self._contributions_from_raw)
+    
+    def _contributions_from_raw(self, raw: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build contribution stats from parse_contribution_calendar output."""
         data = {
             "commits_12_months": 0,
             "contribution_streak": 0,
-            "contributions_by_month": []
+            "longest_streak": 0,
+            "longest_gap_days": 0,
+            "active_days": 0,
+            "contributions_by_month": [],
+            "weekday_distribution": {}
         }
+        if not raw:
+            return data
+        
+        stats = summarize_calendar(raw["days"])
+        calendar_total = stats.pop("calendar_total")
+        data.update(stats)
+        
+        # Contribution count text, e.g. "1,234 contributions in the last year"
+        match = re.search(r"([\d,]+)\s+contributions?", raw["heading"] or "")
+        if match:
+            data["commits_12_months"] = int(match.group(1).replace(",", ""))
+        else:
+            data["commits_12_months"] = calendar_total
+        
+        return data
+    
+    async def _scrape_languages(
+        self,
+        context: BrowserContext,
+        username: str,
+        pages: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape language statistics from every page of the repositories tab.
+        
+        The first page reports the page count; the remaining pages (up to
+        max_repo_pages) are then loaded concurrently, each in its own page.
+        Read pages are appended to pages as they arrive, so a caller that
+        times out can still aggregate the ones already read.
+        """
+        pages = [] if pages is None else pages
         
         try:
-            # Look for contribution count text
-            contrib_elem = await page.query_selector("h2.f4.text-normal.mb-2")
-            if contrib_elem:
-                text = await contrib_elem.inner_text()
-                match = re.search(r"([\d,]+)\s+contributions?", text)
-                if match:
-                    data["commits_12_months"] = int(match.group(1).replace(",", ""))
-            
-            # Get contribution graph cells for streak calculation
-            cells = await page.query_selector_all("td.ContributionCalendar-day")
+            first_page = await self._scrape_repository_page(context, username, 1)
+            if first_page is None:
+                return []
             
-            # Calculate current streak
-            streak = 0
-            today = datetime.now().date()
-            
-            for cell in reversed(cells):
-                level = await cell.get_attribute("data-level")
-                if level and int(level) > 0:
-                    streak += 1
-                else:
-                    break
+            pages.append(first_page)
+            await self._repository_pages(
+                first_page,
+                lambda number: self._scrape_repository_page(context, username, number),
+                pages
+            )
+            return self._languages_from_repo_pages(pages)
             
-            data["contribution_streak"] = streak
+        except Exception as e:
+            print(f"Warning: Error scraping languages: {e}")
+            return []
+    
+    async def _scrape_repository_page(
+        self,
+        context: BrowserContext,
+        username: str,
+        number: int
+    ) -> Optional[Dict[str, Any]]:
+        """Load one repositories-tab page and read its repo list (None on failure)."""
+        page = await context.new_page()
+        
+        try:
+            url = self._page_url("repositories", username, page=number)
+            response = await goto_ready(page, url, self.readiness["repositories"])
+            # An abuse or error page would otherwise parse as an empty repo list
+            self._raise_for_navigation(response, url)
+            html = await page.content()
+            with measure("extraction", "repositories page"):
+                return parse_repository_list(html)
             
         except Exception as e:
-            print(f"Warning: Error scraping contributions: {e}")
+            print(f"Warning: Error scraping repositories page {number}: {e}")
+            return None
+        finally:
+            await page.close()
+    
+    async def _repository_pages(
+        self,
+        first_page: Dict[str, Any],
+        fetch_page: Callable[[int], Awaitable[Optional[Dict[str, Any]]]],
+        pages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the repositories-tab pages after the first one into pages.
         
-        return data
+        At most repo_page_concurrency pages are in flight at once, so the
+        wall time grows with pages / concurrency rather than with pages.
+        Each page is appended as soon as it is read.
+        """
+        total_pages = min(first_page["total_pages"], self.max_repo_pages)
+        semaphore = asyncio.Semaphore(self.repo_page_concurrency)
+        
+        async def bounded(number: int) -> None:
+            async with semaphore:
+                page = await fetch_page(number)
+            if page is not None:
+                pages.append(page)
+        
+        await asyncio.gather(*[bounded(number) for number in range(2, total_pages + 1)])
+        return pages
     
-    async def _scrape_languages(self, page: Page, username: str) -> List[Dict[str, Any]]:
-        """Scrape language statistics from repositories tab."""
+    def _repo_pages_completeness(self, pages: List[Dict[str, Any]]) -> float:
+        """Share of the (capped) repositories-tab pages that were read."""
+        if not pages:
+            return 0.0
+        return len(pages) / min(pages[0]["total_pages"], self.max_repo_pages)
+    
+    def _languages_from_repo_pages(self, pages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Aggregate primary languages across repositories-tab pages."""
+        return self._aggregate_languages([
+            repo["language"]
+            for page in pages
+            for repo in page["repos"]
+            if repo["language"] and self._include_repo(repo["fork"], repo["archived"])
+        ])
+    
+    def _include_repo(self, fork: bool, archived: bool) -> bool:
+        """Whether a repo counts towards the language statistics."""
+        return not (self.exclude_forks and fork) and not (self.exclude_archived and archived)
+    
+    def _aggregate_languages(
+        self,
+        repo_languages: Optional[List[str]],
+        language_sizes: Optional[Dict[str, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Count repos per primary language and format as sorted percentages.
+        
+        When language_sizes (bytes of code per language, GraphQL backend
+        only) is given, each entry also carries its "bytes".
+        """
         languages = []
+        language_counts = {}
         
-        try:
-            # Navigate to repositories tab
-            await page.goto(f"https://github.com/{username}?tab=repositories", wait_until="networkidle")
-            
-            # Collect languages from all visible repos
-            language_counts = {}
-            
-            repo_items = await page.query_selector_all("li[itemprop='owns']")
-            
-            for repo in repo_items:
-                lang_elem = await repo.query_selector("[itemprop='programmingLanguage']")
-                if lang_elem:
-                    lang = await lang_elem.inner_text()
-                    language_counts[lang] = language_counts.get(lang, 0) + 1
-            
-            # Sort by count and format
-            sorted_langs = sorted(language_counts.items(), key=lambda x: x[1], reverse=True)
-            total_repos = sum(count for _, count in sorted_langs)
+        for lang in repo_languages or []:
+            language_counts[lang] = language_counts.get(lang, 0) + 1
+        
+        # Sort by count and format
+        sorted_langs = sorted(language_counts.items(), key=lambda x: x[1], reverse=True)
+        total_repos = sum(count for _, count in sorted_langs)
+        
+        for lang, count in sorted_langs:
+            percentage = round((count / total_repos) * 100, 1) if total_repos > 0 else 0
+            entry = {
+                "name": lang,
+                "repo_count": count,
+                "percentage": percentage
+            }
+            if language_sizes is not None:
+                entry["bytes"] = language_sizes.get(lang, 0)
+            languages.append(entry)
+        
+        return languages
+    
+    def _pinned_repos_from_raw(self, items: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Build pinned repo entries from parse_pinned_repos output."""
+        pinned = []
+        
+        for item in items or []:
+            repo_data = {}
             
-            for lang, count in sorted_langs:
-                percentage = round((count / total_repos) * 100, 1) if total_repos > 0 else 0
-                languages.append({
-                    "name": lang,
-                    "repo_count": count,
-                    "percentage": percentage
-                })
+            for key in ("name", "description", "language"):
+                if item[key] is not None:
+                    repo_data[key] = item[key]
             
-            # Go back to main profile
-            await page.goto(f"https://github.com/{username}", wait_until="networkidle")
+            for key in ("stars", "forks"):
+                if item[key] is not None:
+                    repo_data[key] = self._parse_count(item[key])
             
-        except Exception as e:
-            print(f"Warning: Error scraping languages: {e}")
+            if repo_data.get("name"):
+                pinned.append(repo_data)
         
-        return languages
+        return pinned
     
-    async def _scrape_pinned_repos(self, page: Page) -> List[Dict[str, Any]]:
-        """Scrape pinned repository information."""
-        pinned = []
+    async def _activity_within_deadline(
+        self,
+        username: str,
+        pinned_repos: List[Dict[str, Any]],
+        deadline: ScrapeDeadline
+    ) -> None:
+        """Attach repo activity samples to pinned_repos within the activity budget."""
+        if not self.repo_activity or "profile" in deadline.timed_out:
+            return
+        
+        sampler = RepoActivitySampler(
+            self._http_client(),
+            token=self.github_token,
+            graphql_url=self.graphql_url,
+            api_url=self.api_url,
+            concurrency=self.activity_concurrency,
+            cache=(self.cache or get_scrape_cache()) if self.use_cache else None,
+            ttl_seconds=settings.github_activity_cache_ttl
+        )
+        repos = sampler.select(username, pinned_repos, self.activity_top_n)
+        samples: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        
+        await deadline.run(
+            "activity",
+            sampler.sample(repos, samples),
+            partial=lambda: samples,
+            completeness=lambda: len(samples) / len(repos) if repos else 1.0
+        )
+        sampler.attach(username, pinned_repos, samples)
+    
+    async def _history_within_deadline(
+        self,
+        username: str,
+        profile_data: Dict[str, Any],
+        deadline: ScrapeDeadline
+    ) -> Optional[Dict[str, Any]]:
+        """Contribution history from the year calendars fetched within the history budget."""
+        if not self.contribution_history:
+            return None
+        if "profile" in deadline.timed_out:
+            # The account's years were never read
+            return None
+        
+        years, guessed = self._history_years(profile_data.get("contribution_years"))
+        calendars: List[YearCalendar] = []
+        
+        return await deadline.run(
+            "history",
+            self._scrape_history(username, years, guessed, calendars),
+            partial=lambda: summarize_history(calendars, trim_empty=guessed),
+            completeness=lambda: len(calendars) / len(years)
+        )
+    
+    def _history_years(self, contribution_years: Optional[List[int]]) -> Tuple[List[int], bool]:
+        """
+        Calendar years to fetch, newest first, capped at history_max_years.
+        
+        Returns:
+            (years, guessed): guessed is True when the profile listed no years
+            and the last history_max_years were assumed instead
+        """
+        if contribution_years:
+            return sorted(contribution_years, reverse=True)[:self.history_max_years], False
+        
+        current_year = datetime.utcnow().year
+        return list(range(current_year, current_year - self.history_max_years, -1)), True
+    
+    async def _scrape_history(
+        self,
+        username: str,
+        years: List[int],
+        guessed: bool,
+        calendars: Optional[List[YearCalendar]] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch the contribution calendar of every year concurrently.
+        
+        The year calendars are server-rendered fragments, so they are read
+        over the pooled HTTP client (at most history_concurrency at once)
+        and packed as they arrive into calendars.
+        """
+        calendars = [] if calendars is None else calendars
+        semaphore = asyncio.Semaphore(self.history_concurrency)
+        
+        async def fetch(year: int) -> None:
+            async with semaphore:
+                html = await self._fetch_html(
+                    self._page_url("contributions_year", username, year=year),
+                    f"{year} contribution graph"
+                )
+            if html is None:
+                return
+            try:
+                with measure("extraction", "history calendars"):
+                    calendars.append(YearCalendar.from_calendar(year, parse_contribution_calendar(html)))
+            except Exception as e:
+                print(f"Warning: Error parsing {year} contribution graph: {e}")
+        
+        await asyncio.gather(*[fetch(year) for year in years])
+        return summarize_history(calendars, trim_empty=guessed)
+    
+    async def _scrape_history_graphql(self, username: str, years: List[int]) -> Dict[str, Any]:
+        """Contribution history from one aliased GraphQL request."""
+        years, guessed = self._history_years(years)
         
         try:
-            pinned_items = await page.query_selector_all("div.pinned-item-list-item-content")
-            
-            for item in pinned_items:
-                repo_data = {}
-                
-                # Repo name
-                name_elem = await item.query_selector("span.repo")
-                if name_elem:
-                    repo_data["name"] = await name_elem.inner_text()
-                
-                # Description
-                desc_elem = await item.query_selector("p.pinned-item-desc")
-                if desc_elem:
-                    repo_data["description"] = await desc_elem.inner_text()
-                
-                # Language
-                lang_elem = await item.query_selector("[itemprop='programmingLanguage']")
-                if lang_elem:
-                    repo_data["language"] = await lang_elem.inner_text()
-                
-                # Stars
-                star_elem = await item.query_selector("a[href*='/stargazers']")
-                if star_elem:
-                    text = await star_elem.inner_text()
-                    repo_data["stars"] = self._parse_count(text)
-                
-                # Forks
-                fork_elem = await item.query_selector("a[href*='/forks']")
-                if fork_elem:
-                    text = await fork_elem.inner_text()
-                    repo_data["forks"] = self._parse_count(text)
-                
-                if repo_data.get("name"):
-                    pinned.append(repo_data)
-                    
+            history = await fetch_contribution_history(
+                username, years, token=self.github_token, url=self.graphql_url, client=self._http_client()
+            )
         except Exception as e:
-            print(f"Warning: Error scraping pinned repos: {e}")
+            print(f"Warning: Error fetching contribution history: {e}")
+            history = {}
         
-        return pinned
+        calendars = [
+            YearCalendar.from_days(year, calendar_days(calendar), calendar["totalContributions"])
+            for year, calendar in history.items()
+        ]
+        return summarize_history(calendars, trim_empty=guessed)
+    
+    async def _readmes_within_deadline(
+        self,
+        username: str,
+        pinned_repos: List[Dict],
+        deadline: ScrapeDeadline
+    ) -> float:
+        """README complexity score from the READMEs fetched within the readmes budget."""
+        if "profile" in deadline.timed_out:
+            # The pinned repos were never read, so the READMEs are unknown
+            return 0.0
+        
+        repo_count = len([repo for repo in pinned_repos or [] if repo.get("name")])
+        readmes: List[Optional[Dict[str, Any]]] = []
+        
+        return await deadline.run(
+            "readmes",
+            self._analyze_readme_complexity(username, pinned_repos, readmes),
+            partial=lambda: self._readme_score(readmes),
+            completeness=lambda: (
+                len([readme for readme in readmes if readme is not None]) / repo_count
+                if repo_count else 1.0
+            )
+        )
     
     async def _analyze_readme_complexity(
-        self, 
-        page: Page, 
-        username: str, 
-        pinned_repos: List[Dict]
+        self,
+        username: str,
+        pinned_repos: List[Dict],
+        readmes: Optional[List[Optional[Dict[str, Any]]]] = None
     ) -> float:
         """
-        Analyze README complexity across repositories.
+        Analyze README complexity across all pinned repositories.
+        
+        The raw README markdown of every pinned repo is fetched concurrently
+        (one small text request each, through the scrape cache) and scored
+        locally by readme_analyzer, without rendering the repository pages.
         
         Scoring factors:
         - Has README (2 points)
@@ -318,74 +1670,120 @@ class GitHubScraper:
         - Has code examples (2 points)
         - Has installation/usage sections (2 points)
         
+        Fetched READMEs are appended to readmes as they arrive, so a caller
+        that times out can still score the ones already fetched.
+        
         Returns score 0-10
         """
-        total_score = 0
-        repos_analyzed = 0
+        repo_names = [repo.get("name") for repo in pinned_repos or [] if repo.get("name")]
+        readmes = [] if readmes is None else readmes
+        
+        async def fetch(repo_name: str) -> None:
+            # Pinned repos of other owners are named "owner/name" on the profile
+            owner, _, name = repo_name.rpartition("/")
+            readmes.append(await self._fetch_readme(owner or username, name))
+        
+        await asyncio.gather(*[fetch(repo_name) for repo_name in repo_names])
+        return self._readme_score(readmes)
+    
+    def _readme_score(self, readmes: List[Optional[Dict[str, Any]]]) -> float:
+        """Average README score over the fetched READMEs (failed fetches skipped)."""
+        with measure("extraction", "readme scoring"):
+            scores = [
+                self._score_readme_content(markdown_features(readme["markdown"]))
+                for readme in readmes
+                if readme is not None
+            ]
+        
+        # Return average score
+        if scores:
+            return round(sum(scores) / len(scores), 1)
+        return 0.0
+    
+    async def _fetch_readme(self, username: str, repo_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a repository's raw README through the single-flight and cache layers.
+        
+        Returns:
+            {"filename", "markdown"} (markdown None if the repo has no README),
+            or None if the fetch failed
+        """
+        key = f"readme:{username.lower()}/{repo_name.lower()}"
+        # READMEs read from a mirror or another API never serve live scrapes
+        urls = self._digest(self._url_config())
+        if urls != self._digest(self._url_config(defaults=True)):
+            key += f":urls={urls}"
+        fetch = lambda: self._fetch_raw_readme(username, repo_name)
         
         try:
-            # Analyze up to 3 pinned repos
-            repos_to_check = pinned_repos[:3] if pinned_repos else []
+            if self.use_cache:
+                cache = self.cache or get_scrape_cache()
+                return await get_single_flight().do(key, lambda: cache.get_or_fetch(key, fetch))
+            return await get_single_flight().do(key, fetch)
+        except Exception as e:
+            print(f"Warning: Error fetching README for {repo_name}: {e}")
+            return None
+    
+    async def _fetch_raw_readme(self, username: str, repo_name: str) -> Dict[str, Any]:
+        """
+        Fetch a repository's README as raw text.
+        
+        With an API token the REST readme endpoint resolves the file name
+        itself, so each repo costs one request (the filename is then None).
+        Without one, README_FILENAMES are tried on the raw file origin.
+        """
+        client = self._http_client()
+        
+        if self.github_token:
+            response = await client.get(
+                f"{self.api_url}/repos/{username}/{repo_name}/readme",
+                headers={
+                    "Accept": "application/vnd.github.raw",
+                    "Authorization": f"Bearer {self.github_token}"
+                }
+            )
+            if response.status_code == 404:
+                return {"filename": None, "markdown": None}
+            response.raise_for_status()
+            return {"filename": None, "markdown": response.text}
+        
+        for filename in self.README_FILENAMES:
+            response = await client.get(self._page_url("readme", username, repo=repo_name, filename=filename))
+            if response.status_code == 404:
+                continue
+            response.raise_for_status()
+            return {"filename": filename, "markdown": response.text}
+        
+        return {"filename": None, "markdown": None}
+    
+    def _score_readme_content(self, readme: Optional[Dict[str, Any]]) -> int:
+        """Score readme_analyzer.markdown_features() output on the 0-10 scale."""
+        readme_score = 0
+        
+        # Check for README
+        if readme:
+            readme_score += 2  # Has README
             
-            for repo in repos_to_check:
-                repo_name = repo.get("name")
-                if not repo_name:
-                    continue
-                
-                try:
-                    await page.goto(
-                        f"https://github.com/{username}/{repo_name}",
-                        wait_until="networkidle",
-                        timeout=10000
-                    )
-                    
-                    readme_score = 0
-                    
-                    # Check for README
-                    readme_elem = await page.query_selector("article.markdown-body")
-                    if readme_elem:
-                        readme_score += 2  # Has README
-                        
-                        readme_text = await readme_elem.inner_text()
-                        
-                        # Length check
-                        if len(readme_text) > 500:
-                            readme_score += 2
-                        
-                        # Check for images
-                        images = await readme_elem.query_selector_all("img")
-                        if len(images) > 0:
-                            readme_score += 2
-                        
-                        # Check for code blocks
-                        code_blocks = await readme_elem.query_selector_all("pre")
-                        if len(code_blocks) > 0:
-                            readme_score += 2
-                        
-                        # Check for common sections
-                        readme_lower = readme_text.lower()
-                        if any(section in readme_lower for section in ["installation", "usage", "getting started", "how to use"]):
-                            readme_score += 2
-                    
-                    total_score += min(readme_score, 10)
-                    repos_analyzed += 1
-                    
-                except PlaywrightTimeout:
-                    continue
-                except Exception as e:
-                    print(f"Warning: Error analyzing README for {repo_name}: {e}")
-                    continue
+            readme_text = readme["text"]
             
-            # Navigate back to profile
-            await page.goto(f"https://github.com/{username}", wait_until="networkidle")
+            # Length check
+            if len(readme_text) > 500:
+                readme_score += 2
             
-        except Exception as e:
-            print(f"Warning: Error in README analysis: {e}")
+            # Check for images
+            if readme["images"] > 0:
+                readme_score += 2
+            
+            # Check for code blocks
+            if readme["code_blocks"] > 0:
+                readme_score += 2
+            
+            # Check for common sections
+            readme_lower = readme_text.lower()
+            if any(section in readme_lower for section in ["installation", "usage", "getting started", "how to use"]):
+                readme_score += 2
         
-        # Return average score
-        if repos_analyzed > 0:
-            return round(total_score / repos_analyzed, 1)
-        return 0.0
+        return min(readme_score, 10)
     
     def _parse_count(self, text: str) -> int:
         """Parse count from text like '1.2k' or '500'."""
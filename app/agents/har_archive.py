@@ -0,0 +1,329 @@
+"""
+HAR Record/Replay - The Researcher Agent
+
+Deterministic offline scraper runs. A HarRecorder saves every network
+exchange of a scraper session to a HAR 1.2 file on disk; a HarReplayer
+serves those exchanges back without any network:
+1. Playwright: recorded with the context's record_har_path option and
+   replayed through a "**/*" route handler
+2. httpx (HTTP and GraphQL backends): recorded with a response event hook
+   and replayed through an httpx.MockTransport
+
+Replay can add fixed latency plus seeded jitter to every response, so
+concurrency and timeout behaviour can be load-tested reproducibly.
+
+Usage:
+    scraper = GitHubScraper(har_mode="record", har_path="har/octocat.har")
+    await scraper.scrape("https://github.com/octocat")       # live, saved
+    
+    scraper = GitHubScraper(har_mode="replay", har_path="har/octocat.har", har_latency_ms=200)
+    await scraper.scrape("https://github.com/octocat")       # offline
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import base64
+import json
+import random
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import httpx
+from playwright.async_api import BrowserContext, Page, Route
+
+from .http_client import create_http_client
+
+
+# Headers that describe the wire encoding rather than the (decoded) body
+HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+# Headers never written to disk (GitHub token, LinkedIn session cookies
+# sent by the browser and rotated by LinkedIn)
+SECRET_HEADERS = {"authorization", "cookie", "set-cookie"}
+
+
+class HarArchive:
+    """In-memory HAR log with (method, url, body) lookup."""
+    
+    def __init__(self, entries: Optional[List[Dict[str, Any]]] = None):
+        """
+        Initialize the archive.
+        
+        Args:
+            entries: HAR entries (log.entries)
+        """
+        self.entries: List[Dict[str, Any]] = []
+        self._index: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        for entry in entries or []:
+            self.add(entry)
+    
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "HarArchive":
+        """Load a HAR file (an empty archive if it does not exist)."""
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f)["log"]["entries"])
+    
+    @staticmethod
+    def redact(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Strip credentials from an entry's request and response before it is saved."""
+        for message in (entry["request"], entry.get("response")):
+            if message is None:
+                continue
+            message["headers"] = [
+                header for header in message.get("headers") or []
+                if header["name"].lower() not in SECRET_HEADERS
+            ]
+            message["cookies"] = []
+        return entry
+    
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Append an entry; the latest entry for a request wins on lookup."""
+        self.entries.append(entry)
+        request = entry["request"]
+        post_data = (request.get("postData") or {}).get("text") or ""
+        self._index[(request["method"].upper(), request["url"], post_data)] = entry
+    
+    def lookup(self, method: str, url: str, body: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Find the recorded entry for a request."""
+        return self._index.get((method.upper(), url, body or ""))
+    
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the archive as a HAR 1.2 file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "log": {
+                    "version": "1.2",
+                    "creator": {"name": "Recruiter Copilot", "version": "1.0.0"},
+                    "entries": self.entries
+                }
+            }, f)
+    
+    @staticmethod
+    def response_body(entry: Dict[str, Any]) -> bytes:
+        """Decode the recorded response body."""
+        content = entry["response"].get("content") or {}
+        text = content.get("text") or ""
+        if content.get("encoding") == "base64":
+            return base64.b64decode(text)
+        return text.encode("utf-8")
+    
+    @staticmethod
+    def response_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """Recorded response headers, minus the wire-encoding ones."""
+        return {
+            header["name"]: header["value"]
+            for header in entry["response"].get("headers") or []
+            if header["name"].lower() not in HOP_HEADERS
+        }
+
+
+class HarRecorder:
+    """
+    Records a scraper session into a HAR file.
+    
+    Playwright contexts write their own HAR part file (see context_options);
+    httpx exchanges are captured by the client returned from http_client().
+    save() writes everything recorded so far to har_path.
+    """
+    
+    def __init__(self, har_path: Union[str, Path]):
+        """
+        Initialize the recorder.
+        
+        Args:
+            har_path: HAR file written by save()
+        """
+        self.har_path = Path(har_path)
+        self.archive = HarArchive()
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def context_options(self) -> Dict[str, Any]:
+        """new_context() options recording the context into a fresh part file."""
+        part_path = self.har_path.with_name(f"{self.har_path.name}.{uuid.uuid4().hex[:8]}.part")
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+        return {"record_har_path": str(part_path), "record_har_content": "embed"}
+    
+    def collect(self, context_options: Dict[str, Any]) -> None:
+        """Merge the part file of a closed context into the archive."""
+        part_path = Path(context_options["record_har_path"])
+        if not part_path.exists():
+            return
+        for entry in HarArchive.load(part_path).entries:
+            self.archive.add(HarArchive.redact(entry))
+        part_path.unlink()
+    
+    def http_client(self) -> httpx.AsyncClient:
+        """HTTP client whose exchanges are recorded."""
+        if self._client is None or self._client.is_closed:
+            self._client = create_http_client(event_hooks={"response": [self._record_response]})
+        return self._client
+    
+    def save(self) -> None:
+        """Write everything recorded so far to har_path."""
+        self.archive.save(self.har_path)
+    
+    async def close(self) -> None:
+        """Close the recording HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+    
+    async def _record_response(self, response: httpx.Response) -> None:
+        """httpx response hook: append the exchange as a HAR entry."""
+        await response.aread()
+        request = response.request
+        content_type = response.headers.get("content-type", "")
+        
+        entry_request = {
+            "method": request.method,
+            "url": str(request.url),
+            "httpVersion": response.http_version,
+            "headers": [{"name": name, "value": value} for name, value in request.headers.items()],
+            "queryString": [],
+            "cookies": [],
+            "headersSize": -1,
+            "bodySize": len(request.content)
+        }
+        if request.content:
+            entry_request["postData"] = {
+                "mimeType": request.headers.get("content-type", ""),
+                "text": request.content.decode("utf-8", errors="replace")
+            }
+        
+        try:
+            content = {"size": len(response.content), "mimeType": content_type, "text": response.content.decode("utf-8")}
+        except UnicodeDecodeError:
+            content = {
+                "size": len(response.content),
+                "mimeType": content_type,
+                "text": base64.b64encode(response.content).decode("ascii"),
+                "encoding": "base64"
+            }
+        
+        elapsed_ms = round(response.elapsed.total_seconds() * 1000, 1)
+        self.archive.add(HarArchive.redact({
+            "startedDateTime": datetime.utcnow().isoformat() + "Z",
+            "time": elapsed_ms,
+            "request": entry_request,
+            "response": {
+                "status": response.status_code,
+                "statusText": response.reason_phrase,
+                "httpVersion": response.http_version,
+                "headers": [{"name": name, "value": value} for name, value in response.headers.items()],
+                "cookies": [],
+                "content": content,
+                "redirectURL": response.headers.get("location", ""),
+                "headersSize": -1,
+                "bodySize": len(response.content)
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": elapsed_ms, "receive": 0}
+        }))
+
+
+class HarReplayer:
+    """
+    Serves a recorded HAR file to Playwright and httpx with no network.
+    
+    Requests missing from the archive fail like a dropped connection
+    (aborted route / httpx.ConnectError) and are counted in report().
+    """
+    
+    def __init__(
+        self,
+        har_path: Union[str, Path],
+        latency_ms: int = 0,
+        jitter_ms: int = 0,
+        seed: Optional[int] = 0
+    ):
+        """
+        Initialize the replayer.
+        
+        Args:
+            har_path: HAR file to serve
+            latency_ms: Artificial delay added to every response
+            jitter_ms: Extra random delay of up to this many ms per response
+            seed: Seed for the jitter (None for non-reproducible jitter)
+        """
+        self.archive = HarArchive.load(har_path)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._random = random.Random(seed)
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        self.served = 0
+        self.missing: List[str] = []
+    
+    async def attach(self, target: Union[BrowserContext, Page]) -> None:
+        """Install the replay route handler on a context or page."""
+        await target.route("**/*", self._handle_route)
+    
+    def http_client(self) -> httpx.AsyncClient:
+        """HTTP client answered from the archive."""
+        if self._client is None or self._client.is_closed:
+            # Replays never reach the real hosts, so they are not rate limited
+            self._client = create_http_client(rate_limited=False, transport=httpx.MockTransport(self._handle_request))
+        return self._client
+    
+    def report(self) -> Dict[str, Any]:
+        """Return the replay statistics."""
+        return {
+            "served": self.served,
+            "missing": len(self.missing),
+            "missing_urls": self.missing[:20]
+        }
+    
+    async def close(self) -> None:
+        """Close the replay HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+    
+    async def _delay(self) -> None:
+        """Sleep for the configured latency plus jitter."""
+        delay_ms = self.latency_ms + (self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+    
+    async def _handle_route(self, route: Route) -> None:
+        """Fulfill a Playwright request from the archive."""
+        request = route.request
+        entry = self.archive.lookup(request.method, request.url, request.post_data)
+        
+        await self._delay()
+        
+        if entry is None:
+            self.missing.append(request.url)
+            await route.abort("internetdisconnected")
+            return
+        
+        self.served += 1
+        await route.fulfill(
+            status=entry["response"]["status"],
+            headers=HarArchive.response_headers(entry),
+            body=HarArchive.response_body(entry)
+        )
+    
+    async def _handle_request(self, request: httpx.Request) -> httpx.Response:
+        """MockTransport handler: answer an httpx request from the archive."""
+        body = request.content.decode("utf-8", errors="replace") if request.content else None
+        entry = self.archive.lookup(request.method, str(request.url), body)
+        
+        await self._delay()
+        
+        if entry is None:
+            self.missing.append(str(request.url))
+            raise httpx.ConnectError(f"No recorded response for {request.method} {request.url}", request=request)
+        
+        self.served += 1
+        return httpx.Response(
+            status_code=entry["response"]["status"],
+            headers=HarArchive.response_headers(entry),
+            content=HarArchive.response_body(entry),
+            request=request
+        )
@@ -0,0 +1,21 @@
+"""
+HTML Parsing Helpers - The Researcher Agent
+
+Text helpers shared by the selectolax page parsers (github_parsers.py and
+linkedin_parsers.py), so both read text the way a browser's innerText
+would.
+
+Author: Recruiter Copilot
+"""
+from typing import Any, Optional
+
+
+def select_text(tree: Any, selector: str) -> Optional[str]:
+    """Text of the first node matching selector, or None."""
+    node = tree.css_first(selector)
+    return node_text(node) if node is not None else None
+
+
+def node_text(node: Any) -> str:
+    """Node text with whitespace collapsed (close to innerText)."""
+    return " ".join(node.text(separator=" ").split())
@@ -0,0 +1,72 @@
+"""
+Shared HTTP Client - The Researcher Agent
+
+A single pooled httpx.AsyncClient reused by every browserless fetch
+(server-rendered GitHub pages, raw files, APIs). Reusing it keeps TCP/TLS
+connections alive across candidates instead of reconnecting per request.
+
+The client is created lazily and closed by the FastAPI lifespan.
+
+Author: Recruiter Copilot
+"""
+from typing import Any, Optional
+import httpx
+
+from .browser_pool import DEFAULT_USER_AGENT
+from .rate_limiter import RateLimitedTransport, get_rate_limiter
+from .scrape_timings import HTTP_EVENT_HOOKS
+from ..config import settings
+
+
+# Singleton instance
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client(rate_limited: bool = True, **options: Any) -> httpx.AsyncClient:
+    """
+    Create an HTTP client with the scraper defaults.
+    
+    Args:
+        rate_limited: Route requests through the shared per-host rate limiter
+            (when settings.scraper_rate_limit_enabled)
+        **options: Extra httpx.AsyncClient options (transport, event_hooks, ...);
+            the scrape timing hooks run before the given event_hooks
+    """
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_connections
+    )
+    
+    if rate_limited and settings.scraper_rate_limit_enabled:
+        transport = options.pop("transport", None) or httpx.AsyncHTTPTransport(limits=limits)
+        options["transport"] = RateLimitedTransport(transport, get_rate_limiter())
+    
+    event_hooks = options.pop("event_hooks", {})
+    options["event_hooks"] = {
+        event: HTTP_EVENT_HOOKS[event] + list(event_hooks.get(event, []))
+        for event in ("request", "response")
+    }
+    
+    return httpx.AsyncClient(
+        headers={"User-Agent": DEFAULT_USER_AGENT},
+        follow_redirects=True,
+        timeout=httpx.Timeout(settings.http_timeout),
+        limits=limits,
+        **options
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled HTTP client."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the pooled HTTP client (called on shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
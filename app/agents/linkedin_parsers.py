@@ -0,0 +1,105 @@
+"""
+LinkedIn HTML Parsers - The Researcher Agent
+
+Extractors for LinkedIn profile pages that run on the page's HTML instead
+of the live page. LinkedInScraper takes one page.content() snapshot and
+parses it here, rather than paying a browser roundtrip per query_selector()
+and inner_text() call; the same functions run on saved pages (see
+benchmarks/).
+
+Author: Recruiter Copilot
+"""
+from typing import Any, Dict, List, Optional
+from selectolax.lexbor import LexborHTMLParser
+
+from .html_parsing import node_text, select_text
+
+
+# Login form, auth wall and captcha: the page is not a profile
+BLOCKED_SELECTORS = ("form.login-form", "div.authwall-join-form", "div#captcha-challenge")
+
+# Entries kept per section (most recent first, as LinkedIn lists them)
+MAX_EXPERIENCE = 5
+MAX_EDUCATION = 3
+MAX_SKILLS = 20
+
+
+def parse_blocked(html: str) -> bool:
+    """True if the page is a login form, auth wall or captcha."""
+    tree = LexborHTMLParser(html)
+    return any(tree.css_first(selector) is not None for selector in BLOCKED_SELECTORS)
+
+
+def parse_profile_header(html: str) -> Dict[str, Optional[str]]:
+    """Parse name, headline, location and the about section."""
+    tree = LexborHTMLParser(html)
+    return {
+        "name": select_text(tree, "h1.text-heading-xlarge"),
+        "headline": select_text(tree, "div.text-body-medium"),
+        "location": select_text(tree, "span.text-body-small.inline"),
+        "about": select_text(tree, "section.pv-about-section div.inline-show-more-text")
+    }
+
+
+def parse_experience(html: str) -> List[Dict[str, str]]:
+    """Parse work experience entries (title, company, duration)."""
+    experiences = []
+    for item in _section_items(html, "experience")[:MAX_EXPERIENCE]:
+        exp = _fields(item, {
+            "title": "span[aria-hidden='true']",
+            "company": "span.t-14.t-normal",
+            "duration": "span.t-14.t-normal.t-black--light"
+        })
+        if exp.get("title"):
+            experiences.append(exp)
+    return experiences
+
+
+def parse_education(html: str) -> List[Dict[str, str]]:
+    """Parse education entries (school, degree)."""
+    education = []
+    for item in _section_items(html, "education")[:MAX_EDUCATION]:
+        edu = _fields(item, {
+            "school": "span[aria-hidden='true']",
+            "degree": "span.t-14.t-normal"
+        })
+        if edu.get("school"):
+            education.append(edu)
+    return education
+
+
+def parse_skills(html: str) -> List[str]:
+    """Parse the skills list (deduplicated, in page order)."""
+    section = LexborHTMLParser(html).css_first("section#skills")
+    if section is None:
+        return []
+    
+    skills = []
+    for item in section.css("span[aria-hidden='true']")[:MAX_SKILLS]:
+        skill_text = node_text(item)
+        if skill_text and len(skill_text) < 50:  # Filter out non-skill text
+            skills.append(skill_text)
+    return list(dict.fromkeys(skills))
+
+
+def _section_items(html: str, section_id: str) -> List[Any]:
+    """List items of a profile section (empty if the section is missing)."""
+    section = LexborHTMLParser(html).css_first(f"section#{section_id}")
+    if section is None:
+        return []
+    return section.css("li.artdeco-list__item")
+
+
+def _fields(item: Any, selectors: Dict[str, str]) -> Dict[str, str]:
+    """Text of each selector found in item, keyed by field name."""
+    fields = {}
+    for key, selector in selectors.items():
+        node = item.css_first(selector)
+        if node is None:
+            continue
+        # LinkedIn repeats each value in a span.visually-hidden for screen
+        # readers; the aria-hidden copy is the one on screen
+        value = select_text(node, "span[aria-hidden='true']") or node_text(node)
+        if value:
+            fields[key] = value
+    return fields
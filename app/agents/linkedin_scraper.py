@@ -12,139 +12,302 @@ IMPORTANT: LinkedIn scraping may violate their ToS. Use responsibly.
 Author: Recruiter Copilot
 """
 import asyncio
-import json
 import re
+from contextlib import asynccontextmanager
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional, Any
-from playwright.async_api import async_playwright, Browser, Page
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Any
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+from .browser_pool import DEFAULT_USER_AGENT
+from .circuit_breaker import classify_error
+from .har_archive import HarRecorder, HarReplayer
+from .linkedin_parsers import (
+    BLOCKED_SELECTORS,
+    parse_blocked,
+    parse_education,
+    parse_experience,
+    parse_profile_header,
+    parse_skills
+)
+from .linkedin_session import COOKIES_FILE, VIEWPORT, auth_file, get_linkedin_session, load_storage_state
+from .rate_limiter import HostRateLimiter, get_rate_limiter
+from .readiness import goto_ready
+from .resource_blocker import ResourceBlocker
+from .scrape_timings import ScrapeTimings, measure
+from .single_flight import get_single_flight
+from ..config import settings
 
 
 class LinkedInScraper:
     """
     Playwright-based LinkedIn profile scraper with cookie injection.
     
-    Requires cookies from an authenticated LinkedIn session.
+    Requires cookies from an authenticated LinkedIn session. Live scrapes
+    open a page on the warm, already-authenticated context of the
+    process-wide LinkedInSession (see linkedin_session.py).
     """
     
-    COOKIES_FILE = Path(__file__).parent.parent.parent.parent / "linkedin_cookies.json"
+    COOKIES_FILE = COOKIES_FILE
+    
+    # First-party hosts allowed through the resource blocker
+    ALLOWED_HOSTS = ("linkedin.com", "licdn.com")
+    
+    # Selectors the profile extractors need (see readiness.py); the login,
+    # auth wall and captcha pages end the wait early
+    READINESS = {
+        "profile": {
+            "selectors": ["h1.text-heading-xlarge"],
+            "terminal": list(BLOCKED_SELECTORS),
+            "timeout": 30000,
+            # Profiles without an experience section must not wait out the timeout
+            "optional": ["section#experience"],
+            "optional_timeout": 2000
+        }
+    }
+    
+    # Fallback response message per failure reason
+    FALLBACK_MESSAGES = {
+        "circuit_open": "LinkedIn scraping is paused after repeated blocked or failed scrapes. Please update cookies or skip LinkedIn analysis.",
+        "error": "LinkedIn scraping was blocked or cookies expired. Please update cookies or skip LinkedIn analysis."
+    }
     
-    def __init__(self, headless: bool = True, slow_mo: int = 100):
+    def __init__(
+        self,
+        headless: bool = True,
+        slow_mo: int = 0,
+        block_resources: Optional[bool] = None,
+        allowed_hosts: Optional[List[str]] = None,
+        javascript_enabled: bool = True,
+        har_mode: Optional[str] = None,
+        har_path: Optional[str] = None,
+        har_latency_ms: int = 0,
+        har_jitter_ms: int = 0,
+        persistent_session: Optional[bool] = None
+    ):
         """
         Initialize the LinkedIn scraper.
         
         Args:
-            headless: Run browser in headless mode
-            slow_mo: Slow down operations by milliseconds
+            headless: Run a private browser in headless mode (the shared
+                session follows settings.browser_headless)
+            slow_mo: Slow down a private browser by milliseconds (for debugging)
+            block_resources: Abort images/fonts/css/media and third-party hosts
+                (defaults to settings.scraper_block_resources)
+            allowed_hosts: Host allow-list for the resource blocker
+            javascript_enabled: Set False to load the server-rendered HTML only
+            har_mode: "record" to save every exchange to har_path, "replay"
+                to serve them from har_path with no network (or cookies)
+            har_path: HAR file for har_mode
+            har_latency_ms: Artificial latency per replayed response
+            har_jitter_ms: Extra random (seeded) latency per replayed response
+            persistent_session: Scrape on the shared authenticated session
+                (defaults to settings.linkedin_persistent_session); False
+                launches a private browser per scrape
         """
         self.headless = headless
         self.slow_mo = slow_mo
+        self.block_resources = settings.scraper_block_resources if block_resources is None else block_resources
+        self.allowed_hosts = allowed_hosts or list(self.ALLOWED_HOSTS)
+        self.javascript_enabled = javascript_enabled
+        self.persistent_session = (
+            settings.linkedin_persistent_session if persistent_session is None else persistent_session
+        )
+        
+        if har_mode not in (None, "record", "replay"):
+            raise ValueError(f"Unknown HAR mode: {har_mode}")
+        if har_mode and not har_path:
+            raise ValueError("har_path is required with har_mode")
+        self.har_mode = har_mode
+        self.har_path = har_path
+        self.har_recorder = HarRecorder(har_path) if har_mode == "record" else None
+        self.har_replayer = (
+            HarReplayer(har_path, latency_ms=har_latency_ms, jitter_ms=har_jitter_ms)
+            if har_mode == "replay" else None
+        )
+        
         self.browser: Optional[Browser] = None
-        self.cookies_loaded = False
     
     async def scrape(self, linkedin_url: str) -> Optional[Dict[str, Any]]:
         """
         Scrape a LinkedIn profile.
         
+        Concurrent scrapes of the same profile with the same options share
+        one browser session (see single_flight.py). The result carries a
+        "timings" block with the navigation timing breakdown and the time
+        per extraction step (see scrape_timings.py).
+        
         Args:
             linkedin_url: Full LinkedIn profile URL
         
         Returns:
             Dictionary with profile data or None if blocked/failed
         """
-        if not self._cookies_exist():
+        return await get_single_flight().do(
+            self._flight_key(linkedin_url),
+            lambda: self._timed(self._scrape(linkedin_url))
+        )
+    
+    def _flight_key(self, linkedin_url: str) -> str:
+        """
+        Single-flight key for a profile.
+        
+        Every option that changes how the page is loaded is part of the key,
+        so a scrape never receives a result produced under another scraper's
+        settings. Options at their defaults are left out, keeping the common
+        key "linkedin:<profile>".
+        """
+        options = {
+            "javascript": self.javascript_enabled,
+            "blocking": self.block_resources,
+            "session": "persistent" if self.persistent_session else "private",
+            "har": f"{self.har_mode}:{self.har_path}" if self.har_mode else None
+        }
+        defaults = {
+            "javascript": True,
+            "blocking": settings.scraper_block_resources,
+            "session": "persistent" if settings.linkedin_persistent_session else "private",
+            "har": None
+        }
+        key = f"linkedin:{self._normalize_url(linkedin_url)}"
+        for name in sorted(options):
+            value = options[name]
+            if value != defaults[name]:
+                key += f":{name}" if value is True else f":{name}={value}"
+        return key
+    
+    async def _timed(self, scrape: Awaitable[Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """Await a scrape and attach its "timings" block (settings.scraper_timings_enabled)."""
+        if not settings.scraper_timings_enabled:
+            return await scrape
+        
+        timings = ScrapeTimings()
+        with timings.active():
+            result = await scrape
+        if result is not None:
+            result["timings"] = timings.report()
+        return result
+    
+    async def _scrape(self, linkedin_url: str) -> Optional[Dict[str, Any]]:
+        """Scrape a LinkedIn profile on one page of an authenticated session."""
+        if not self.har_replayer and not self._cookies_exist():
             print("LinkedIn cookies not found. Please export cookies first.")
             print(f"Expected location: {self.COOKIES_FILE}")
-            return self._get_fallback_response(linkedin_url)
+            return self.fallback_response(linkedin_url, "no_cookies")
         
-        async with async_playwright() as p:
-            self.browser = await p.chromium.launch(
-                headless=self.headless,
-                slow_mo=self.slow_mo
-            )
-            
-            try:
-                context = await self.browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    viewport={"width": 1920, "height": 1080}
-                )
+        try:
+            async with self._page() as page:
+                # Fast mode: skip images, fonts, stylesheets and trackers
+                blocker = ResourceBlocker(self.allowed_hosts) if self.block_resources else None
+                if blocker:
+                    await blocker.attach(page)
                 
-                # Load cookies
-                await self._load_cookies(context)
+                # Navigate to profile
+                with measure("phases", "navigation"):
+                    response = await goto_ready(page, linkedin_url, self.READINESS["profile"])
                 
-                page = await context.new_page()
+                # An error page or LinkedIn's 999 is not worth parsing
+                if response is not None and response.status >= 500:
+                    print(f"LinkedIn returned HTTP {response.status}.")
+                    return self.fallback_response(linkedin_url, "server_error")
+                if response is not None and HostRateLimiter.is_throttled(response.status, response.headers):
+                    print(f"LinkedIn throttled the request (HTTP {response.status}).")
+                    return self.fallback_response(linkedin_url, "blocked")
                 
-                # Navigate to profile
-                await page.goto(linkedin_url, wait_until="networkidle", timeout=30000)
+                # One snapshot of the rendered page; the extractors parse it offline
+                with measure("extraction", "page content"):
+                    html = await page.content()
                 
                 # Check if we're logged in and can see the profile
-                if await self._is_blocked(page):
+                with measure("extraction", "blocked check"):
+                    blocked = parse_blocked(html)
+                if blocked:
                     print("LinkedIn blocked access or session expired.")
-                    return self._get_fallback_response(linkedin_url)
+                    return self.fallback_response(linkedin_url, "blocked")
                 
                 # Extract profile data
-                data = await self._extract_profile_data(page)
+                with measure("phases", "extraction"):
+                    data = self._extract_profile_data(html)
                 data["linkedin_url"] = linkedin_url
                 data["scraped_at"] = datetime.utcnow().isoformat()
+                if blocker:
+                    data["resource_blocking"] = blocker.report()
+                if self.har_replayer:
+                    data["har_replay"] = self.har_replayer.report()
                 
                 return data
                 
-            except Exception as e:
-                print(f"LinkedIn scraping failed: {e}")
-                return self._get_fallback_response(linkedin_url)
-            finally:
-                await self.browser.close()
-    
-    def _cookies_exist(self) -> bool:
-        """Check if cookies file exists."""
-        return self.COOKIES_FILE.exists()
-    
-    async def _load_cookies(self, context) -> None:
-        """Load cookies from file into browser context."""
-        try:
-            with open(self.COOKIES_FILE, "r") as f:
-                cookies = json.load(f)
-            
-            # Format cookies for Playwright
-            formatted_cookies = []
-            for cookie in cookies:
-                formatted = {
-                    "name": cookie.get("name"),
-                    "value": cookie.get("value"),
-                    "domain": cookie.get("domain", ".linkedin.com"),
-                    "path": cookie.get("path", "/"),
-                }
-                if cookie.get("expires"):
-                    formatted["expires"] = cookie["expires"]
-                formatted_cookies.append(formatted)
-            
-            await context.add_cookies(formatted_cookies)
-            self.cookies_loaded = True
-            
         except Exception as e:
-            print(f"Failed to load cookies: {e}")
+            print(f"LinkedIn scraping failed: {e}")
+            return self.fallback_response(linkedin_url, classify_error(e) or "error")
     
-    async def _is_blocked(self, page: Page) -> bool:
-        """Check if we're blocked or logged out."""
-        # Check for login wall
-        login_form = await page.query_selector("form.login-form")
-        if login_form:
-            return True
+    @asynccontextmanager
+    async def _page(self) -> AsyncIterator[Page]:
+        """
+        Yield a page for one scrape.
         
-        # Check for auth wall
-        auth_wall = await page.query_selector("div.authwall-join-form")
-        if auth_wall:
-            return True
+        Live scrapes get a page on the shared LinkedInSession when it is
+        running (started by the FastAPI lifespan or the scraper worker). HAR
+        modes, persistent_session=False and standalone runs launch a private
+        browser for this scrape only.
+        """
+        session = get_linkedin_session()
+        if self.persistent_session and session.running and not (self.har_recorder or self.har_replayer):
+            async with session.page(self.javascript_enabled) as page:
+                yield page
+            return
         
-        # Check for challenge page
-        challenge = await page.query_selector("div#captcha-challenge")
-        if challenge:
-            return True
+        context_options = self.har_recorder.context_options() if self.har_recorder else {}
+        # A replayed session needs no cookies
+        if not self.har_replayer:
+            context_options["storage_state"] = load_storage_state(auth_file(self.COOKIES_FILE))
         
-        return False
+        async with async_playwright() as p:
+            self.browser = await p.chromium.launch(
+                headless=self.headless,
+                slow_mo=self.slow_mo
+            )
+            
+            context: Optional[BrowserContext] = None
+            try:
+                context = await self.browser.new_context(
+                    user_agent=DEFAULT_USER_AGENT,
+                    viewport=VIEWPORT,
+                    java_script_enabled=self.javascript_enabled,
+                    **context_options
+                )
+                
+                if self.har_replayer:
+                    await self.har_replayer.attach(context)
+                elif settings.scraper_rate_limit_enabled:
+                    # Pace requests per host and back off on 429/999
+                    await get_rate_limiter().attach(context)
+                
+                yield await context.new_page()
+            finally:
+                # The HAR is written when the context closes, before the browser
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        print(f"Warning: Error closing LinkedIn context: {e}")
+                await self.browser.close()
+                if self.har_recorder:
+                    self.har_recorder.collect(context_options)
+                    self.har_recorder.save()
+    
+    def _normalize_url(self, linkedin_url: str) -> str:
+        """Reduce a profile URL to a comparable identity, e.g. "in/jane-doe"."""
+        url = linkedin_url.strip().lower().split("?")[0].split("#")[0].rstrip("/")
+        url = re.sub(r"^https?://", "", url)
+        url = re.sub(r"^([a-z]{2,3}\.|www\.)?linkedin\.com/", "", url)
+        return url
     
-    async def _extract_profile_data(self, page: Page) -> Dict[str, Any]:
-        """Extract all available profile data."""
+    def _cookies_exist(self) -> bool:
+        """Check if the cookies (or storage_state) file exists."""
+        return auth_file(self.COOKIES_FILE).exists()
+    
+    def _extract_profile_data(self, html: str) -> Dict[str, Any]:
+        """Extract all available profile data from the page HTML."""
         data = {
             "name": None,
             "headline": None,
@@ -157,138 +320,41 @@ class LinkedInScraper:
         }
         
         try:
-            # Name
-            name_elem = await page.query_selector("h1.text-heading-xlarge")
-            if name_elem:
-                data["name"] = await name_elem.inner_text()
-            
-            # Headline
-            headline_elem = await page.query_selector("div.text-body-medium")
-            if headline_elem:
-                data["headline"] = await headline_elem.inner_text()
-            
-            # Location
-            location_elem = await page.query_selector("span.text-body-small.inline")
-            if location_elem:
-                data["location"] = await location_elem.inner_text()
-            
-            # About section
-            about_section = await page.query_selector("section.pv-about-section")
-            if about_section:
-                about_text = await about_section.query_selector("div.inline-show-more-text")
-                if about_text:
-                    data["about"] = await about_text.inner_text()
+            with measure("extraction", "profile header"):
+                data.update(parse_profile_header(html))
             
             # Experience
-            data["experience"] = await self._extract_experience(page)
+            with measure("extraction", "experience"):
+                data["experience"] = parse_experience(html)
             
             # Education
-            data["education"] = await self._extract_education(page)
+            with measure("extraction", "education"):
+                data["education"] = parse_education(html)
             
             # Skills
-            data["skills"] = await self._extract_skills(page)
+            with measure("extraction", "skills"):
+                data["skills"] = parse_skills(html)
             
         except Exception as e:
             print(f"Error extracting LinkedIn data: {e}")
         
         return data
     
-    async def _extract_experience(self, page: Page) -> List[Dict[str, Any]]:
-        """Extract work experience."""
-        experiences = []
-        
-        try:
-            exp_section = await page.query_selector("section#experience")
-            if not exp_section:
-                return experiences
-            
-            exp_items = await exp_section.query_selector_all("li.artdeco-list__item")
-            
-            for item in exp_items[:5]:  # Limit to 5 most recent
-                exp = {}
-                
-                # Title
-                title_elem = await item.query_selector("span[aria-hidden='true']")
-                if title_elem:
-                    exp["title"] = await title_elem.inner_text()
-                
-                # Company
-                company_elem = await item.query_selector("span.t-14.t-normal")
-                if company_elem:
-                    exp["company"] = await company_elem.inner_text()
-                
-                # Duration
-                duration_elem = await item.query_selector("span.t-14.t-normal.t-black--light")
-                if duration_elem:
-                    exp["duration"] = await duration_elem.inner_text()
-                
-                if exp.get("title"):
-                    experiences.append(exp)
-                    
-        except Exception as e:
-            print(f"Error extracting experience: {e}")
-        
-        return experiences
-    
-    async def _extract_education(self, page: Page) -> List[Dict[str, Any]]:
-        """Extract education history."""
-        education = []
-        
-        try:
-            edu_section = await page.query_selector("section#education")
-            if not edu_section:
-                return education
-            
-            edu_items = await edu_section.query_selector_all("li.artdeco-list__item")
-            
-            for item in edu_items[:3]:
-                edu = {}
-                
-                # School
-                school_elem = await item.query_selector("span[aria-hidden='true']")
-                if school_elem:
-                    edu["school"] = await school_elem.inner_text()
-                
-                # Degree
-                degree_elem = await item.query_selector("span.t-14.t-normal")
-                if degree_elem:
-                    edu["degree"] = await degree_elem.inner_text()
-                
-                if edu.get("school"):
-                    education.append(edu)
-                    
-        except Exception as e:
-            print(f"Error extracting education: {e}")
-        
-        return education
-    
-    async def _extract_skills(self, page: Page) -> List[str]:
-        """Extract skills list."""
-        skills = []
-        
-        try:
-            skills_section = await page.query_selector("section#skills")
-            if not skills_section:
-                return skills
-            
-            skill_items = await skills_section.query_selector_all("span[aria-hidden='true']")
-            
-            for item in skill_items[:20]:  # Limit to 20 skills
-                skill_text = await item.inner_text()
-                if skill_text and len(skill_text) < 50:  # Filter out non-skill text
-                    skills.append(skill_text.strip())
-                    
-        except Exception as e:
-            print(f"Error extracting skills: {e}")
+    @classmethod
+    def fallback_response(cls, linkedin_url: str, reason: str = "error") -> Dict[str, Any]:
+        """
+        Return a fallback response when scraping fails.
         
-        return list(set(skills))  # Remove duplicates
-    
-    def _get_fallback_response(self, linkedin_url: str) -> Dict[str, Any]:
-        """Return a fallback response when scraping fails."""
+        Args:
+            linkedin_url: Profile URL that was not scraped
+            reason: "no_cookies", "blocked", "timeout", "server_error",
+                "circuit_open" or "error" (see circuit_breaker.py)
+        """
         return {
             "linkedin_url": linkedin_url,
             "status": "scraping_failed",
-            "message": "LinkedIn scraping was blocked or cookies expired. Please update cookies or skip LinkedIn analysis.",
+            "reason": reason,
+            "message": cls.FALLBACK_MESSAGES.get(reason, cls.FALLBACK_MESSAGES["error"]),
             "scraped_at": datetime.utcnow().isoformat()
         }
     
@@ -0,0 +1,408 @@
+"""
+LinkedIn Session - Warm authenticated browser for the Researcher Agent
+
+Every LinkedIn scrape used to launch Chromium, re-read the cookie export and
+build a fresh BrowserContext before it could open the profile. This module
+keeps one authenticated context alive per process and hands out a page on
+it per scrape:
+1. The context is built once from the cookie export (linkedin_cookies.json)
+   or a Playwright storage_state file (settings.linkedin_storage_state)
+2. The auth file's mtime is checked on every lease; only a changed file is
+   re-read, and the old context is closed after its last in-flight page
+3. Cookies LinkedIn rotates during a scrape stay in the context for the next
+4. The browser is launched on the first lease and relaunched if it died
+5. Like the browser pool, a memory governor recycles the browser after too
+   many pages or past an RSS limit; the new contexts carry over the cookies
+   of the old ones, which close after their last in-flight page
+
+The session is started/stopped by the FastAPI lifespan in app/main.py (and
+by each scraper worker, see scraper_service.py).
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+
+from .browser_pool import DEFAULT_USER_AGENT, chromium_rss_mb, launch_chromium
+from .rate_limiter import get_rate_limiter
+from ..config import settings
+
+
+COOKIES_FILE = Path(__file__).parent.parent.parent.parent / "linkedin_cookies.json"
+
+VIEWPORT = {"width": 1920, "height": 1080}
+
+
+def auth_file(cookies_file: Path = COOKIES_FILE) -> Path:
+    """The configured storage_state file if it exists, else the cookie export."""
+    if settings.linkedin_storage_state:
+        storage_state = Path(settings.linkedin_storage_state)
+        if storage_state.exists():
+            return storage_state
+    return cookies_file
+
+
+def load_storage_state(path: Path) -> Dict[str, Any]:
+    """
+    Read an auth file as a Playwright storage_state.
+    
+    Accepts a storage_state saved by Playwright ({"cookies": [...],
+    "origins": [...]}) or a cookie-editor export (a list of cookies).
+    
+    Raises:
+        ValueError: If the file holds neither
+    """
+    with open(path, "r") as f:
+        data = json.load(f)
+    
+    if isinstance(data, dict) and "cookies" in data:
+        return {"cookies": data["cookies"], "origins": data.get("origins", [])}
+    if not isinstance(data, list):
+        raise ValueError(f"{path} is neither a cookie list nor a storage_state")
+    
+    # Format cookies for Playwright
+    cookies = []
+    for cookie in data:
+        formatted = {
+            "name": cookie.get("name"),
+            "value": cookie.get("value"),
+            "domain": cookie.get("domain", ".linkedin.com"),
+            "path": cookie.get("path", "/"),
+        }
+        if cookie.get("expires"):
+            formatted["expires"] = cookie["expires"]
+        cookies.append(formatted)
+    return {"cookies": cookies, "origins": []}
+
+
+class LinkedInSession:
+    """
+    Process-wide authenticated LinkedIn BrowserContext.
+    
+    Usage:
+        session = LinkedInSession()
+        await session.start()
+        async with session.page() as page:
+            await page.goto("https://www.linkedin.com/in/jane-doe")
+        await session.close()
+    """
+    
+    def __init__(
+        self,
+        cookies_file: Path = COOKIES_FILE,
+        headless: bool = True,
+        slow_mo: int = 0,
+        user_agent: str = DEFAULT_USER_AGENT,
+        max_pages: int = 0,
+        max_rss_mb: int = 0,
+        memory_check_interval: float = 5.0
+    ):
+        """
+        Initialize the session (no browser is launched until the first page).
+        
+        Args:
+            cookies_file: Cookie export used when no storage_state is configured
+            headless: Run browser in headless mode
+            slow_mo: Slow down operations by specified milliseconds (for debugging)
+            user_agent: User agent of the session's contexts
+            max_pages: Recycle the browser after serving this many pages (0 = never)
+            max_rss_mb: Recycle the browser when its Chromium process tree
+                exceeds this resident memory in MB (0 = never)
+            memory_check_interval: Minimum seconds between RSS measurements
+        """
+        self.cookies_file = cookies_file
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.user_agent = user_agent
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.memory_check_interval = memory_check_interval
+        
+        self.browser: Optional[Browser] = None
+        self._playwright: Optional[Playwright] = None
+        self._lock: Optional[asyncio.Lock] = None
+        
+        # One context per java_script_enabled value, all built from the same auth file
+        self._contexts: Dict[bool, BrowserContext] = {}
+        self._leases: Dict[BrowserContext, int] = {}
+        self._retired: List[BrowserContext] = []
+        self._auth_key: Optional[Tuple[str, int]] = None
+        self._auth_state: Optional[Dict[str, Any]] = None
+        self.auth_loaded_at: Optional[str] = None
+        
+        # Memory governor state: recycled browsers close once their contexts have
+        self._draining: List[Browser] = []
+        self._browser_pages = 0
+        self._browser_pid: Optional[int] = None
+        self._driver_pid: Optional[int] = None
+        self._rss_mb: Optional[float] = None
+        self._rss_checked_at = 0.0
+        
+        self.stats = {
+            "pages_served": 0,
+            "contexts_created": 0,
+            "auth_loads": 0,
+            "browser_launches": 0,
+            "browser_recycles": 0
+        }
+    
+    @property
+    def running(self) -> bool:
+        """True once start() has been called and close() has not."""
+        return self._playwright is not None
+    
+    async def start(self) -> None:
+        """Start Playwright (the browser is launched by the first lease)."""
+        if self.running:
+            return
+        
+        self._lock = asyncio.Lock()
+        self._playwright = await async_playwright().start()
+    
+    async def close(self) -> None:
+        """Close the session's contexts, the browser and Playwright."""
+        if not self.running:
+            return
+        
+        for context in [*self._contexts.values(), *self._retired]:
+            await self._close_context(context)
+        self._contexts.clear()
+        self._retired.clear()
+        self._leases.clear()
+        self._auth_key = None
+        self._auth_state = None
+        
+        for browser in [*self._draining, self.browser]:
+            if browser:
+                await self._close_browser(browser)
+        self._draining.clear()
+        self.browser = None
+        
+        await self._playwright.stop()
+        self._playwright = None
+    
+    @asynccontextmanager
+    async def page(self, javascript_enabled: bool = True) -> AsyncIterator[Page]:
+        """
+        Open a page on the authenticated context for one scrape.
+        
+        The page is closed on exit; the context and its cookies stay warm.
+        
+        Args:
+            javascript_enabled: Set False for a context that loads the
+                server-rendered HTML only
+        
+        Raises:
+            FileNotFoundError: If neither auth file exists
+            ValueError: If the auth file cannot be read as cookies
+        """
+        if not self.running:
+            raise RuntimeError("LinkedInSession is not started")
+        
+        async with self._lock:
+            context = await self._acquire(javascript_enabled)
+            self._leases[context] = self._leases.get(context, 0) + 1
+        
+        try:
+            page = await context.new_page()
+            self.stats["pages_served"] += 1
+            if context.browser is self.browser:
+                self._browser_pages += 1
+            try:
+                yield page
+            finally:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+        finally:
+            if context in self._leases:
+                self._leases[context] -= 1
+            await self._close_retired()
+    
+    def report(self) -> Dict[str, Any]:
+        """Session state, auth file and counters."""
+        if not self.running:
+            return {"status": "stopped"}
+        
+        return {
+            "status": "healthy" if self.browser and self.browser.is_connected() else "idle",
+            "auth_file": self._auth_key[0] if self._auth_key else None,
+            "auth_loaded_at": self.auth_loaded_at,
+            "contexts": len(self._contexts),
+            "in_flight": sum(self._leases.values()),
+            "retired": len(self._retired),
+            "draining": len(self._draining),
+            "browser_pages": self._browser_pages,
+            "browser_pid": self._browser_pid,
+            "rss_mb": self._rss_mb,
+            "max_pages": self.max_pages,
+            "max_rss_mb": self.max_rss_mb,
+            **self.stats
+        }
+    
+    async def _acquire(self, javascript_enabled: bool) -> BrowserContext:
+        """Return the warm context, rebuilding it if the auth file or browser changed."""
+        await self._ensure_browser()
+        await self._govern()
+        
+        path = auth_file(self.cookies_file)
+        auth_key = (str(path), path.stat().st_mtime_ns)
+        if auth_key != self._auth_key:
+            state = load_storage_state(path)
+            if self._auth_key is not None:
+                print(f"🔑 LinkedIn auth file changed ({path.name}), rebuilding the session")
+            self._retire_contexts()
+            self._auth_key = auth_key
+            self._auth_state = state
+            self.auth_loaded_at = datetime.utcnow().isoformat()
+            self.stats["auth_loads"] += 1
+        
+        context = self._contexts.get(javascript_enabled)
+        if context is None:
+            context = await self.browser.new_context(
+                user_agent=self.user_agent,
+                viewport=VIEWPORT,
+                java_script_enabled=javascript_enabled,
+                storage_state=self._auth_state
+            )
+            # Pace requests per host and back off on 429/999
+            if settings.scraper_rate_limit_enabled:
+                await get_rate_limiter().attach(context)
+            self._contexts[javascript_enabled] = context
+            self.stats["contexts_created"] += 1
+        return context
+    
+    def _retire_contexts(self) -> None:
+        """Stop leasing the current contexts; each closes after its last page."""
+        self._retired.extend(self._contexts.values())
+        self._contexts.clear()
+    
+    async def _close_retired(self) -> None:
+        """Close retired contexts whose last page has been released, then drained browsers."""
+        for context in list(self._retired):
+            if self._leases.get(context, 0) > 0:
+                continue
+            self._retired.remove(context)
+            self._leases.pop(context, None)
+            await self._close_context(context)
+        
+        for browser in list(self._draining):
+            if any(context.browser is browser for context in self._retired):
+                continue
+            self._draining.remove(browser)
+            await self._close_browser(browser)
+    
+    async def _close_context(self, context: BrowserContext) -> None:
+        """Close a context, ignoring errors from an already-dead browser."""
+        if settings.scraper_rate_limit_enabled:
+            get_rate_limiter().detach(context)
+        try:
+            await context.close()
+        except Exception:
+            pass
+    
+    async def _ensure_browser(self) -> None:
+        """Launch the browser if it is missing or disconnected."""
+        if self.browser and self.browser.is_connected():
+            return
+        
+        if self.browser:
+            print("⚠️ LinkedIn session browser disconnected, relaunching...")
+        # Contexts die with their browser; the auth file is re-read for the new one
+        self._retire_contexts()
+        self._auth_key = None
+        await self._launch_browser()
+    
+    def _measure_rss(self) -> Optional[float]:
+        """RSS of the current browser in MB, re-measured at most every memory_check_interval."""
+        if self._browser_pid is None:
+            return None
+        
+        now = time.monotonic()
+        if now - self._rss_checked_at >= self.memory_check_interval:
+            self._rss_mb = chromium_rss_mb(self._browser_pid)
+            self._rss_checked_at = now
+        return self._rss_mb
+    
+    async def _govern(self) -> None:
+        """Recycle the browser if it crossed the page-count or RSS threshold."""
+        # One recycle at a time: wait for the previous browser to drain
+        if self._draining:
+            return
+        
+        reason = None
+        if self.max_pages and self._browser_pages >= self.max_pages:
+            reason = "pages"
+        elif self.max_rss_mb and self._browser_pages:
+            rss_mb = self._measure_rss()
+            if rss_mb is not None and rss_mb >= self.max_rss_mb:
+                reason = "rss"
+        
+        if reason:
+            await self._recycle(reason)
+    
+    async def _recycle(self, reason: str) -> None:
+        """Move the session to a fresh browser and drain the current one."""
+        in_flight = sum(self._leases.get(context, 0) for context in self._contexts.values())
+        print(
+            f"♻️ Recycling LinkedIn session browser ({reason}): {self._browser_pages} pages served, "
+            f"{self._rss_mb} MB RSS, {in_flight} scrapes draining"
+        )
+        
+        # Carry the cookies LinkedIn rotated into the new browser's contexts
+        context = self._contexts.get(True) or self._contexts.get(False)
+        if context:
+            try:
+                self._auth_state = await context.storage_state()
+            except Exception as e:
+                print(f"Warning: Could not save LinkedIn session cookies, reusing the auth file's: {e}")
+        
+        self._retire_contexts()
+        self._draining.append(self.browser)
+        await self._launch_browser()
+        self.stats["browser_recycles"] += 1
+        await self._close_retired()
+    
+    async def _close_browser(self, browser: Browser) -> None:
+        """Close a browser, ignoring errors from an already-dead process."""
+        try:
+            await browser.close()
+        except Exception as e:
+            print(f"Warning: Error closing LinkedIn session browser: {e}")
+    
+    async def _launch_browser(self) -> None:
+        """Launch a fresh Chromium instance."""
+        self.browser, self._browser_pid, self._driver_pid = await launch_chromium(
+            self._playwright,
+            self._driver_pid,
+            headless=self.headless,
+            slow_mo=self.slow_mo
+        )
+        self._browser_pages = 0
+        self._rss_mb = None
+        self._rss_checked_at = 0.0
+        self.stats["browser_launches"] += 1
+
+
+# Singleton instance
+_linkedin_session: Optional[LinkedInSession] = None
+
+
+def get_linkedin_session() -> LinkedInSession:
+    """Get the process-wide LinkedIn session instance."""
+    global _linkedin_session
+    if _linkedin_session is None:
+        _linkedin_session = LinkedInSession(
+            headless=settings.browser_headless,
+            slow_mo=settings.linkedin_slow_mo,
+            max_pages=settings.linkedin_session_max_pages,
+            max_rss_mb=settings.linkedin_session_max_rss_mb
+        )
+    return _linkedin_session
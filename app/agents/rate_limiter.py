@@ -0,0 +1,331 @@
+"""
+Per-Host Rate Limiter - The Researcher Agent
+
+Concurrent scrapes (scrape_many, parallel pipelines) would trip GitHub's
+abuse limits and LinkedIn's bot detection. Every scraper request goes
+through one shared token bucket per host:
+1. Requests wait for a token (rate = requests per second, burst = bucket size)
+2. 429, GitHub secondary-rate-limit 403s and LinkedIn's 999 responses block
+   the host for Retry-After / the rate-limit reset / an exponential backoff,
+   and halve the host's rate
+3. Successful responses restore the rate gradually (additive increase)
+
+httpx clients are limited by RateLimitedTransport (which also retries
+throttled requests); Playwright contexts by a route handler plus a
+response listener (see attach()).
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import httpx
+from playwright.async_api import BrowserContext, Page, Response, Route
+
+from ..config import settings
+
+
+class _Bucket:
+    """Token bucket state for one host."""
+    
+    def __init__(self, rate: float, burst: int):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.backoff = 0.0
+        self.lock = asyncio.Lock()
+        
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+    
+    def refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update (none while blocked)."""
+        accrued_since = max(self.updated, self.blocked_until)
+        if now > accrued_since:
+            self.tokens = min(self.burst, self.tokens + (now - accrued_since) * self.rate)
+        self.updated = now
+
+
+class HostRateLimiter:
+    """
+    Shared async token-bucket rate limiter keyed by host.
+    
+    Usage:
+        limiter = get_rate_limiter()
+        await limiter.acquire("https://github.com/octocat")
+        limiter.observe("https://github.com/octocat", response.status_code, response.headers)
+    """
+    
+    # Per-host (requests per second, burst) overrides, matched by domain suffix
+    HOST_LIMITS = {
+        "raw.githubusercontent.com": (10.0, 20),
+        "api.github.com": (10.0, 20),
+        "linkedin.com": (0.5, 2)
+    }
+    
+    # Playwright resource types that count as requests against a host
+    LIMITED_RESOURCE_TYPES = {"document", "xhr", "fetch"}
+    
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: int = 5,
+        max_backoff: float = 60.0,
+        host_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        share: float = 1.0
+    ):
+        """
+        Initialize the limiter.
+        
+        Args:
+            rate: Default requests per second per host
+            burst: Default bucket size (requests allowed back-to-back)
+            max_backoff: Longest a throttled host is blocked, in seconds
+            host_limits: Per-host (rate, burst) overriding HOST_LIMITS
+            share: Fraction of every host's rate and burst this limiter may
+                use (scraper service workers split the limits between them)
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_backoff = max_backoff
+        self.host_limits = {**self.HOST_LIMITS, **(host_limits or {})}
+        self.share = share
+        self._buckets: Dict[str, _Bucket] = {}
+    
+    async def acquire(self, url_or_host: str) -> float:
+        """
+        Wait until the host has a token and take it.
+        
+        Returns:
+            Seconds spent waiting
+        """
+        host = self._host(url_or_host)
+        bucket = self._bucket(host)
+        started = time.monotonic()
+        
+        # Waiters queue on the lock, so tokens are handed out in FIFO order
+        async with bucket.lock:
+            while True:
+                now = time.monotonic()
+                bucket.refill(now)
+                
+                if now < bucket.blocked_until:
+                    await asyncio.sleep(bucket.blocked_until - now)
+                    continue
+                if bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    break
+                await asyncio.sleep((1 - bucket.tokens) / bucket.rate)
+        
+        waited = time.monotonic() - started
+        bucket.requests += 1
+        bucket.total_wait += waited
+        bucket.max_wait = max(bucket.max_wait, waited)
+        return waited
+    
+    def observe(
+        self,
+        url_or_host: str,
+        status: int,
+        headers: Any,
+        body: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Feed a response back into the limiter.
+        
+        Args:
+            url_or_host: Request URL or host
+            status: HTTP status code
+            headers: Response headers (case-insensitive mapping)
+            body: Response text, only needed to recognise 403 secondary limits
+        
+        Returns:
+            The backoff in seconds if the response was throttled, else None
+        """
+        host = self._host(url_or_host)
+        bucket = self._bucket(host)
+        
+        if not self.is_throttled(status, headers, body):
+            if status < 400 and bucket.rate < bucket.base_rate:
+                # Additive increase back towards the configured rate
+                bucket.rate = min(bucket.base_rate, bucket.rate + bucket.base_rate * 0.1)
+                bucket.backoff = 0.0
+            return None
+        
+        delay = self._retry_after(headers)
+        if delay is None:
+            bucket.backoff = min(self.max_backoff, max(1.0, bucket.backoff * 2))
+            delay = bucket.backoff
+        delay = min(delay, self.max_backoff)
+        
+        bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+        bucket.rate = max(bucket.base_rate * 0.1, bucket.rate / 2)
+        bucket.tokens = 0.0
+        bucket.throttled += 1
+        
+        print(f"⚠️ Rate limited by {host} (HTTP {status}), backing off {delay:.1f}s")
+        return delay
+    
+    @staticmethod
+    def is_throttled(status: int, headers: Any, body: Optional[str] = None) -> bool:
+        """Recognise 429s, LinkedIn's 999 and GitHub's secondary-limit 403s."""
+        if status in (429, 999):
+            return True
+        if status == 403:
+            if headers.get("x-ratelimit-remaining") == "0":
+                return True
+            return "rate limit" in (body or "").lower()
+        return False
+    
+    def report(self) -> Dict[str, Any]:
+        """Current tokens, rates and wait-time metrics per host."""
+        now = time.monotonic()
+        hosts = {}
+        
+        for host, bucket in self._buckets.items():
+            bucket.refill(now)
+            hosts[host] = {
+                "tokens": round(bucket.tokens, 2),
+                "rate": round(bucket.rate, 3),
+                "base_rate": bucket.base_rate,
+                "burst": bucket.burst,
+                "requests": bucket.requests,
+                "throttled": bucket.throttled,
+                "blocked_for_seconds": round(max(0.0, bucket.blocked_until - now), 1),
+                "total_wait_seconds": round(bucket.total_wait, 2),
+                "mean_wait_seconds": round(bucket.total_wait / bucket.requests, 3) if bucket.requests else 0.0,
+                "max_wait_seconds": round(bucket.max_wait, 2)
+            }
+        
+        return hosts
+    
+    async def attach(self, target: Union[BrowserContext, Page]) -> None:
+        """Rate-limit a Playwright context or page (call detach() before reuse)."""
+        await target.route("**/*", self._handle_route)
+        target.on("response", self._on_response)
+    
+    def detach(self, target: Union[BrowserContext, Page]) -> None:
+        """Remove the response listener added by attach()."""
+        target.remove_listener("response", self._on_response)
+    
+    async def _handle_route(self, route: Route) -> None:
+        """Wait for a token, then hand over to the next route handler."""
+        request = route.request
+        if request.resource_type in self.LIMITED_RESOURCE_TYPES:
+            await self.acquire(request.url)
+        await route.fallback()
+    
+    async def _on_response(self, response: Response) -> None:
+        """Feed Playwright responses back for throttling detection."""
+        if response.request.resource_type not in self.LIMITED_RESOURCE_TYPES:
+            return
+        
+        body = None
+        if response.status == 403:
+            try:
+                body = await response.text()
+            except Exception:
+                body = None
+        self.observe(response.url, response.status, response.headers, body)
+    
+    def _bucket(self, host: str) -> _Bucket:
+        """Get or create the bucket for host."""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, burst = self.rate, self.burst
+            for domain, limits in self.host_limits.items():
+                if host == domain or host.endswith("." + domain):
+                    rate, burst = limits
+                    break
+            bucket = self._buckets[host] = _Bucket(rate * self.share, max(1, round(burst * self.share)))
+        return bucket
+    
+    @staticmethod
+    def _host(url_or_host: str) -> str:
+        """Normalize a URL or bare host to a lower-case host name."""
+        if "://" in url_or_host:
+            return (urlparse(url_or_host).hostname or "").lower()
+        return url_or_host.lower()
+    
+    @staticmethod
+    def _retry_after(headers: Any) -> Optional[float]:
+        """Seconds to wait from Retry-After or an exhausted rate-limit reset."""
+        retry_after = headers.get("retry-after")
+        if retry_after and retry_after.strip().isdigit():
+            return float(retry_after)
+        
+        reset = headers.get("x-ratelimit-reset")
+        if headers.get("x-ratelimit-remaining") == "0" and reset and reset.isdigit():
+            return max(1.0, int(reset) - time.time())
+        
+        return None
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that takes a token per request and retries throttled responses."""
+    
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        limiter: HostRateLimiter,
+        max_retries: int = 2
+    ):
+        """
+        Initialize the transport.
+        
+        Args:
+            transport: Transport that actually sends the requests
+            limiter: Rate limiter shared with the other clients
+            max_retries: Retries of a throttled request after its backoff
+        """
+        self.transport = transport
+        self.limiter = limiter
+        self.max_retries = max_retries
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request once the host has a token, retrying after throttling."""
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire(request.url.host)
+            response = await self.transport.handle_async_request(request)
+            
+            body = None
+            if response.status_code == 403:
+                await response.aread()
+                body = response.content.decode("utf-8", errors="replace")
+            
+            delay = self.limiter.observe(request.url.host, response.status_code, response.headers, body)
+            if delay is None or attempt == self.max_retries:
+                return response
+            
+            # The next acquire() waits out the backoff
+            await response.aclose()
+        
+        return response
+    
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
+
+
+# Singleton instance
+_rate_limiter: Optional[HostRateLimiter] = None
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Get the process-wide rate limiter instance."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = HostRateLimiter(
+            rate=settings.scraper_rate_limit_rps,
+            burst=settings.scraper_rate_limit_burst,
+            max_backoff=settings.scraper_rate_limit_max_backoff,
+            share=settings.scraper_rate_limit_share
+        )
+    return _rate_limiter
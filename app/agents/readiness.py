@@ -0,0 +1,116 @@
+"""
+Page Readiness - Selector-driven navigation waits for the Researcher Agent
+
+Waiting for "networkidle" means waiting for 500 ms of network silence,
+which long-polling pages (GitHub) rarely give us before the timeout.
+Instead, each scrape phase declares the selectors its extractor needs:
+
+    {
+        "selectors": ["h2.f4.text-normal.mb-2"],   # all must be attached
+        "terminal": ["img[alt='404']"],            # any one ends the wait early
+        "timeout": 15000,                          # phase budget in ms
+        "optional": ["section#experience"],        # waited for briefly, if at all
+        "optional_timeout": 2000                   # ms the optional selectors get
+    }
+
+goto_ready() waits for DOMContentLoaded (so every server-rendered element
+is parsed) and then returns as soon as the DOM satisfies the spec. It never
+raises on a selector timeout: the extractors then work with whatever
+is on the page, exactly as they would for a missing element. An error
+response (4xx/5xx) is returned without waiting, since its page never
+carries the phase selectors; the caller decides what the status means.
+
+While a scrape is being timed (see scrape_timings.py), every goto_ready()
+navigation is recorded with the page's Navigation Timing breakdown.
+
+Author: Recruiter Copilot
+"""
+import time
+from typing import Any, Dict, Optional
+from playwright.async_api import Page, Response, TimeoutError as PlaywrightTimeout
+
+from .scrape_timings import current_timings
+
+
+async def goto_ready(page: Page, url: str, spec: Dict[str, Any]) -> Optional[Response]:
+    """
+    Navigate to a URL and wait until the phase selectors are attached.
+    
+    Images, stylesheets and long-polling requests are not waited for.
+    
+    Args:
+        page: Playwright page to navigate
+        url: Target URL
+        spec: Readiness spec with "selectors", "terminal" and "timeout" (ms)
+    
+    Returns:
+        The navigation response (None for same-document navigations)
+    
+    Raises:
+        PlaywrightTimeout: If the document itself does not load in time
+    """
+    timeout = spec.get("timeout", 15000)
+    deadline = time.monotonic() + timeout / 1000
+    started = time.perf_counter()
+    
+    response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+    if response is None or response.status < 400:
+        await wait_ready(page, spec, deadline)
+    
+    timings = current_timings()
+    if timings is not None:
+        await timings.record_page(page, url, response, started)
+    return response
+
+
+async def wait_ready(page: Page, spec: Dict[str, Any], deadline: Optional[float] = None) -> bool:
+    """
+    Wait until every required selector (or any terminal selector) is attached,
+    then give the optional selectors up to "optional_timeout" ms.
+    
+    Args:
+        page: Playwright page to inspect
+        spec: Readiness spec with "selectors", "terminal" and "timeout" (ms)
+        deadline: Absolute time.monotonic() deadline (defaults to now + timeout)
+    
+    Returns:
+        True if the page became ready, False if the phase budget ran out
+    """
+    if deadline is None:
+        deadline = time.monotonic() + spec.get("timeout", 15000) / 1000
+    
+    terminal = list(spec.get("terminal", []))
+    
+    for selector in spec.get("selectors", []):
+        remaining_ms = (deadline - time.monotonic()) * 1000
+        if remaining_ms <= 0:
+            return False
+        
+        # A selector list matches as soon as any member is attached, so once
+        # a terminal selector (404, auth wall, empty state) is on the page
+        # every remaining wait returns immediately
+        try:
+            await page.wait_for_selector(
+                ", ".join([selector] + terminal),
+                state="attached",
+                timeout=remaining_ms
+            )
+        except PlaywrightTimeout:
+            return False
+    
+    # Sections a page may legitimately lack (or load late) never fail the
+    # wait and never hold it up for longer than their own short budget
+    for selector in spec.get("optional", []):
+        remaining_ms = min((deadline - time.monotonic()) * 1000, spec.get("optional_timeout", 2000))
+        if remaining_ms <= 0:
+            break
+        try:
+            await page.wait_for_selector(
+                ", ".join([selector] + terminal),
+                state="attached",
+                timeout=remaining_ms
+            )
+        except PlaywrightTimeout:
+            pass
+    
+    return True
@@ -0,0 +1,43 @@
+"""
+README Analyzer - The Researcher Agent
+
+Scores raw README markdown without rendering it. The scrapers fetch each
+pinned repo's README as plain text (or get it from the GraphQL query) and
+this module extracts the {"text", "images", "code_blocks"} features that
+GitHubScraper._score_readme_content() turns into the 0-10 score.
+
+Author: Recruiter Copilot
+"""
+import re
+from typing import Any, Dict, Optional
+
+
+# ![alt](src), ![alt][ref] and inline <img> tags
+IMAGE_PATTERN = re.compile(r"!\[[^\]]*\]\s*[\(\[]|<img\b", re.IGNORECASE)
+
+# Code fence lines (``` or ~~~) and inline <pre> tags
+FENCE_PATTERN = re.compile(r"^\s*(```|~~~)", re.MULTILINE)
+PRE_PATTERN = re.compile(r"<pre\b", re.IGNORECASE)
+
+
+def markdown_features(markdown: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Extract README scoring features from raw markdown.
+    
+    Args:
+        markdown: README source text (None or empty if there is no README)
+    
+    Returns:
+        {"text", "images", "code_blocks"} or None if there is no README
+    """
+    if not markdown or not markdown.strip():
+        return None
+    
+    # Each fenced block has an opening and a closing fence
+    fenced_blocks = (len(FENCE_PATTERN.findall(markdown)) + 1) // 2
+    
+    return {
+        "text": markdown,
+        "images": len(IMAGE_PATTERN.findall(markdown)),
+        "code_blocks": fenced_blocks + len(PRE_PATTERN.findall(markdown))
+    }
@@ -0,0 +1,294 @@
+"""
+Repository Activity Sampler - The Researcher Agent
+
+Pinned repos carry names, stars and forks but nothing about recency: a
+5-year-old pinned repo looks the same as one committed to yesterday. The
+sampler fetches, for a candidate's top N repos (by stars among the pinned
+ones), the last commit date, commit count and language sizes through the
+cheapest channel available:
+1. GitHub GraphQL (with a token): one aliased request for all repos
+2. REST API (without a token, or when GraphQL fails): two small requests
+   per repo, sent as conditional requests with the cached ETags. Unchanged
+   repos come back as bodiless 304s, which only leave the rate limit alone
+   for authorized requests; anonymous ones count against the 60 requests
+   per hour an IP gets, so REST sampling is off by default without a token
+
+Results are cached per repository (repo:<owner>/<name>) and attached to the
+pinned_repos entries as "activity". The GraphQL scraper backend gets the
+same fields with its profile query and does not need the sampler.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from .github_graphql import fetch_repo_activity
+from .scrape_cache import ScrapeCache
+
+
+Repo = Tuple[str, str]
+
+# REST endpoints sampled per repository (relative to /repos/<owner>/<name>)
+REST_ENDPOINTS = {
+    "commits": "/commits?per_page=1",
+    "languages": "/languages"
+}
+
+
+def activity_from_graphql(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an activity entry from a RepoActivity GraphQL node."""
+    target = (node.get("defaultBranchRef") or {}).get("target") or {}
+    history = target.get("history") or {}
+    
+    return {
+        "last_commit_at": target.get("committedDate") or node.get("pushedAt"),
+        "commit_count": history.get("totalCount"),
+        "language_bytes": {
+            edge["node"]["name"]: edge["size"]
+            for edge in (node.get("languages") or {}).get("edges") or []
+        },
+        "source": "graphql"
+    }
+
+
+def with_recency(activity: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Add days_since_last_commit (computed on read, so cached entries stay correct)."""
+    last_commit_at = activity.get("last_commit_at")
+    days = None
+    if last_commit_at:
+        committed = datetime.fromisoformat(last_commit_at.replace("Z", "+00:00")).replace(tzinfo=None)
+        days = max(0, ((now or datetime.utcnow()) - committed).days)
+    return {**activity, "days_since_last_commit": days}
+
+
+class RepoActivitySampler:
+    """
+    Samples recency and size data for a few repositories per candidate.
+    
+    Usage:
+        sampler = RepoActivitySampler(get_http_client(), token=settings.github_token)
+        repos = sampler.select("octocat", pinned_repos, top_n=6)
+        samples = await sampler.sample(repos)
+        sampler.attach("octocat", pinned_repos, samples)
+    """
+    
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        token: Optional[str] = None,
+        graphql_url: Optional[str] = None,
+        api_url: str = "https://api.github.com",
+        concurrency: int = 4,
+        cache: Optional[ScrapeCache] = None,
+        ttl_seconds: int = 3600
+    ):
+        """
+        Initialize the sampler.
+        
+        Args:
+            client: HTTP client for the API requests
+            token: GitHub token; enables the GraphQL channel and authorizes
+                the REST requests
+            graphql_url: GraphQL endpoint (defaults to settings.github_graphql_url)
+            api_url: REST API origin
+            concurrency: Repositories sampled at once over REST
+            cache: Scrape cache holding samples and ETags (None disables caching)
+            ttl_seconds: Age up to which a cached sample is used without
+                revalidation
+        """
+        self.client = client
+        self.token = token
+        self.graphql_url = graphql_url
+        self.api_url = api_url.rstrip("/")
+        self.concurrency = max(1, concurrency)
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        
+        self.stats = {
+            "cache_hits": 0,
+            "not_modified": 0,
+            "fetched": 0,
+            "failed": 0
+        }
+    
+    @staticmethod
+    def select(username: str, pinned_repos: List[Dict[str, Any]], top_n: int) -> List[Repo]:
+        """
+        Pick the top_n pinned repos by stars.
+        
+        Pinned repos of other owners are named "owner/name" on the profile.
+        """
+        ranked = sorted(
+            (repo for repo in pinned_repos if repo.get("name")),
+            key=lambda repo: repo.get("stars") or 0,
+            reverse=True
+        )
+        selected = []
+        for repo in ranked[:top_n]:
+            owner, _, name = repo["name"].rpartition("/")
+            selected.append((owner or username, name))
+        return selected
+    
+    async def sample(self, repos: List[Repo], samples: Optional[Dict[Repo, Dict[str, Any]]] = None) -> Dict[Repo, Dict[str, Any]]:
+        """
+        Sample the activity of repos (cache first, then GraphQL or REST).
+        
+        Args:
+            repos: (owner, name) pairs
+            samples: Dict to fill as samples arrive, so a caller that times
+                out keeps the ones already taken
+        
+        Returns:
+            Mapping of (owner, name) to its activity entry (failed repos are missing)
+        """
+        samples = {} if samples is None else samples
+        pending = []
+        
+        for repo in repos:
+            cached = self._load(repo)
+            if cached is not None and cached[1] <= self.ttl_seconds:
+                self.stats["cache_hits"] += 1
+                samples[repo] = cached[0]["activity"]
+            else:
+                pending.append(repo)
+        
+        if pending and self.token:
+            try:
+                await self._sample_graphql(pending, samples)
+                # Repos GraphQL could not resolve would fail over REST too
+                pending = []
+            except Exception as e:
+                print(f"Warning: GraphQL repo sampling failed, falling back to REST: {e}")
+        
+        if pending:
+            semaphore = asyncio.Semaphore(self.concurrency)
+            
+            async def bounded(repo: Repo) -> None:
+                async with semaphore:
+                    await self._sample_rest(repo, samples)
+            
+            await asyncio.gather(*[bounded(repo) for repo in pending])
+        
+        return samples
+    
+    def attach(self, username: str, pinned_repos: List[Dict[str, Any]], samples: Dict[Repo, Dict[str, Any]]) -> None:
+        """Add each sample to its pinned_repos entry as "activity"."""
+        now = datetime.utcnow()
+        for repo in pinned_repos:
+            if not repo.get("name"):
+                continue
+            owner, _, name = repo["name"].rpartition("/")
+            activity = samples.get((owner or username, name))
+            if activity is not None:
+                repo["activity"] = with_recency(activity, now)
+    
+    def report(self) -> Dict[str, Any]:
+        """Return the sampling counters."""
+        return dict(self.stats)
+    
+    async def _sample_graphql(self, repos: List[Repo], samples: Dict[Repo, Dict[str, Any]]) -> None:
+        """Sample every repo with one aliased GraphQL request."""
+        nodes = await fetch_repo_activity(repos, token=self.token, url=self.graphql_url, client=self.client)
+        
+        for repo, node in nodes.items():
+            if node is None:
+                self.stats["failed"] += 1
+                continue
+            activity = activity_from_graphql(node)
+            self.stats["fetched"] += 1
+            samples[repo] = activity
+            self._store(repo, {"activity": activity, "etags": {}, "parts": {}})
+    
+    async def _sample_rest(self, repo: Repo, samples: Dict[Repo, Dict[str, Any]]) -> None:
+        """Sample one repo over REST, revalidating the cached parts by ETag."""
+        cached = self._load(repo)
+        entry = cached[0] if cached else {"etags": {}, "parts": {}}
+        
+        try:
+            results = await asyncio.gather(*[
+                self._fetch_part(repo, endpoint, entry["etags"].get(endpoint), entry["parts"].get(endpoint))
+                for endpoint in REST_ENDPOINTS
+            ])
+        except Exception as e:
+            self.stats["failed"] += 1
+            print(f"Warning: Error sampling activity of {repo[0]}/{repo[1]}: {e}")
+            return
+        
+        etags, parts = {}, {}
+        for endpoint, (etag, part) in zip(REST_ENDPOINTS, results):
+            etags[endpoint] = etag
+            parts[endpoint] = part
+        
+        activity = {
+            "last_commit_at": parts["commits"]["last_commit_at"],
+            "commit_count": parts["commits"]["commit_count"],
+            "language_bytes": parts["languages"],
+            "source": "rest"
+        }
+        samples[repo] = activity
+        self._store(repo, {"activity": activity, "etags": etags, "parts": parts})
+    
+    async def _fetch_part(
+        self,
+        repo: Repo,
+        endpoint: str,
+        etag: Optional[str],
+        cached_part: Optional[Any]
+    ) -> Tuple[Optional[str], Any]:
+        """
+        GET one REST endpoint, conditionally if an ETag is cached.
+        
+        Returns:
+            (etag, parsed part); the cached part when the server answers 304
+        """
+        headers = {"Accept": "application/vnd.github+json"}
+        if self.token:
+            # 304s are only exempt from the rate limit when authorized
+            headers["Authorization"] = f"Bearer {self.token}"
+        if etag and cached_part is not None:
+            headers["If-None-Match"] = etag
+        
+        owner, name = repo
+        response = await self.client.get(f"{self.api_url}/repos/{owner}/{name}{REST_ENDPOINTS[endpoint]}", headers=headers)
+        
+        if response.status_code == 304:
+            self.stats["not_modified"] += 1
+            return etag, cached_part
+        
+        # An empty repository has no commits to list
+        if endpoint == "commits" and response.status_code == 409:
+            return None, {"last_commit_at": None, "commit_count": 0}
+        
+        response.raise_for_status()
+        self.stats["fetched"] += 1
+        etag = response.headers.get("etag")
+        
+        if endpoint == "languages":
+            return etag, response.json()
+        
+        commits = response.json()
+        last_commit_at = commits[0]["commit"]["committer"]["date"] if commits else None
+        # With per_page=1 the page number of the "last" link is the commit count
+        match = re.search(r'[?&]page=(\d+)[^>]*>;\s*rel="last"', response.headers.get("link", ""))
+        commit_count = int(match.group(1)) if match else len(commits)
+        return etag, {"last_commit_at": last_commit_at, "commit_count": commit_count}
+    
+    def _load(self, repo: Repo) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Cached (entry, age in seconds) for a repo."""
+        if self.cache is None:
+            return None
+        return self.cache.peek(self._key(repo))
+    
+    def _store(self, repo: Repo, entry: Dict[str, Any]) -> None:
+        """Cache a repo's sample with its ETags."""
+        if self.cache is not None:
+            self.cache.put(self._key(repo), entry)
+    
+    @staticmethod
+    def _key(repo: Repo) -> str:
+        """Cache key of a repo (GitHub names are case-insensitive)."""
+        return f"repo:{repo[0]}/{repo[1]}".lower()
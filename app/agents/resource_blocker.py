@@ -0,0 +1,114 @@
+"""
+Resource Blocker - Fast context mode for the Researcher Agent
+
+The scrapers only read text out of the DOM, yet a normal page load pulls
+avatars, fonts, stylesheets, media and analytics beacons. This module
+installs a Playwright route on a BrowserContext that:
+1. Lets through only allow-listed resource types (document, script, xhr, fetch)
+2. Lets through only allow-listed (first-party) hosts, minus known beacons
+3. Aborts everything else and keeps per-scrape statistics
+
+Aborted requests never reach the network, so their size is estimated from
+typical payload sizes per resource type.
+
+Author: Recruiter Copilot
+"""
+from typing import Any, Dict, Iterable, Optional, Union
+from urllib.parse import urlparse
+from playwright.async_api import BrowserContext, Page, Route
+
+
+class ResourceBlocker:
+    """
+    Route interceptor that aborts non-essential requests.
+    
+    Create one blocker per scrape so the statistics describe that scrape.
+    """
+    
+    # Resource types the extractors need (the include-fragment that renders
+    # GitHub's contribution graph is fetched by script)
+    DEFAULT_ALLOWED_TYPES = ("document", "script", "xhr", "fetch")
+    
+    # First-party analytics/telemetry hosts that are blocked regardless
+    DEFAULT_BLOCKED_HOSTS = ("collector.github.com", "px.ads.linkedin.com")
+    
+    # Typical transfer size in bytes of an aborted request, by resource type
+    ESTIMATED_BYTES = {
+        "image": 20_000,
+        "media": 250_000,
+        "font": 40_000,
+        "stylesheet": 50_000,
+        "script": 60_000,
+        "xhr": 5_000,
+        "fetch": 5_000,
+        "document": 30_000,
+        "other": 5_000
+    }
+    
+    def __init__(
+        self,
+        allowed_hosts: Iterable[str],
+        allowed_resource_types: Optional[Iterable[str]] = None,
+        blocked_hosts: Optional[Iterable[str]] = None
+    ):
+        """
+        Initialize the blocker.
+        
+        Args:
+            allowed_hosts: First-party hosts; subdomains are allowed too
+            allowed_resource_types: Playwright resource types to let through
+            blocked_hosts: Hosts aborted even when they match allowed_hosts
+        """
+        self.allowed_hosts = tuple(host.strip().lower() for host in allowed_hosts if host.strip())
+        self.allowed_resource_types = set(allowed_resource_types or self.DEFAULT_ALLOWED_TYPES)
+        self.blocked_hosts = set(blocked_hosts if blocked_hosts is not None else self.DEFAULT_BLOCKED_HOSTS)
+        
+        self.allowed_requests = 0
+        self.blocked_requests = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.bytes_saved_estimate = 0
+    
+    async def attach(self, target: Union[BrowserContext, Page]) -> None:
+        """Install the route handler on a context or page."""
+        await target.route("**/*", self._handle_route)
+    
+    def is_allowed(self, url: str, resource_type: str) -> bool:
+        """Check a request against the resource-type and host allow-lists."""
+        if resource_type not in self.allowed_resource_types:
+            return False
+        
+        host = (urlparse(url).hostname or "").lower()
+        if host in self.blocked_hosts:
+            return False
+        return any(host == allowed or host.endswith("." + allowed) for allowed in self.allowed_hosts)
+    
+    def report(self) -> Dict[str, Any]:
+        """
+        Return the blocking statistics for this scrape.
+        
+        bytes_saved_estimate sums ESTIMATED_BYTES per aborted request; it
+        is not measured, as "bytes_saved_basis" states.
+        """
+        return {
+            "allowed_requests": self.allowed_requests,
+            "blocked_requests": self.blocked_requests,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "bytes_saved_estimate": self.bytes_saved_estimate,
+            "bytes_saved_basis": "typical size per blocked resource type, not measured"
+        }
+    
+    async def _handle_route(self, route: Route) -> None:
+        """Continue allowed requests and abort the rest."""
+        request = route.request
+        
+        if self.is_allowed(request.url, request.resource_type):
+            self.allowed_requests += 1
+            # Hand over to earlier-registered handlers (e.g. HAR replay)
+            await route.fallback()
+            return
+        
+        resource_type = request.resource_type
+        self.blocked_requests += 1
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        self.bytes_saved_estimate += self.ESTIMATED_BYTES.get(resource_type, self.ESTIMATED_BYTES["other"])
+        await route.abort()
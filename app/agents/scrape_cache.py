@@ -0,0 +1,257 @@
+"""
+Scrape Result Cache - The Researcher Agent
+
+Persistent TTL cache for scraper results, stored in the app database
+(scrape_cache table) so it survives restarts. The same candidates apply to
+several reqs, and their profiles rarely change within a day.
+
+Freshness policy (stale-while-revalidate):
+1. Younger than the TTL: served straight from the cache
+2. Older than the TTL but younger than the max age: the stale result is
+   served immediately and a background refresh replaces it
+3. Older than the max age (or missing): scraped inline and stored
+
+Author: Recruiter Copilot
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from ..config import settings
+from ..database import SessionLocal, ScrapeCacheEntry, engine
+
+
+class ScrapeCache:
+    """
+    Database-backed scrape cache with stale-while-revalidate.
+    
+    Usage:
+        cache = get_scrape_cache()
+        data = await cache.get_or_fetch("github:octocat", lambda: scrape_profile("octocat"))
+    """
+    
+    def __init__(self, ttl_seconds: int = 86400, max_age_seconds: int = 604800):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl_seconds: Age up to which a cached result is served as fresh
+            max_age_seconds: Hard age limit for serving a stale result
+        """
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_age = timedelta(seconds=max(ttl_seconds, max_age_seconds))
+        
+        self.stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "refresh_failures": 0
+        }
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._table_ready = False
+    
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        should_store: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return the cached result for key, scraping it when needed.
+        
+        Args:
+            key: Cache key, e.g. "github:<username>"
+            fetch: Coroutine factory performing the actual scrape
+            should_store: Predicate deciding whether a scraped result is
+                stored (e.g. to skip partial results); stores all by default
+        
+        Returns:
+            The cached or freshly scraped result
+        """
+        entry = self._load(key)
+        
+        if entry is not None:
+            data, fetched_at = entry
+            age = datetime.utcnow() - fetched_at
+            
+            if age <= self.ttl:
+                self.stats["hits"] += 1
+                return data
+            
+            if age <= self.max_age:
+                self.stats["stale_hits"] += 1
+                self._schedule_refresh(key, fetch, should_store)
+                return data
+        
+        self.stats["misses"] += 1
+        data = await fetch()
+        if should_store is None or should_store(data):
+            self._store(key, data)
+        return data
+    
+    def peek(self, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Read an entry without the freshness policy (callers that revalidate
+        it themselves, e.g. with an ETag).
+        
+        Returns:
+            (data, age in seconds), or None if key is not cached
+        """
+        entry = self._load(key)
+        if entry is None:
+            return None
+        data, fetched_at = entry
+        return data, (datetime.utcnow() - fetched_at).total_seconds()
+    
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        """Store data for key, replacing any previous entry."""
+        self._store(key, data)
+    
+    def report(self) -> Dict[str, Any]:
+        """Counters plus the hit rate and number of stored entries."""
+        lookups = self.stats["hits"] + self.stats["stale_hits"] + self.stats["misses"]
+        served = self.stats["hits"] + self.stats["stale_hits"]
+        
+        return {
+            **self.stats,
+            "hit_rate": round(served / lookups, 3) if lookups else 0.0,
+            "entries": self._count(),
+            "refreshing": len(self._refreshing),
+            "ttl_seconds": int(self.ttl.total_seconds()),
+            "max_age_seconds": int(self.max_age.total_seconds())
+        }
+    
+    def invalidate(self, key: Optional[str] = None) -> int:
+        """
+        Delete one cached entry, or all entries when key is None.
+        
+        Background refreshes of the deleted entries are cancelled first, so
+        none of them stores its result again.
+        
+        Returns:
+            Number of entries deleted
+        """
+        self.cancel_refreshes(key)
+        self._ensure_table()
+        db = SessionLocal()
+        try:
+            query = db.query(ScrapeCacheEntry)
+            if key is not None:
+                query = query.filter(ScrapeCacheEntry.key == key)
+            deleted = query.delete()
+            db.commit()
+            return deleted
+        finally:
+            db.close()
+    
+    def cancel_refreshes(self, key: Optional[str] = None) -> int:
+        """
+        Cancel the background refresh of key, or every refresh when key is None.
+        
+        Returns:
+            Number of refreshes cancelled
+        """
+        cancelled = 0
+        for task in list(self._tasks):
+            if (key is None or task.get_name() == key) and task.cancel():
+                cancelled += 1
+        return cancelled
+    
+    async def close(self) -> None:
+        """Cancel background refreshes still running (called on shutdown)."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    def _schedule_refresh(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        should_store: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> None:
+        """Start one background refresh per key."""
+        if key in self._refreshing:
+            return
+        
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, fetch, should_store), name=key)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _refresh(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        should_store: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> None:
+        """Re-scrape a stale entry, keeping the old value if it fails."""
+        try:
+            data = await fetch()
+            if should_store is not None and not should_store(data):
+                raise RuntimeError("refreshed result was not storable (partial)")
+            self._store(key, data)
+            self.stats["refreshes"] += 1
+        except Exception as e:
+            self.stats["refresh_failures"] += 1
+            print(f"⚠️ Background refresh failed for {key}: {e}")
+        finally:
+            self._refreshing.discard(key)
+    
+    def _load(self, key: str) -> Optional[tuple]:
+        """Return (data, fetched_at) for key, or None."""
+        self._ensure_table()
+        db = SessionLocal()
+        try:
+            entry = db.query(ScrapeCacheEntry).filter(ScrapeCacheEntry.key == key).first()
+            if entry is None:
+                return None
+            return entry.data, entry.fetched_at
+        finally:
+            db.close()
+    
+    def _store(self, key: str, data: Dict[str, Any]) -> None:
+        """Insert or replace the entry for key."""
+        self._ensure_table()
+        db = SessionLocal()
+        try:
+            db.merge(ScrapeCacheEntry(
+                key=key,
+                source=key.split(":", 1)[0],
+                data=data,
+                fetched_at=datetime.utcnow()
+            ))
+            db.commit()
+        finally:
+            db.close()
+    
+    def _count(self) -> int:
+        """Number of stored entries."""
+        self._ensure_table()
+        db = SessionLocal()
+        try:
+            return db.query(ScrapeCacheEntry).count()
+        finally:
+            db.close()
+    
+    def _ensure_table(self) -> None:
+        """Create the cache table on first use (standalone runs skip init_db)."""
+        if not self._table_ready:
+            ScrapeCacheEntry.__table__.create(bind=engine, checkfirst=True)
+            self._table_ready = True
+
+
+# Singleton instance
+_scrape_cache: Optional[ScrapeCache] = None
+
+
+def get_scrape_cache() -> ScrapeCache:
+    """Get the process-wide scrape cache instance."""
+    global _scrape_cache
+    if _scrape_cache is None:
+        _scrape_cache = ScrapeCache(
+            ttl_seconds=settings.scrape_cache_ttl,
+            max_age_seconds=settings.scrape_cache_max_age
+        )
+    return _scrape_cache
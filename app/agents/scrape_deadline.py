@@ -0,0 +1,107 @@
+"""
+Scrape Deadline - Time-bounded scrapes for the Researcher Agent
+
+Per-goto timeouts do not bound a whole scrape: one slow pinned repo or a
+hung repositories tab can hold it for tens of seconds. A ScrapeDeadline
+gives the scrape an overall time budget, split into per-phase budgets:
+1. Each phase gets its share of the deadline, counted from when it starts,
+   and never more than what is left of the overall deadline
+2. A phase that runs out of time is cancelled and replaced by whatever it
+   had gathered so far (or its empty default)
+3. Every phase records how complete its data is (0.0 - 1.0), which ends up
+   in the scrape result's "completeness" map for the Scorer and the report
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .scrape_timings import measure
+
+
+class ScrapeDeadline:
+    """
+    Overall scrape deadline with per-phase budgets.
+    
+    Usage:
+        deadline = ScrapeDeadline(30, {"profile": 0.4, "readmes": 0.3})
+        data = await deadline.run("profile", scrape_profile(), partial=lambda: {})
+        result["completeness"] = deadline.completeness()
+    """
+    
+    def __init__(self, seconds: Optional[float], budgets: Dict[str, float]):
+        """
+        Start the deadline clock.
+        
+        Args:
+            seconds: Overall time budget (None or 0 for no deadline)
+            budgets: Phase name -> share of the overall deadline
+        """
+        self.seconds = seconds or None
+        self.budgets = budgets
+        self.started = time.monotonic()
+        self.timed_out: List[str] = []
+        self._completeness: Dict[str, float] = {}
+    
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the overall deadline (None without a deadline)."""
+        if self.seconds is None:
+            return None
+        return max(0.0, self.started + self.seconds - time.monotonic())
+    
+    def budget(self, phase: str) -> Optional[float]:
+        """Time a phase starting now may take (None without a deadline)."""
+        remaining = self.remaining()
+        if remaining is None:
+            return None
+        return min(remaining, self.seconds * self.budgets.get(phase, 1.0))
+    
+    async def run(
+        self,
+        phase: str,
+        work: Awaitable[Any],
+        partial: Callable[[], Any],
+        completeness: Optional[Callable[[], float]] = None
+    ) -> Any:
+        """
+        Await a phase within its budget.
+        
+        Args:
+            phase: Phase name (a key of budgets)
+            work: Coroutine performing the phase
+            partial: Builds the phase result from what was gathered when
+                the phase times out
+            completeness: Reports how much of the phase's data was gathered
+                (defaults to 1.0 when it finishes, 0.0 when it times out)
+        
+        Returns:
+            The phase result, or partial() if the budget ran out
+        """
+        try:
+            with measure("phases", phase):
+                result = await asyncio.wait_for(work, timeout=self.budget(phase))
+        except asyncio.TimeoutError:
+            self.timed_out.append(phase)
+            self.mark(phase, completeness() if completeness else 0.0)
+            print(f"⏱️ Scrape phase '{phase}' ran out of time, keeping partial data")
+            return partial()
+        
+        self.mark(phase, completeness() if completeness else 1.0)
+        return result
+    
+    def mark(self, phase: str, value: float) -> None:
+        """Record how complete a phase's data is."""
+        self._completeness[phase] = round(max(0.0, min(1.0, value)), 2)
+    
+    def completeness(self) -> Dict[str, float]:
+        """Completeness per phase; phases that never finished count as 0.0."""
+        return {phase: self._completeness.get(phase, 0.0) for phase in self.budgets}
+    
+    def report(self) -> Dict[str, Any]:
+        """Deadline, elapsed time and the phases that timed out."""
+        return {
+            "seconds": self.seconds,
+            "elapsed_seconds": round(time.monotonic() - self.started, 2),
+            "timed_out": list(self.timed_out)
+        }
@@ -0,0 +1,238 @@
+"""
+Scrape Timings - Per-navigation timing capture for the Researcher Agent
+
+When an analysis is slow, warnings alone do not say whether the time went
+to DNS, the server (TTFB), DOM loading or our own extraction. A
+ScrapeTimings collects, for one scrape:
+1. Every browser navigation (goto_ready): the page's Navigation Timing
+   entry (DNS, connect, TLS, TTFB, download, DOMContentLoaded, load) plus
+   bytes transferred for the document and its subresources
+2. Every request of the shared HTTP client: queueing (connection pool and
+   rate limiter), connect, TLS, TTFB and download, from httpcore's trace
+   events, plus bytes transferred
+3. Wall time of each scrape phase and of each extraction step (parsing,
+   page.content() snapshots, scoring)
+
+The collector is bound to the running scrape with a context variable, so
+the HTTP client hooks, goto_ready() and the scrapers' extraction steps
+record into it without passing it around; tasks started by the scrape
+inherit it. Outside a scrape, recording is a no-op.
+
+Author: Recruiter Copilot
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+
+# Navigation Timing Level 2 breakdown of the current document
+NAVIGATION_TIMING_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (!nav) return null;
+    const resources = performance.getEntriesByType('resource');
+    return {
+        dns_ms: nav.domainLookupEnd - nav.domainLookupStart,
+        connect_ms: nav.connectEnd - nav.connectStart,
+        tls_ms: nav.secureConnectionStart > 0 ? nav.connectEnd - nav.secureConnectionStart : 0,
+        ttfb_ms: nav.responseStart - nav.requestStart,
+        download_ms: nav.responseEnd - nav.responseStart,
+        dom_content_loaded_ms: nav.domContentLoadedEventEnd > 0 ? nav.domContentLoadedEventEnd - nav.startTime : null,
+        load_ms: nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null,
+        transfer_bytes: nav.transferSize,
+        body_bytes: nav.decodedBodySize,
+        resource_count: resources.length,
+        resource_bytes: resources.reduce((sum, r) => sum + (r.transferSize || 0), 0)
+    };
+}
+"""
+
+_current: ContextVar[Optional["ScrapeTimings"]] = ContextVar("scrape_timings", default=None)
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    """Seconds to rounded milliseconds (None stays None)."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+class _RequestTrace:
+    """httpcore trace callback timing one HTTP request."""
+    
+    def __init__(self, timings: "ScrapeTimings", request: httpx.Request):
+        self.timings = timings
+        self.url = str(request.url)
+        self.method = request.method
+        self.started = time.perf_counter()
+        self.marks: Dict[str, float] = {}
+        self.response: Optional[httpx.Response] = None
+        self.finished: Optional[float] = None
+    
+    async def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        """Record the first time of each event, without the http11/http2 prefix."""
+        self.marks.setdefault(event.split(".", 1)[-1], time.perf_counter())
+    
+    def _span(self, start: str, end: str) -> Optional[float]:
+        """Seconds between two trace events (None if either did not happen)."""
+        if start in self.marks and end in self.marks:
+            return self.marks[end] - self.marks[start]
+        return None
+    
+    def entry(self) -> Dict[str, Any]:
+        """Timing breakdown of the request."""
+        marks = self.marks
+        finished = marks.get("receive_response_body.complete") or self.finished or time.perf_counter()
+        first_event = min(marks.values()) if marks else None
+        
+        return {
+            "kind": "http",
+            "method": self.method,
+            "url": self.url,
+            "status": self.response.status_code if self.response is not None else None,
+            "started_ms": _ms(self.started - self.timings.started),
+            "total_ms": _ms(finished - self.started),
+            # Connection pool and rate limiter wait before the request was sent
+            "queue_ms": _ms(first_event - self.started) if first_event is not None else None,
+            "connect_ms": _ms(self._span("connect_tcp.started", "connect_tcp.complete") or 0.0),
+            "tls_ms": _ms(self._span("start_tls.started", "start_tls.complete") or 0.0),
+            "ttfb_ms": _ms(self._span("send_request_headers.started", "receive_response_headers.complete")),
+            "download_ms": _ms(self._span("receive_response_headers.complete", "receive_response_body.complete")),
+            "reused_connection": bool(marks) and "connect_tcp.started" not in marks,
+            "transfer_bytes": self.response.num_bytes_downloaded if self.response is not None else 0
+        }
+
+
+class ScrapeTimings:
+    """
+    Timing collector for one scrape.
+    
+    Usage:
+        timings = ScrapeTimings()
+        with timings.active():
+            result = await scrape()
+        result["timings"] = timings.report()
+    """
+    
+    def __init__(self):
+        """Start the scrape clock."""
+        self.started = time.perf_counter()
+        self.navigations: List[Dict[str, Any]] = []
+        self.requests: List[_RequestTrace] = []
+        self.phases: Dict[str, float] = {}
+        self.extraction: Dict[str, float] = {}
+    
+    @contextmanager
+    def active(self) -> Iterator["ScrapeTimings"]:
+        """Bind this collector to the current task (and tasks it starts)."""
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+    
+    @contextmanager
+    def measure(self, section: str, name: str) -> Iterator[None]:
+        """Add the wall time of the block to section[name] ("phases" or "extraction")."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            totals = self.phases if section == "phases" else self.extraction
+            totals[name] = totals.get(name, 0.0) + time.perf_counter() - started
+    
+    async def record_page(self, page: Any, url: str, response: Any, started: float) -> None:
+        """Record a finished browser navigation with the page's Navigation Timing entry."""
+        entry: Dict[str, Any] = {
+            "kind": "browser",
+            "url": url,
+            "status": response.status if response is not None else None,
+            "started_ms": _ms(started - self.started),
+            # goto plus the readiness wait
+            "total_ms": _ms(time.perf_counter() - started)
+        }
+        try:
+            timing = await page.evaluate(NAVIGATION_TIMING_SCRIPT)
+        except Exception as e:
+            print(f"Warning: Error reading navigation timing for {url}: {e}")
+            timing = None
+        
+        for key, value in (timing or {}).items():
+            entry[key] = round(value, 1) if isinstance(value, float) else value
+        self.navigations.append(entry)
+    
+    def trace_request(self, request: httpx.Request) -> _RequestTrace:
+        """Start timing an HTTP request."""
+        trace = _RequestTrace(self, request)
+        self.requests.append(trace)
+        return trace
+    
+    def report(self) -> Dict[str, Any]:
+        """
+        Timing block for the scrape result.
+        
+        Returns:
+            Dictionary containing:
+            - total_ms: Wall time since the scrape started
+            - phases: Wall time per scrape phase (concurrent phases overlap)
+            - extraction: Time per extraction step (parsing, page.content() snapshots)
+            - slowest_phase: Phase with the most wall time
+            - navigations: Browser navigations and HTTP requests, by start time
+            - bytes_transferred: Bytes over the wire, subresources included
+        """
+        navigations = sorted(
+            self.navigations + [trace.entry() for trace in self.requests],
+            key=lambda entry: entry["started_ms"]
+        )
+        phases = {name: _ms(seconds) for name, seconds in self.phases.items()}
+        
+        return {
+            "total_ms": _ms(time.perf_counter() - self.started),
+            "phases": phases,
+            "extraction": {name: _ms(seconds) for name, seconds in self.extraction.items()},
+            "slowest_phase": max(phases, key=phases.get) if phases else None,
+            "navigations": navigations,
+            "bytes_transferred": sum(
+                (entry.get("transfer_bytes") or 0) + (entry.get("resource_bytes") or 0)
+                for entry in navigations
+            )
+        }
+
+
+def current_timings() -> Optional[ScrapeTimings]:
+    """The collector of the scrape running in this task, if any."""
+    return _current.get()
+
+
+@contextmanager
+def measure(section: str, name: str) -> Iterator[None]:
+    """ScrapeTimings.measure() on the current collector (no-op outside a scrape)."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    with timings.measure(section, name):
+        yield
+
+
+async def _on_request(request: httpx.Request) -> None:
+    """httpx request hook: attach a trace callback while a scrape is being timed."""
+    timings = _current.get()
+    if timings is not None and "trace" not in request.extensions:
+        request.extensions["trace"] = timings.trace_request(request)
+
+
+async def _on_response(response: httpx.Response) -> None:
+    """httpx response hook: keep the response for its status and byte count."""
+    trace = response.request.extensions.get("trace")
+    if isinstance(trace, _RequestTrace):
+        trace.response = response
+        trace.finished = time.perf_counter()
+
+
+# Event hooks create_http_client() installs on every scraper client
+HTTP_EVENT_HOOKS = {
+    "request": [_on_request],
+    "response": [_on_response]
+}
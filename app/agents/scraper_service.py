@@ -0,0 +1,562 @@
+"""
+Scraper Service - Out-of-process scraping for the Researcher Agent
+
+Run inside the API worker, a stuck browser or a CPU-heavy page evaluate
+stalls every request served by that event loop (/status, /report, ...).
+The scraper service moves scraping into dedicated worker processes:
+
+1. A ProcessPoolExecutor ("spawn" start method, so no event loop or
+   browser state is inherited) runs settings.scraper_service_workers
+   processes
+2. Each worker keeps one event loop running in a dedicated thread for its
+   lifetime, with its own browser pool, HTTP client and a 1/N share of the
+   per-host rate limits; background tasks (e.g. stale-while-revalidate
+   cache refreshes) keep running while the worker waits for its next job
+3. The API process submits a job (source, URL, scraper options) and awaits
+   the pickled result without blocking its loop; concurrent jobs for the
+   same URL share one submission
+
+A job that hangs past its timeout is cancelled inside the worker; if the
+worker itself stops responding, the pool is restarted. Each worker also
+answers control requests on its own pipe, so the admin endpoints can show
+the workers' cache, single-flight, rate limit and browser state (and clear
+their cache refreshes) while they scrape. With the service
+disabled (or not started) jobs run in-process, as before.
+
+Jobs go through a per-source circuit breaker (see circuit_breaker.py):
+after repeated blocked, timed-out or 5xx scrapes of a source, its jobs fail
+fast to a fallback until a probe scrape succeeds.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import atexit
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.connection import Connection
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+import httpx
+
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, ScrapeTargetError, classify_error, classify_result
+from .single_flight import get_single_flight
+from ..config import settings
+
+
+# Scrapers a job can target
+SOURCES = ("github", "linkedin")
+
+# Seconds a worker may overrun its job timeout before it counts as wedged
+WEDGED_GRACE_SECONDS = 30
+
+# Seconds the API waits for a worker to answer a control request
+CONTROL_TIMEOUT_SECONDS = 5
+
+T = TypeVar("T")
+
+# Event loop owned by a worker process and the thread running it (set by _init_worker)
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_thread: Optional[threading.Thread] = None
+
+
+class ScrapeJobTimeout(Exception):
+    """A scrape job was cancelled in its worker after the job timeout."""
+
+
+def _init_worker(workers: int, control_ends: List[Connection], claimed: Any) -> None:
+    """Start the worker's event loop thread, browser pool and LinkedIn session (runs once per process)."""
+    global _worker_loop, _worker_thread
+    
+    # Playwright launches subprocesses, which need the Proactor loop on Windows
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    
+    # Workers pace their requests independently, so each gets a share of the limits
+    settings.scraper_rate_limit_share = 1.0 / max(1, workers)
+    
+    _worker_loop = asyncio.new_event_loop()
+    # Daemon, so interpreter shutdown reaches the atexit hook that stops it
+    _worker_thread = threading.Thread(target=_worker_loop.run_forever, name="scraper-worker-loop", daemon=True)
+    _worker_thread.start()
+    
+    from .browser_pool import get_browser_pool
+    try:
+        _run_on_worker_loop(get_browser_pool().start())
+    except Exception as e:
+        print(f"⚠️ Scraper worker browser pool failed to start, scrapers will launch their own browser: {e}")
+    
+    from .linkedin_session import get_linkedin_session
+    if settings.linkedin_persistent_session:
+        try:
+            _run_on_worker_loop(get_linkedin_session().start())
+        except Exception as e:
+            print(f"⚠️ Scraper worker LinkedIn session failed to start, LinkedIn scrapes will launch their own browser: {e}")
+    
+    # Each worker claims one control pipe; the API asks the first `claimed`
+    with claimed.get_lock():
+        index = claimed.value
+        claimed.value += 1
+    threading.Thread(
+        target=_serve_control, args=(control_ends[index],), name="scraper-worker-control", daemon=True
+    ).start()
+    
+    atexit.register(_close_worker)
+
+
+def _close_worker() -> None:
+    """Close the worker's browser pool, LinkedIn session, HTTP client and cache refreshes on exit."""
+    from .browser_pool import get_browser_pool
+    from .http_client import close_http_client
+    from .linkedin_session import get_linkedin_session
+    from .scrape_cache import get_scrape_cache
+    
+    if _worker_loop is None or _worker_loop.is_closed():
+        return
+    
+    try:
+        _run_on_worker_loop(get_scrape_cache().close())
+        _run_on_worker_loop(get_browser_pool().close())
+        _run_on_worker_loop(get_linkedin_session().close())
+        _run_on_worker_loop(close_http_client())
+    except Exception as e:
+        print(f"Warning: Error closing scraper worker: {e}")
+    finally:
+        _worker_loop.call_soon_threadsafe(_worker_loop.stop)
+        _worker_thread.join(timeout=5)
+        if not _worker_loop.is_running():
+            _worker_loop.close()
+
+
+def _run_on_worker_loop(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the worker's loop thread and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _worker_loop).result()
+
+
+def _serve_control(conn: Connection) -> None:
+    """Answer the API's control requests (runs in its own worker thread)."""
+    while True:
+        try:
+            request_id, command, arg = conn.recv()
+        except (EOFError, OSError):
+            # The API closed the pipe (pool shut down or restarted)
+            return
+        try:
+            reply = _run_on_worker_loop(_control(command, arg))
+        except Exception as e:
+            reply = {"pid": os.getpid(), "status": "error", "error": f"{type(e).__name__}: {e}"}
+        conn.send((request_id, reply))
+
+
+async def _control(command: str, arg: Any) -> Dict[str, Any]:
+    """Run a control request on the worker's loop."""
+    from .browser_pool import get_browser_pool
+    from .linkedin_session import get_linkedin_session
+    from .rate_limiter import get_rate_limiter
+    from .scrape_cache import get_scrape_cache
+    
+    if command == "report":
+        return {
+            "pid": os.getpid(),
+            "scrape_cache": get_scrape_cache().report(),
+            "single_flight": get_single_flight().report(),
+            "rate_limits": get_rate_limiter().report(),
+            "browser_pool": await get_browser_pool().health_check(),
+            "linkedin_session": get_linkedin_session().report()
+        }
+    if command == "cancel_refreshes":
+        return {"pid": os.getpid(), "cancelled": get_scrape_cache().cancel_refreshes(arg)}
+    raise ValueError(f"Unknown control command: {command}")
+
+
+def _ask_worker(conn: Connection, request_id: int, command: str, arg: Any) -> Dict[str, Any]:
+    """Send a control request to one worker and wait for its reply (blocking, API side)."""
+    deadline = time.monotonic() + CONTROL_TIMEOUT_SECONDS
+    try:
+        conn.send((request_id, command, arg))
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not conn.poll(remaining):
+                return {"status": "unresponsive"}
+            reply_id, reply = conn.recv()
+            # A late reply to an earlier request that timed out is dropped
+            if reply_id == request_id:
+                return reply
+    except (EOFError, OSError) as e:
+        return {"status": "unreachable", "error": str(e)}
+
+
+def _run_job(source: str, url: str, options: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+    """Run one scrape job on the worker's event loop (executed in the worker process)."""
+    try:
+        return _run_on_worker_loop(asyncio.wait_for(_scrape(source, url, options), timeout))
+    except asyncio.TimeoutError:
+        # Reported as its own type, so the API does not mistake it for a wedged worker
+        raise ScrapeJobTimeout(f"{source} scrape of {url} took longer than {timeout}s")
+
+
+async def _scrape(source: str, url: str, options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Scrape url with the scraper for source, constructed with options."""
+    try:
+        if source == "github":
+            from .github_scraper import GitHubScraper
+            return await GitHubScraper(**options).scrape(url)
+        
+        from .linkedin_scraper import LinkedInScraper
+        return await LinkedInScraper(**options).scrape(url)
+    except ScrapeTargetError:
+        raise
+    except Exception as e:
+        # Classified here so the API process's circuit breaker sees the
+        # outcome; httpx.HTTPStatusError also cannot be unpickled there
+        outcome = classify_error(e)
+        if outcome is not None:
+            raise ScrapeTargetError(outcome, f"{type(e).__name__}: {e}") from e
+        if isinstance(e, httpx.HTTPStatusError):
+            raise RuntimeError(str(e)) from e
+        raise
+
+
+class ScraperService:
+    """
+    Submits scrape jobs to worker processes.
+    
+    Usage:
+        service = get_scraper_service()
+        await service.start()
+        github_data = await service.scrape("github", "https://github.com/octocat")
+    """
+    
+    def __init__(
+        self,
+        workers: int = 2,
+        job_timeout: float = 120,
+        circuit_breakers: bool = True,
+        failure_threshold: int = 5,
+        probe_interval: float = 120
+    ):
+        """
+        Initialize the service (workers are spawned by start()).
+        
+        Args:
+            workers: Worker processes, each running one job at a time
+            job_timeout: Seconds after which a job is cancelled in its worker;
+                a worker still busy a grace period later gets the pool restarted
+            circuit_breakers: Guard each source with a circuit breaker
+            failure_threshold: Consecutive blocked/timeout/5xx scrapes that
+                open a source's circuit
+            probe_interval: Seconds an open circuit waits before a probe scrape
+        """
+        self.workers = max(1, workers)
+        self.job_timeout = job_timeout
+        self.breakers: Dict[str, CircuitBreaker] = {
+            source: CircuitBreaker(source, failure_threshold, probe_interval)
+            for source in SOURCES
+        } if circuit_breakers else {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # One submitted job per worker, so queueing happens here and a job's
+        # timeout starts when a worker picks it up
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+        # API ends of the workers' control pipes, and how many workers claimed one
+        self._control: List[Connection] = []
+        self._claimed: Any = None
+        self._control_lock: Optional[asyncio.Lock] = None
+        self._control_requests = 0
+        
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "inline": 0,
+            "pool_restarts": 0
+        }
+    
+    @property
+    def running(self) -> bool:
+        """True once start() has been called and close() has not."""
+        return self._executor is not None
+    
+    async def start(self) -> None:
+        """Start the worker process pool."""
+        if self.running:
+            return
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+        
+        context = multiprocessing.get_context("spawn")
+        pipes = [context.Pipe() for _ in range(self.workers)]
+        self._control = [api_end for api_end, _ in pipes]
+        self._claimed = context.Value("i", 0)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.workers, [worker_end for _, worker_end in pipes], self._claimed)
+        )
+    
+    async def close(self) -> None:
+        """Cancel queued jobs and stop the workers (closing their browsers)."""
+        if not self.running:
+            return
+        executor, self._executor = self._executor, None
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: executor.shutdown(wait=True, cancel_futures=True)
+        )
+        self._close_control()
+    
+    async def scrape(self, source: str, url: str, **options: Any) -> Optional[Dict[str, Any]]:
+        """
+        Scrape a profile in a worker process (in-process if the service is not running).
+        
+        Args:
+            source: "github" or "linkedin"
+            url: Profile URL
+            **options: GitHubScraper / LinkedInScraper constructor arguments
+                (must be picklable)
+        
+        Returns:
+            The scraper's result, or the source's fallback while its circuit
+            is open (the LinkedIn fallback response, or the last cached
+            GitHub result)
+        
+        Raises:
+            CircuitOpenError: The GitHub circuit is open and the profile is not cached
+        """
+        if source not in SOURCES:
+            raise ValueError(f"Unknown scrape source: {source}")
+        
+        if not self.running:
+            self.stats["inline"] += 1
+            return await self._guarded(source, url, options, lambda: _scrape(source, url, options))
+        
+        # Concurrent analyses of the same profile share one job
+        key = f"{source}-job:{url.strip().lower().rstrip('/')}:{sorted(options.items())}"
+        return await get_single_flight().do(
+            key,
+            lambda: self._guarded(source, url, options, lambda: self._submit(source, url, options))
+        )
+    
+    def report(self) -> Dict[str, Any]:
+        """Counters plus the worker count, jobs in flight and circuit states."""
+        return {
+            **self.stats,
+            "running": self.running,
+            "workers": self.workers,
+            "in_flight": self._in_flight,
+            "job_timeout_seconds": self.job_timeout,
+            "circuits": {source: breaker.state for source, breaker in self.breakers.items()}
+        }
+    
+    async def worker_reports(self, section: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Live report of every started worker (empty if the service is not running).
+        
+        Args:
+            section: Only this part of each report ("scrape_cache",
+                "single_flight", "rate_limits", "browser_pool" or
+                "linkedin_session"), tagged with the worker's pid
+        
+        Returns:
+            One report per worker; a worker that does not answer within
+            CONTROL_TIMEOUT_SECONDS is reported as {"status": "unresponsive"}
+        """
+        reports = await self._broadcast("report")
+        if section is None:
+            return reports
+        return self._section(reports, section)
+    
+    async def process_reports(self, section: str, local: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        This process's report, plus each worker's while the service is running.
+        
+        With the service running, scrapes happen in the workers, so the API
+        process's own singletons only show the jobs it coalesced or served.
+        
+        Args:
+            section: worker_reports() section matching local
+            local: The API process's report
+        
+        Returns:
+            local as-is when the service is not running, else
+            {"api_process": local, "workers": [...]}
+        """
+        return (await self.process_sections({section: local}))[section]
+    
+    async def process_sections(self, local: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        process_reports() for several sections, from one round trip to the workers.
+        
+        Args:
+            local: The API process's report per worker_reports() section
+        
+        Returns:
+            Per section, local as-is when the service is not running, else
+            {"api_process": local, "workers": [...]}
+        """
+        if not self.running:
+            return local
+        reports = await self._broadcast("report")
+        return {
+            section: {"api_process": report, "workers": self._section(reports, section)}
+            for section, report in local.items()
+        }
+    
+    def _section(self, reports: List[Dict[str, Any]], section: str) -> List[Dict[str, Any]]:
+        """One section of each worker report, tagged with the worker's pid."""
+        return [
+            {"pid": report["pid"], **report[section]} if section in report else report
+            for report in reports
+        ]
+    
+    async def cancel_refreshes(self, key: Optional[str] = None) -> None:
+        """Cancel the workers' background cache refreshes of key (all when None)."""
+        await self._broadcast("cancel_refreshes", key)
+    
+    async def _broadcast(self, command: str, arg: Any = None) -> List[Dict[str, Any]]:
+        """Send a control request to every started worker and gather the replies."""
+        if not self.running:
+            return []
+        if self._control_lock is None:
+            self._control_lock = asyncio.Lock()
+        
+        async with self._control_lock:
+            self._control_requests += 1
+            loop = asyncio.get_running_loop()
+            replies = await asyncio.gather(*(
+                loop.run_in_executor(None, _ask_worker, conn, self._control_requests, command, arg)
+                for conn in self._control[:self._claimed.value]
+            ))
+        return list(replies)
+    
+    def _close_control(self) -> None:
+        """Close the API ends of the control pipes (their workers' threads exit)."""
+        for conn in self._control:
+            conn.close()
+        self._control = []
+    
+    async def _guarded(
+        self,
+        source: str,
+        url: str,
+        options: Dict[str, Any],
+        run: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Run a job through its source's circuit breaker."""
+        breaker = self.breakers.get(source)
+        if breaker is None:
+            return await run()
+        call = breaker.allow()
+        if call is None:
+            return self._fallback(source, url, options, breaker)
+        
+        try:
+            result = await run()
+        except ScrapeJobTimeout as e:
+            breaker.record(call, "timeout", str(e))
+            raise
+        except Exception as e:
+            outcome = classify_error(e)
+            if outcome is None:
+                # Not the target's doing (profile not found, worker lost, ...)
+                breaker.release(call)
+            else:
+                breaker.record(call, outcome, f"{url}: {e}")
+            raise
+        except BaseException:
+            breaker.release(call)
+            raise
+        
+        breaker.record(call, classify_result(result), url)
+        return result
+    
+    def _fallback(
+        self,
+        source: str,
+        url: str,
+        options: Dict[str, Any],
+        breaker: CircuitBreaker
+    ) -> Optional[Dict[str, Any]]:
+        """Fail fast while the source's circuit is open."""
+        if source == "linkedin":
+            from .linkedin_scraper import LinkedInScraper
+            return LinkedInScraper.fallback_response(url, "circuit_open")
+        
+        from .github_scraper import GitHubScraper
+        cached = GitHubScraper(**options).cached(url)
+        if cached is not None:
+            return {**cached, "circuit_open": True}
+        raise CircuitOpenError(
+            f"{source} scrapes are failing ({breaker.last_failure['outcome']}), "
+            f"circuit open for another {breaker.retry_in()}s"
+        )
+    
+    async def _submit(self, source: str, url: str, options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run a job in the pool, restarting the pool if its worker is lost or wedged."""
+        self.stats["submitted"] += 1
+        
+        async with self._slots:
+            executor = self._executor
+            if executor is None:
+                raise RuntimeError("Scraper service is not running")
+            self._in_flight += 1
+            
+            try:
+                future = asyncio.get_running_loop().run_in_executor(
+                    executor, _run_job, source, url, options, self.job_timeout
+                )
+                result = await asyncio.wait_for(future, self.job_timeout + WEDGED_GRACE_SECONDS)
+            except ScrapeJobTimeout:
+                self.stats["timed_out"] += 1
+                raise
+            except (asyncio.TimeoutError, BrokenProcessPool) as e:
+                self.stats["failed"] += 1
+                print(f"⚠️ Scraper worker lost on {source} job for {url} ({type(e).__name__}), restarting the pool")
+                await self._restart(executor)
+                raise
+            except Exception:
+                self.stats["failed"] += 1
+                raise
+            finally:
+                self._in_flight -= 1
+        
+        self.stats["completed"] += 1
+        return result
+    
+    async def _restart(self, executor: ProcessPoolExecutor) -> None:
+        """Replace a broken or wedged pool (jobs still queued on it fail)."""
+        if executor is not self._executor:
+            # Another job already restarted it
+            return
+        
+        self._executor = None
+        self.stats["pool_restarts"] += 1
+        # A wedged worker never returns, so it is terminated rather than joined
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._close_control()
+        await self.start()
+
+
+# Singleton instance
+_scraper_service: Optional[ScraperService] = None
+
+
+def get_scraper_service() -> ScraperService:
+    """Get the process-wide scraper service."""
+    global _scraper_service
+    if _scraper_service is None:
+        _scraper_service = ScraperService(
+            workers=settings.scraper_service_workers,
+            job_timeout=settings.scraper_service_job_timeout,
+            circuit_breakers=settings.circuit_breaker_enabled,
+            failure_threshold=settings.circuit_breaker_failure_threshold,
+            probe_interval=settings.circuit_breaker_probe_interval
+        )
+    return _scraper_service
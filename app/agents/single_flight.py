@@ -0,0 +1,99 @@
+"""
+Single-Flight Scrapes - The Researcher Agent
+
+Recruiters often submit the same candidate to several reqs within seconds,
+and every submission runs its own analysis pipeline. This module makes
+concurrent scrapes of the same identity share one in-flight task: the first
+caller starts the scrape, later callers with the same key await its result
+instead of launching a duplicate browser session.
+
+Only concurrent calls are coalesced; once the task finishes its key is
+released (repeat scrapes over time are the scrape cache's job). Callers
+that want different results (e.g. another scraper backend) must use
+different keys; a caller with a deadline bounds its wait with a timeout.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent coroutine calls by key.
+    
+    Usage:
+        flight = get_single_flight()
+        data = await flight.do("github:octocat", lambda: scrape_profile("octocat"))
+    """
+    
+    def __init__(self):
+        """Initialize the in-flight registry."""
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = {
+            "calls": 0,
+            "executions": 0,
+            "coalesced": 0,
+            "join_timeouts": 0
+        }
+    
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]], timeout: Optional[float] = None) -> Any:
+        """
+        Run fn for key, or join the call already in flight for key.
+        
+        Args:
+            key: Normalized identity, e.g. "github:<username>"
+            fn: Coroutine factory performing the work
+            timeout: Longest wait when joining a call started by someone
+                else (None to wait for it); fn is expected to bound its own work
+        
+        Returns:
+            The result of the shared call (callers that joined an existing
+            call get their own copy)
+        
+        Raises:
+            asyncio.TimeoutError: The joined call outlasted timeout
+        """
+        self.stats["calls"] += 1
+        
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            try:
+                # Shielded so one cancelled or timed-out caller does not cancel the others
+                result = await asyncio.wait_for(asyncio.shield(task), timeout)
+            except asyncio.TimeoutError:
+                self.stats["join_timeouts"] += 1
+                raise asyncio.TimeoutError(f"In-flight call for {key} still running after {timeout}s") from None
+            return copy.deepcopy(result)
+        
+        self.stats["executions"] += 1
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._release(key, done))
+        
+        return await asyncio.shield(task)
+    
+    def report(self) -> Dict[str, Any]:
+        """Counters plus the number of calls currently in flight."""
+        return {**self.stats, "in_flight": len(self._inflight)}
+    
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished call and consume its exception if nobody awaited it."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+
+# Singleton instance
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the process-wide single-flight registry."""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
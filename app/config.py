@@ -27,6 +27,100 @@ class Settings(BaseSettings):
     app_name: str = "Recruiter Copilot"
     debug: bool = True
     
+    # Browser pool (shared Chromium for the scrapers)
+    browser_pool_size: int = int(os.getenv("BROWSER_POOL_SIZE", "4"))
+    browser_headless: bool = os.getenv("BROWSER_HEADLESS", "true").lower() == "true"
+    
+    # Browser memory governor: recycle the pooled browser after this many
+    # pages or once the Chromium process tree exceeds this RSS (0 disables)
+    browser_max_pages: int = int(os.getenv("BROWSER_MAX_PAGES", "500"))
+    browser_max_rss_mb: int = int(os.getenv("BROWSER_MAX_RSS_MB", "1536"))
+    
+    # Scraper fast mode: abort images/fonts/css/media and third-party hosts
+    scraper_block_resources: bool = os.getenv("SCRAPER_BLOCK_RESOURCES", "true").lower() == "true"
+    
+    # GitHub scraper backend: "playwright" (browser), "http" (browserless) or "graphql" (API)
+    github_scraper_backend: str = os.getenv("GITHUB_SCRAPER_BACKEND", "playwright")
+    github_base_url: str = os.getenv("GITHUB_BASE_URL", "https://github.com")
+    github_raw_base_url: str = os.getenv("GITHUB_RAW_BASE_URL", "https://raw.githubusercontent.com")
+    
+    # Overall GitHub scrape deadline in seconds (0 disables); partial data
+    # is returned with a completeness map when it runs out
+    github_scrape_deadline: float = float(os.getenv("GITHUB_SCRAPE_DEADLINE", "30"))
+    
+    # Multi-year contribution history (per-year calendars, fetched concurrently)
+    github_contribution_history: bool = os.getenv("GITHUB_CONTRIBUTION_HISTORY", "false").lower() == "true"
+    github_history_max_years: int = int(os.getenv("GITHUB_HISTORY_MAX_YEARS", "10"))
+    github_history_concurrency: int = int(os.getenv("GITHUB_HISTORY_CONCURRENCY", "4"))
+    
+    # Re-scrape cached profiles from a fingerprint (contributions, repo
+    # count, pinned repos, followers), re-running only the changed phases
+    github_incremental_scrape: bool = os.getenv("GITHUB_INCREMENTAL_SCRAPE", "true").lower() == "true"
+    
+    # Activity sampling (last commit, commit count, language bytes) of the
+    # top pinned repos; GraphQL with a token, else the REST API with ETags.
+    # Off by default without a token: anonymous REST calls share 60/hour per IP
+    github_repo_activity: bool = os.getenv(
+        "GITHUB_REPO_ACTIVITY", "true" if os.getenv("GITHUB_TOKEN") else "false"
+    ).lower() == "true"
+    github_activity_top_n: int = int(os.getenv("GITHUB_ACTIVITY_TOP_N", "6"))
+    github_activity_concurrency: int = int(os.getenv("GITHUB_ACTIVITY_CONCURRENCY", "4"))
+    github_activity_cache_ttl: int = int(os.getenv("GITHUB_ACTIVITY_CACHE_TTL", "3600"))
+    github_api_url: str = os.getenv("GITHUB_API_URL", "https://api.github.com")
+    
+    # Repositories-tab pagination for language statistics
+    github_repo_max_pages: int = int(os.getenv("GITHUB_REPO_MAX_PAGES", "10"))
+    github_repo_page_concurrency: int = int(os.getenv("GITHUB_REPO_PAGE_CONCURRENCY", "4"))
+    
+    # GitHub GraphQL API (required by the "graphql" backend)
+    github_token: str = os.getenv("GITHUB_TOKEN", "")
+    github_graphql_url: str = os.getenv("GITHUB_GRAPHQL_URL", "https://api.github.com/graphql")
+    
+    # Scrape result cache (seconds): fresh up to the TTL, served stale and
+    # refreshed in the background up to the max age
+    scrape_cache_enabled: bool = os.getenv("SCRAPE_CACHE_ENABLED", "true").lower() == "true"
+    scrape_cache_ttl: int = int(os.getenv("SCRAPE_CACHE_TTL", "86400"))
+    scrape_cache_max_age: int = int(os.getenv("SCRAPE_CACHE_MAX_AGE", "604800"))
+    
+    # Per-host scraper rate limit (token bucket) with adaptive backoff
+    scraper_rate_limit_enabled: bool = os.getenv("SCRAPER_RATE_LIMIT_ENABLED", "true").lower() == "true"
+    scraper_rate_limit_rps: float = float(os.getenv("SCRAPER_RATE_LIMIT_RPS", "2"))
+    scraper_rate_limit_burst: int = int(os.getenv("SCRAPER_RATE_LIMIT_BURST", "5"))
+    scraper_rate_limit_max_backoff: float = float(os.getenv("SCRAPER_RATE_LIMIT_MAX_BACKOFF", "60"))
+    # Fraction of the limits this process may use (set in scraper service workers)
+    scraper_rate_limit_share: float = float(os.getenv("SCRAPER_RATE_LIMIT_SHARE", "1"))
+    
+    # Out-of-process scraping: worker processes own the browsers and run scrape
+    # jobs so the API event loop never waits on Playwright
+    scraper_service_enabled: bool = os.getenv("SCRAPER_SERVICE_ENABLED", "true").lower() == "true"
+    scraper_service_workers: int = int(os.getenv("SCRAPER_SERVICE_WORKERS", "2"))
+    scraper_service_job_timeout: float = float(os.getenv("SCRAPER_SERVICE_JOB_TIMEOUT", "120"))
+    
+    # Per-source circuit breaker: after this many consecutive blocked, timed-out
+    # or 5xx scrapes, a source's jobs fail fast until a probe scrape succeeds
+    circuit_breaker_enabled: bool = os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+    circuit_breaker_failure_threshold: int = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))
+    circuit_breaker_probe_interval: float = float(os.getenv("CIRCUIT_BREAKER_PROBE_INTERVAL", "120"))
+    
+    # Warm authenticated LinkedIn context reused across scrapes: built from a
+    # Playwright storage_state file when set (else linkedin_cookies.json) and
+    # rebuilt when the file's mtime changes
+    linkedin_persistent_session: bool = os.getenv("LINKEDIN_PERSISTENT_SESSION", "true").lower() == "true"
+    linkedin_storage_state: str = os.getenv("LINKEDIN_STORAGE_STATE", "")
+    linkedin_slow_mo: int = int(os.getenv("LINKEDIN_SLOW_MO", "0"))
+    
+    # LinkedIn session memory governor: recycle its browser after this many
+    # pages or once its Chromium process tree exceeds this RSS (0 disables)
+    linkedin_session_max_pages: int = int(os.getenv("LINKEDIN_SESSION_MAX_PAGES", "200"))
+    linkedin_session_max_rss_mb: int = int(os.getenv("LINKEDIN_SESSION_MAX_RSS_MB", "1024"))
+    
+    # Per-navigation timing breakdown attached to scrape results as "timings"
+    scraper_timings_enabled: bool = os.getenv("SCRAPER_TIMINGS_ENABLED", "true").lower() == "true"
+    
+    # Shared HTTP client
+    http_timeout: float = float(os.getenv("HTTP_TIMEOUT", "15"))
+    http_max_connections: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+    
     # Paths
     base_dir: Path = Path(__file__).parent.parent
     reports_dir: Path = base_dir / "reports"
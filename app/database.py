@@ -69,6 +69,16 @@ class Report(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
+class ScrapeCacheEntry(Base):
+    """Cached scraper result (see agents/scrape_cache.py)."""
+    __tablename__ = "scrape_cache"
+    
+    key = Column(String(300), primary_key=True)  # e.g. "github:<username>"
+    source = Column(String(50), nullable=False)  # key prefix: github, linkedin, readme, repo
+    data = Column(JSON, nullable=False)
+    fetched_at = Column(DateTime, default=datetime.utcnow)
+
+
 def init_db():
     """Initialize database tables."""
     Base.metadata.create_all(bind=engine)
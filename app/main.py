@@ -1,4 +1,5 @@
 # Windows async compatibility fix - MUST be at the very top
+# (only needed when scraping in-process; scraper service workers set their own)
 import sys
 import asyncio
 if sys.platform == 'win32':
@@ -13,7 +14,12 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
 from .database import init_db
-from .routers import candidates
+from .routers import admin, candidates
+from .agents.browser_pool import get_browser_pool
+from .agents.http_client import close_http_client
+from .agents.linkedin_session import get_linkedin_session
+from .agents.scrape_cache import get_scrape_cache
+from .agents.scraper_service import get_scraper_service
 
 
 @asynccontextmanager
@@ -21,11 +27,36 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown events."""
     # Startup: Initialize database
     init_db()
+    
+    # Startup: Scrape in worker processes, or launch the shared browser here
+    scraper_service = get_scraper_service()
+    browser_pool = get_browser_pool()
+    linkedin_session = get_linkedin_session()
+    if settings.scraper_service_enabled:
+        await scraper_service.start()
+        print(f"🧵 Scraper service ready ({scraper_service.workers} worker processes)")
+    else:
+        try:
+            await browser_pool.start()
+            print(f"🌐 Browser pool ready ({browser_pool.size} contexts)")
+        except Exception as e:
+            print(f"⚠️ Browser pool failed to start, scrapers will launch their own browser: {e}")
+        if settings.linkedin_persistent_session:
+            try:
+                await linkedin_session.start()
+            except Exception as e:
+                print(f"⚠️ LinkedIn session failed to start, LinkedIn scrapes will launch their own browser: {e}")
+    
     print(f"🚀 {settings.app_name} started!")
     print(f"📁 Reports directory: {settings.reports_dir}")
     yield
     # Shutdown
     print(f"👋 {settings.app_name} shutting down...")
+    await get_scrape_cache().close()
+    await scraper_service.close()
+    await browser_pool.close()
+    await linkedin_session.close()
+    await close_http_client()
 
 
 # Create FastAPI application
@@ -47,15 +78,24 @@ app.add_middleware(
 
 # Include routers
 app.include_router(candidates.router, prefix="/api/candidates", tags=["candidates"])
+app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
+    scraper_service = get_scraper_service()
+    # One round trip to the workers, so a wedged worker costs at most one control timeout
+    reports = await scraper_service.process_sections({
+        "browser_pool": await get_browser_pool().health_check(),
+        "linkedin_session": get_linkedin_session().report()
+    })
     return {
         "status": "healthy",
         "app": settings.app_name,
-        "version": "1.0.0"
+        "version": "1.0.0",
+        **reports,
+        "scraper_service": scraper_service.report()
     }
 
 
@@ -1,4 +1,4 @@
 """
 Routers package.
 """
-from . import candidates
+from . import admin, candidates
@@ -0,0 +1,59 @@
+"""
+Admin API endpoints (scraper cache and infrastructure state).
+
+With the scraper service running, the scrapes happen in its worker
+processes, so the per-process reports carry each worker's report next to
+the API process's own.
+"""
+from typing import Optional
+from fastapi import APIRouter, HTTPException
+
+from ..agents.rate_limiter import get_rate_limiter
+from ..agents.scrape_cache import get_scrape_cache
+from ..agents.scraper_service import get_scraper_service
+from ..agents.single_flight import get_single_flight
+
+router = APIRouter()
+
+
+@router.get("/scrape-cache")
+async def get_scrape_cache_stats():
+    """Get scrape cache hit/miss counters."""
+    return await get_scraper_service().process_reports("scrape_cache", get_scrape_cache().report())
+
+
+@router.delete("/scrape-cache")
+async def clear_scrape_cache(key: Optional[str] = None):
+    """Drop one cached scrape (e.g. key=github:octocat) or the whole cache."""
+    # Workers' background refreshes are stopped first, so none re-stores a deleted entry
+    await get_scraper_service().cancel_refreshes(key)
+    deleted = get_scrape_cache().invalidate(key)
+    return {"deleted": deleted}
+
+
+@router.get("/single-flight")
+async def get_single_flight_stats():
+    """Get counts of executed and coalesced (deduplicated) scrapes."""
+    return await get_scraper_service().process_reports("single_flight", get_single_flight().report())
+
+
+@router.get("/rate-limits")
+async def get_rate_limit_stats():
+    """Get per-host scraper rate limiter tokens, rates and wait times."""
+    return await get_scraper_service().process_reports("rate_limits", get_rate_limiter().report())
+
+
+@router.get("/circuit-breakers")
+async def get_circuit_breakers():
+    """Get each scrape source's circuit state, failure streak and next probe time."""
+    return {source: breaker.report() for source, breaker in get_scraper_service().breakers.items()}
+
+
+@router.post("/circuit-breakers/{source}/reset")
+async def reset_circuit_breaker(source: str):
+    """Close a source's circuit (e.g. after refreshing LinkedIn cookies)."""
+    breaker = get_scraper_service().breakers.get(source)
+    if breaker is None:
+        raise HTTPException(status_code=404, detail=f"No circuit breaker for source: {source}")
+    breaker.reset()
+    return breaker.report()
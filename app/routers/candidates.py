@@ -14,8 +14,8 @@ from ..database import get_db, Candidate, AnalysisRun, Report
 from ..models import CandidateReport, AnalysisStatus
 from ..config import settings
 # Updated imports - scrapers now at agents root level
-from ..agents.github_scraper import GitHubScraper
-from ..agents.linkedin_scraper import LinkedInScraper
+from ..agents.circuit_breaker import CircuitOpenError
+from ..agents.scraper_service import get_scraper_service
 from ..agents.resume_analyzer import ResumeAnalyzer
 from ..agents.analyst.resume_parser import ResumeParser
 from ..agents.analyst.validator import Validator
@@ -49,7 +49,6 @@ async def run_analysis_pipeline(
         db.commit()
         
         # Initialize agents
-        github_scraper = GitHubScraper()
         resume_parser = ResumeParser()
         validator = Validator()
         gemini_analyzer = GeminiAnalyzer()
@@ -60,7 +59,10 @@ async def run_analysis_pipeline(
         github_data = None
         if github_url:
             try:
-                github_data = await github_scraper.scrape(github_url)
+                # Scraped in a worker process, off the API event loop
+                github_data = await get_scraper_service().scrape("github", github_url)
+            except CircuitOpenError as e:
+                print(f"⚠️ Skipping GitHub scrape: {e}")
             except Exception as e:
                 print(f"GitHub scraping failed: {e}")
         
@@ -0,0 +1,282 @@
+"""
+Extractor Benchmark - Offline parse throughput for the Researcher Agent
+
+Runs the scraper extractors (github_parsers, linkedin_parsers and the
+GitHubScraper post-processing they feed) over the saved pages in
+benchmarks/corpus/, with no browser and no network:
+
+1. Every extractor's output is checked against the profile's expected.json,
+   so a selector regression fails the run
+2. Each extractor is timed per page (median and p95 latency)
+3. Full profiles (every extractor over every page of the profile) are
+   timed to report profiles parsed per second, per source
+
+Corpus layout: corpus/<source>/<profile>/ holds profile.html plus, for
+GitHub, contributions*.html, repositories-*.html and readmes/*.md.
+
+Usage:
+    python -m benchmarks.bench_extractors
+    python -m benchmarks.bench_extractors --iterations 200 --json bench.json
+    python -m benchmarks.bench_extractors --baseline bench.json --max-regression 0.25
+    python -m benchmarks.bench_extractors --update-expected
+
+Author: Recruiter Copilot
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.agents.github_parsers import (
+    parse_contribution_calendar,
+    parse_pinned_repos,
+    parse_profile_overview,
+    parse_repository_list
+)
+from app.agents.github_scraper import GitHubScraper
+from app.agents.linkedin_parsers import (
+    parse_blocked,
+    parse_education,
+    parse_experience,
+    parse_profile_header,
+    parse_skills
+)
+from app.agents.readme_analyzer import markdown_features
+
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+
+# Post-processing shared with the live scrapers (no browser is launched)
+_scraper = GitHubScraper(use_cache=False, contribution_history=False, repo_activity=False)
+
+# name -> (source, page glob, parser, build step)
+# The parser's output is what expected.json pins down (it does not depend on
+# the current date); the timed extractor is parser plus build step.
+EXTRACTORS: Dict[str, Tuple[str, str, Callable[[str], Any], Optional[Callable[[Any], Any]]]] = {
+    "github.profile_overview": ("github", "profile.html", parse_profile_overview, _scraper._profile_overview_from_raw),
+    "github.pinned_repos": ("github", "profile.html", parse_pinned_repos, _scraper._pinned_repos_from_raw),
+    "github.contributions": ("github", "contributions*.html", parse_contribution_calendar, _scraper._contributions_from_raw),
+    "github.repository_list": (
+        "github", "repositories-*.html", parse_repository_list,
+        lambda page: _scraper._languages_from_repo_pages([page])
+    ),
+    "github.readme": ("github", "readmes/*.md", markdown_features, _scraper._score_readme_content),
+    "linkedin.blocked": ("linkedin", "profile.html", parse_blocked, None),
+    "linkedin.profile_header": ("linkedin", "profile.html", parse_profile_header, None),
+    "linkedin.experience": ("linkedin", "profile.html", parse_experience, None),
+    "linkedin.education": ("linkedin", "profile.html", parse_education, None),
+    "linkedin.skills": ("linkedin", "profile.html", parse_skills, None)
+}
+
+
+class CorpusProfile:
+    """One saved profile: its pages, keyed by path relative to the profile directory."""
+    
+    def __init__(self, source: str, path: Path):
+        self.source = source
+        self.path = path
+        self.name = f"{source}/{path.name}"
+        self.pages: Dict[str, Dict[str, str]] = {}
+        
+        for name, (extractor_source, pattern, _, _) in EXTRACTORS.items():
+            if extractor_source != source:
+                continue
+            self.pages[name] = {
+                page.relative_to(path).as_posix(): page.read_text(encoding="utf-8")
+                for page in sorted(path.glob(pattern))
+            }
+    
+    @property
+    def expected_path(self) -> Path:
+        """Pinned parser output for this profile."""
+        return self.path / "expected.json"
+    
+    def parse(self) -> Dict[str, Dict[str, Any]]:
+        """Parser output of every extractor, per page (the expected.json shape)."""
+        return {
+            name: {page: EXTRACTORS[name][2](text) for page, text in pages.items()}
+            for name, pages in self.pages.items()
+        }
+
+
+def load_corpus(corpus_dir: Path = CORPUS_DIR) -> List[CorpusProfile]:
+    """Every profile directory under corpus_dir/<source>/."""
+    return [
+        CorpusProfile(source_dir.name, profile_dir)
+        for source_dir in sorted(corpus_dir.iterdir()) if source_dir.is_dir()
+        for profile_dir in sorted(source_dir.iterdir()) if profile_dir.is_dir()
+    ]
+
+
+def check_expected(profiles: List[CorpusProfile]) -> List[str]:
+    """
+    Compare parser output with each profile's expected.json.
+    
+    Returns:
+        One message per mismatching (or missing) extractor output
+    """
+    failures = []
+    for profile in profiles:
+        if not profile.expected_path.exists():
+            failures.append(f"{profile.name}: no expected.json (run with --update-expected)")
+            continue
+        
+        expected = json.loads(profile.expected_path.read_text(encoding="utf-8"))
+        # Round-trip so tuples and lists compare equal
+        actual = json.loads(json.dumps(profile.parse()))
+        for name, pages in actual.items():
+            for page, output in pages.items():
+                if expected.get(name, {}).get(page) != output:
+                    failures.append(f"{profile.name}: {name} output changed for {page}")
+    return failures
+
+
+def update_expected(profiles: List[CorpusProfile]) -> None:
+    """Rewrite every profile's expected.json from the current parsers."""
+    for profile in profiles:
+        profile.expected_path.write_text(
+            json.dumps(profile.parse(), indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8"
+        )
+        print(f"📝 Wrote {profile.expected_path.relative_to(CORPUS_DIR.parent)}")
+
+
+def run_benchmark(profiles: List[CorpusProfile], iterations: int = 100, warmup: int = 5) -> Dict[str, Any]:
+    """
+    Time every extractor on every page of the corpus.
+    
+    Args:
+        profiles: Corpus profiles to parse
+        iterations: Timed passes over the corpus
+        warmup: Untimed passes first (imports, parser caches)
+    
+    Returns:
+        Dictionary containing:
+        - extractors: Per extractor, calls plus median/p95/mean latency in ms
+        - sources: Per source, profile count and profiles parsed per second
+        - iterations: Timed passes
+    """
+    call_times: Dict[str, List[float]] = {name: [] for name in EXTRACTORS}
+    profile_times: Dict[str, List[float]] = {}
+    
+    for iteration in range(warmup + iterations):
+        timed = iteration >= warmup
+        for profile in profiles:
+            profile_started = time.perf_counter()
+            for name, pages in profile.pages.items():
+                _, _, parser, build = EXTRACTORS[name]
+                for text in pages.values():
+                    started = time.perf_counter()
+                    output = parser(text)
+                    if build is not None:
+                        build(output)
+                    if timed:
+                        call_times[name].append(time.perf_counter() - started)
+            if timed:
+                profile_times.setdefault(profile.source, []).append(time.perf_counter() - profile_started)
+    
+    extractors = {}
+    for name, times in call_times.items():
+        if not times:
+            continue
+        ordered = sorted(times)
+        extractors[name] = {
+            "calls": len(times) // iterations,
+            "median_ms": round(statistics.median(ordered) * 1000, 3),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+            "mean_ms": round(statistics.fmean(ordered) * 1000, 3)
+        }
+    
+    sources = {
+        source: {
+            "profiles": len(times) // iterations,
+            "profiles_per_second": round(len(times) / sum(times), 1)
+        }
+        for source, times in profile_times.items()
+    }
+    
+    return {"iterations": iterations, "extractors": extractors, "sources": sources}
+
+
+def compare_baseline(report: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """
+    Find extractors and sources that got slower than baseline allows.
+    
+    Args:
+        report: run_benchmark() output
+        baseline: An earlier run_benchmark() output (--json)
+        max_regression: Allowed slowdown, e.g. 0.25 for 25%
+    
+    Returns:
+        One message per regression
+    """
+    regressions = []
+    for name, stats in report["extractors"].items():
+        before = baseline.get("extractors", {}).get(name)
+        if before and stats["median_ms"] > before["median_ms"] * (1 + max_regression):
+            regressions.append(
+                f"{name}: median {stats['median_ms']}ms vs {before['median_ms']}ms baseline"
+            )
+    for source, stats in report["sources"].items():
+        before = baseline.get("sources", {}).get(source)
+        if before and stats["profiles_per_second"] < before["profiles_per_second"] / (1 + max_regression):
+            regressions.append(
+                f"{source}: {stats['profiles_per_second']} profiles/s vs {before['profiles_per_second']} baseline"
+            )
+    return regressions
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print the latency table and throughput per source."""
+    print(f"{'Extractor':<28}{'calls':>7}{'median ms':>12}{'p95 ms':>10}{'mean ms':>10}")
+    for name, stats in report["extractors"].items():
+        print(f"{name:<28}{stats['calls']:>7}{stats['median_ms']:>12.3f}{stats['p95_ms']:>10.3f}{stats['mean_ms']:>10.3f}")
+    print()
+    for source, stats in report["sources"].items():
+        print(f"⚡ {source}: {stats['profiles_per_second']} profiles/s ({stats['profiles']} profiles)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Check the corpus outputs, run the benchmark and compare with a baseline (exit status)."""
+    parser = argparse.ArgumentParser(description="Benchmark the scraper extractors on the saved corpus.")
+    parser.add_argument("--iterations", type=int, default=100, help="Timed passes over the corpus")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed passes before timing")
+    parser.add_argument("--json", dest="json_path", help="Write the report to this file")
+    parser.add_argument("--baseline", help="Fail if slower than this earlier --json report")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="Allowed slowdown vs --baseline")
+    parser.add_argument("--update-expected", action="store_true", help="Rewrite expected.json from the current parsers")
+    args = parser.parse_args(argv)
+    
+    profiles = load_corpus()
+    if args.update_expected:
+        update_expected(profiles)
+        return 0
+    
+    failures = check_expected(profiles)
+    for failure in failures:
+        print(f"❌ {failure}")
+    if failures:
+        return 1
+    
+    report = run_benchmark(profiles, iterations=args.iterations, warmup=args.warmup)
+    print_report(report)
+    
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare_baseline(report, baseline, args.max_regression)
+        for regression in regressions:
+            print(f"🐢 {regression}")
+        if regressions:
+            return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""
+Shared test setup: an isolated database, no real pacing, a fake Playwright
+driver for the browser pool and LinkedIn session tests, and a mock HTTP
+transport serving the saved GitHub pages in benchmarks/corpus.
+
+Author: Recruiter Copilot
+"""
+import inspect
+import json
+import os
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# Settings are read at import time, so configure them before any app import
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/test.db")
+os.environ.setdefault("SCRAPER_RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("SCRAPER_SERVICE_ENABLED", "false")
+
+import httpx
+import pytest
+
+
+GITHUB_CORPUS = Path(__file__).parent.parent / "benchmarks" / "corpus" / "github"
+
+# http-backend options that read the corpus pages through github_mirror()
+GITHUB_MIRROR_OPTIONS = {
+    "backend": "http",
+    "base_url": "https://github.test",
+    "raw_base_url": "https://raw.test",
+    "page_urls": {
+        "profile": "{base}/{username}/profile.html",
+        "contributions": "{base}/{username}/contributions.html",
+        "contributions_year": "{base}/{username}/contributions-{year}.html",
+        "repositories": "{base}/{username}/repositories-{page}.html"
+    },
+    "use_cache": False,
+    "repo_activity": False
+}
+
+
+class FakePage:
+    """Page stub: records navigation, serves fixed HTML."""
+    
+    def __init__(self, context, html: str = "<html></html>"):
+        self.context = context
+        self.html = html
+        self.closed = False
+        self.handlers = {}
+    
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+    
+    async def goto(self, url, **kwargs):
+        for handler in self.handlers.get("framenavigated", []):
+            handler(SimpleNamespace(url=url))
+    
+    async def route(self, *args, **kwargs):
+        pass
+    
+    async def content(self):
+        return self.html
+    
+    async def close(self):
+        # Like Playwright, context.pages lists open pages only
+        if not self.closed and self in self.context.pages:
+            self.context.pages.remove(self)
+        self.closed = True
+
+
+class FakeCDPSession:
+    """CDP session stub recording its commands on the context."""
+    
+    def __init__(self, context):
+        self.context = context
+    
+    async def send(self, method, params=None):
+        self.context.cdp_commands.append((method, params))
+        return {}
+    
+    async def detach(self):
+        pass
+
+
+class FakeContext:
+    """BrowserContext stub that remembers its new_context() options."""
+    
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.cookies = list((options.get("storage_state") or {}).get("cookies", []))
+        self.har_entries = []
+        self.pages = []
+        self.handlers = {}
+        self.cdp_commands = []
+        self.closed = False
+    
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+    
+    def remove_listener(self, event, handler):
+        if handler in self.handlers.get(event, []):
+            self.handlers[event].remove(handler)
+    
+    async def new_page(self):
+        if not self.browser.connected:
+            raise RuntimeError("Target page, context or browser has been closed")
+        page = FakePage(self)
+        self.pages.append(page)
+        for handler in self.handlers.get("page", []):
+            handler(page)
+        return page
+    
+    async def new_cdp_session(self, page):
+        return FakeCDPSession(self)
+    
+    async def clear_cookies(self):
+        if not self.browser.connected:
+            raise RuntimeError("Target page, context or browser has been closed")
+    
+    async def unroute(self, *args, **kwargs):
+        pass
+    
+    async def storage_state(self):
+        return {"cookies": list(self.cookies), "origins": []}
+    
+    async def route(self, *args, **kwargs):
+        pass
+    
+    async def close(self):
+        # Like Playwright, the record_har_path file is written on close
+        if "record_har_path" in self.options and not self.closed:
+            with open(self.options["record_har_path"], "w") as f:
+                json.dump({"log": {"version": "1.2", "entries": self.har_entries}}, f)
+        self.closed = True
+
+
+class FakeBrowser:
+    """Browser stub; set connected = False to simulate a crash."""
+    
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+    
+    def is_connected(self):
+        return self.connected
+    
+    async def new_context(self, **options):
+        context = FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+    
+    async def close(self):
+        self.connected = False
+
+
+class FakeChromium:
+    """chromium stub counting launches."""
+    
+    def __init__(self):
+        self.browsers = []
+        self.launch_options = []
+    
+    async def launch(self, **options):
+        self.launch_options.append(options)
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    """Stand-in for async_playwright(), started or used as a context manager."""
+    
+    def __init__(self):
+        self.chromium = FakeChromium()
+    
+    async def start(self):
+        return self
+    
+    async def stop(self):
+        pass
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+@pytest.fixture
+def fake_playwright():
+    """A fresh fake Playwright driver."""
+    return FakePlaywright()
+
+
+@pytest.fixture
+def fake_proc(monkeypatch, fake_playwright):
+    """
+    Stand-in /proc for browser_pool: each fake browser launched so far is a
+    Chromium process (pid 1000, 1010, ...) with one renderer (pid + 1) under
+    the fake driver (pid 900). Another driver's browser (pid 801, 1 GB) runs
+    alongside and must never be counted.
+    
+    Set rss_pages[pid] to change a process's RSS (in pages, 1 MB by default).
+    """
+    from app.agents import browser_pool
+    
+    me = os.getpid()
+    page_mb = 1024 * 1024 // os.sysconf("SC_PAGE_SIZE")
+    rss_pages = {801: 1024 * page_mb}
+    
+    def read_processes():
+        processes = {
+            800: (me, "node", 0),
+            801: (800, "chrome", rss_pages[801]),
+            900: (me, "node", 0)
+        }
+        for index, _ in enumerate(fake_playwright.chromium.browsers):
+            pid = 1000 + 10 * index
+            processes[pid] = (900, "chrome", rss_pages.get(pid, page_mb))
+            processes[pid + 1] = (pid, "chrome", rss_pages.get(pid + 1, page_mb))
+        return processes
+    
+    monkeypatch.setattr(browser_pool, "_read_processes", read_processes)
+    return SimpleNamespace(rss_pages=rss_pages, page_mb=page_mb)
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """
+    Route the shared HTTP client through an httpx.MockTransport.
+    
+    Usage:
+        requests = mock_http(lambda request: httpx.Response(200, json={...}))
+    
+    Returns the list the requests are recorded into.
+    """
+    from app.agents import http_client
+    
+    def install(handler):
+        requests = []
+        
+        def record(request):
+            requests.append(request)
+            return handler(request)
+        
+        monkeypatch.setattr(http_client, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(record)))
+        return requests
+    
+    return install
+
+
+def serve_github_corpus(request: httpx.Request) -> httpx.Response:
+    """
+    Serve a corpus page for a GITHUB_MIRROR_OPTIONS URL (404 if it is missing).
+    
+    Raw READMEs are served from <profile>/readmes/<repo>.md as README.md.
+    """
+    parts = request.url.path.strip("/").split("/")
+    if request.url.host == "raw.test":
+        username, repo, _, filename = parts
+        path = GITHUB_CORPUS / username / "readmes" / f"{repo}.md"
+        if filename != "README.md":
+            path = None
+    else:
+        path = GITHUB_CORPUS.joinpath(*parts)
+    
+    if path is None or not path.is_file():
+        return httpx.Response(404, text="Not Found")
+    return httpx.Response(200, text=path.read_text(), headers={"Content-Type": "text/html; charset=utf-8"})
+
+
+@pytest.fixture
+def github_mirror(mock_http):
+    """
+    Serve the corpus GitHub pages over the shared HTTP client.
+    
+    Usage:
+        requests = github_mirror.install()           # corpus pages only
+        requests = github_mirror.install(handler)    # handler (sync or async) first; None falls through
+        scraper = GitHubScraper(**github_mirror.options)
+        response = github_mirror.serve(request)      # the corpus page, for handlers to edit
+    """
+    def install(handler=None):
+        async def route(request):
+            response = handler(request) if handler else None
+            if inspect.isawaitable(response):
+                response = await response
+            return response if response is not None else serve_github_corpus(request)
+        return mock_http(route)
+    
+    return SimpleNamespace(options=dict(GITHUB_MIRROR_OPTIONS), install=install, serve=serve_github_corpus)
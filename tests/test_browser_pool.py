@@ -0,0 +1,121 @@
+"""
+Tests for the shared browser pool (app/agents/browser_pool.py).
+
+Author: Recruiter Copilot
+"""
+import asyncio
+
+import pytest
+
+from app.agents.browser_pool import BrowserPool, chromium_rss_mb
+
+
+async def _started_pool(fake_playwright, size: int = 2, **options) -> BrowserPool:
+    """A pool running on the fake driver (no Chromium needed)."""
+    pool = BrowserPool(size=size, **options)
+    pool._slots = asyncio.Semaphore(pool.size)
+    pool._lock = asyncio.Lock()
+    pool._playwright = fake_playwright
+    await pool._launch_browser()
+    return pool
+
+
+def test_lease_survives_browser_disconnect(fake_playwright):
+    """A lease in flight when its browser dies re-raises its own error, not KeyError."""
+    async def scenario():
+        pool = await _started_pool(fake_playwright)
+        dead_browser = pool.browser
+        
+        with pytest.raises(RuntimeError, match="scrape failed"):
+            async with pool.context() as context:
+                dead_browser.connected = False
+                # Another lease relaunches the browser while this one is in flight
+                async with pool.context() as other:
+                    assert other.browser is not dead_browser
+                raise RuntimeError("scrape failed")
+        
+        assert context.closed
+        assert dead_browser not in pool._leases
+        assert pool._leases == {pool.browser: 0}
+        assert pool.stats["browser_launches"] == 2
+        
+        # The pool keeps serving leases on the new browser
+        async with pool.context() as context:
+            assert context.browser is pool.browser
+        await pool.close()
+    
+    asyncio.run(scenario())
+
+
+def test_contexts_are_reused(fake_playwright):
+    """Default-option leases get the same context back; custom options get a dedicated one."""
+    async def scenario():
+        pool = await _started_pool(fake_playwright)
+        async with pool.context() as first:
+            pass
+        async with pool.context() as second:
+            pass
+        async with pool.context(java_script_enabled=False) as dedicated:
+            pass
+        
+        assert first is second
+        assert dedicated is not first and dedicated.closed
+        assert pool.stats["contexts_reused"] == 1
+        await pool.close()
+    
+    asyncio.run(scenario())
+
+
+def test_released_contexts_have_their_origins_storage_cleared(fake_playwright):
+    """Every origin a lease navigated to is wiped before the context is reused."""
+    async def scenario():
+        pool = await _started_pool(fake_playwright)
+        async with pool.context() as context:
+            page = await context.new_page()
+            await page.goto("https://github.com/octocat")
+            await page.goto("https://gist.github.com/octocat?tab=stars")
+            await page.goto("about:blank")
+            await page.close()
+        
+        assert context.cdp_commands == [
+            ("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            for origin in ("https://gist.github.com", "https://github.com")
+        ]
+        # The wipe page is neither served nor left open
+        assert pool._pages_served == 1
+        assert context.pages == []
+        
+        async with pool.context() as reused:
+            pass
+        assert reused is context
+        assert len(context.cdp_commands) == 2
+        await pool.close()
+    
+    asyncio.run(scenario())
+
+
+def test_rss_is_measured_on_the_pools_own_browser(fake_playwright, fake_proc):
+    """The governor measures the pool's browser tree, not every Chromium in the process."""
+    async def scenario():
+        pool = await _started_pool(fake_playwright, max_rss_mb=3, memory_check_interval=0)
+        assert (pool._browser_pid, pool._driver_pid) == (1000, 900)
+        assert chromium_rss_mb(1000) == 2.0
+        assert chromium_rss_mb() == 1026.0
+        
+        # 1 GB in another driver's browser does not trigger a recycle
+        pool._pages_served = 1
+        async with pool.context():
+            pass
+        assert pool.stats["browser_recycles"] == 0
+        assert pool._rss_mb == 2.0
+        
+        # A renderer of the pool's own browser growing past the limit does
+        fake_proc.rss_pages[1001] = 4 * fake_proc.page_mb
+        async with pool.context() as context:
+            assert context.browser is fake_playwright.chromium.browsers[1]
+        assert pool.stats["browser_recycles"] == 1
+        assert pool._browser_pid == 1010
+        assert not fake_playwright.chromium.browsers[0].connected
+        await pool.close()
+    
+    asyncio.run(scenario())
@@ -0,0 +1,158 @@
+"""
+Tests for the per-source circuit breaker (app/agents/circuit_breaker.py):
+state transitions on a fake clock, the single half-open probe and the
+classification of scrape errors and results.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+
+import httpx
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from app.agents import circuit_breaker
+from app.agents.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    ScrapeTargetError,
+    classify_error,
+    classify_result
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake time.monotonic() for the breaker; advance it with clock.now += seconds."""
+    class Clock:
+        now = 1000.0
+        
+        def monotonic(self):
+            return self.now
+    
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    return clock
+
+
+def fail(breaker: CircuitBreaker, times: int, outcome: str = "blocked") -> None:
+    """Record times failed scrapes."""
+    for _ in range(times):
+        breaker.record(breaker.allow(), outcome)
+
+
+def test_consecutive_failures_open_the_circuit(clock):
+    """Failures open the circuit at the threshold; a success in between resets the count."""
+    breaker = CircuitBreaker("github", failure_threshold=3, probe_interval=60)
+    
+    fail(breaker, 2)
+    breaker.record(breaker.allow(), None)
+    fail(breaker, 2, "server_error")
+    assert (breaker.state, breaker.consecutive_failures) == (STATE_CLOSED, 2)
+    
+    # Outcomes that say nothing about the target's health are successes
+    breaker.record(breaker.allow(), "not_found")
+    assert breaker.consecutive_failures == 0
+    
+    fail(breaker, 3, "timeout")
+    assert breaker.state == STATE_OPEN
+    assert breaker.allow() is None
+    assert breaker.retry_in() == 60.0
+    report = breaker.report()
+    assert (report["times_opened"], report["short_circuited"], report["failures"]) == (1, 1, 7)
+    assert report["last_failure"]["outcome"] == "timeout"
+
+
+def test_probe_success_closes_and_probe_failure_reopens(clock):
+    """After probe_interval exactly one probe goes through; its outcome decides the state."""
+    breaker = CircuitBreaker("linkedin", failure_threshold=1, probe_interval=60)
+    fail(breaker, 1)
+    
+    clock.now += 59
+    assert breaker.allow() is None
+    clock.now += 1
+    probe = breaker.allow()
+    assert probe is not None and breaker.state == STATE_HALF_OPEN
+    assert breaker.allow() is None
+    
+    breaker.record(probe, "blocked")
+    assert breaker.state == STATE_OPEN and breaker.retry_in() == 60.0
+    
+    clock.now += 60
+    probe = breaker.allow()
+    breaker.record(probe, None)
+    assert breaker.state == STATE_CLOSED
+    assert breaker.stats["probes"] == 2
+    assert breaker.allow() is not None
+
+
+def test_late_result_does_not_free_the_probe_slot(clock):
+    """A scrape started before the circuit opened cannot let a second probe out."""
+    breaker = CircuitBreaker("github", failure_threshold=1, probe_interval=60)
+    slow = breaker.allow()
+    fail(breaker, 1)
+    
+    clock.now += 60
+    probe = breaker.allow()
+    breaker.release(slow)
+    assert breaker.allow() is None
+    
+    # A late failure re-opens the circuit, but the probe is still out
+    breaker.record(slow, "timeout")
+    clock.now += 60
+    assert breaker.allow() is None
+    assert breaker.state == STATE_HALF_OPEN
+    
+    # The probe's own release frees the slot
+    breaker.release(probe)
+    assert breaker.allow() is not None
+    assert breaker.stats["probes"] == 2
+
+
+def test_reset_closes_the_circuit(clock):
+    """reset() closes an open circuit and frees the probe slot."""
+    breaker = CircuitBreaker("linkedin", failure_threshold=1)
+    fail(breaker, 1)
+    breaker.reset()
+    assert (breaker.state, breaker.consecutive_failures, breaker.retry_in()) == (STATE_CLOSED, 0, None)
+    assert breaker.allow() is not None
+
+
+def _status_error(status: int, headers: dict = None) -> httpx.HTTPStatusError:
+    """The error raise_for_status() raises for a response with status."""
+    request = httpx.Request("GET", "https://github.com/octocat")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError(f"HTTP {status}", request=request, response=response)
+
+
+@pytest.mark.parametrize("error, outcome", [
+    (ScrapeTargetError("blocked", "auth wall"), "blocked"),
+    (asyncio.TimeoutError(), "timeout"),
+    (httpx.ReadTimeout("read timed out"), "timeout"),
+    (PlaywrightTimeout("Timeout 15000ms exceeded"), "timeout"),
+    (_status_error(502), "server_error"),
+    (_status_error(403), "blocked"),
+    (_status_error(429), "blocked"),
+    (_status_error(404), None),
+    (ValueError("GitHub profile not found: ghost"), None),
+    (RuntimeError("worker lost"), None)
+])
+def test_errors_are_classified(error, outcome):
+    """Blocked, timed-out and 5xx scrapes count as failures; the rest do not."""
+    assert classify_error(error) == outcome
+
+
+@pytest.mark.parametrize("result, outcome", [
+    (None, None),
+    ({"name": "The Octocat"}, None),
+    ({"status": "scraping_failed", "reason": "blocked"}, "blocked"),
+    ({"status": "scraping_failed", "reason": "server_error"}, "server_error"),
+    ({"status": "scraping_failed", "reason": "no_cookies"}, None),
+    ({"name": None, "deadline": {"timed_out": ["profile"]}}, "timeout"),
+    ({"name": "The Octocat", "deadline": {"timed_out": ["languages"]}}, None)
+])
+def test_results_are_classified(result, outcome):
+    """LinkedIn fallbacks carry their reason; a GitHub profile that never loaded is a timeout."""
+    assert classify_result(result) == outcome
@@ -0,0 +1,201 @@
+"""
+Tests for the packed multi-year contribution history
+(app/agents/contribution_history.py), checked against a plain per-day list
+implementation of the same summaries.
+
+Author: Recruiter Copilot
+"""
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from app.agents.contribution_history import YearCalendar, longest_run, summarize_history
+
+
+def year_days(year):
+    """Every date of the year."""
+    day, days = date(year, 1, 1), []
+    while day.year == year:
+        days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def random_levels(year, seed, density=0.5):
+    """One 0-4 level per day, roughly density of them active."""
+    rng = random.Random(seed)
+    return [rng.randint(1, 4) if rng.random() < density else 0 for _ in year_days(year)]
+
+
+def calendar(year, levels, total=None):
+    """A YearCalendar built through from_days, as the scraper builds them."""
+    days = [(day.isoformat(), level, level) for day, level in zip(year_days(year), levels)]
+    return YearCalendar.from_days(year, days, total)
+
+
+def reference_longest(flags):
+    """Longest run of truthy flags, one day at a time."""
+    best = run = 0
+    for flag in flags:
+        run = run + 1 if flag else 0
+        best = max(best, run)
+    return best
+
+
+def reference_active_weeks(year, levels):
+    """Sunday-to-Saturday weeks with an active day, one day at a time."""
+    first_sunday = date(year, 1, 1) - timedelta(days=(date(year, 1, 1).weekday() + 1) % 7)
+    return len({
+        (day - first_sunday).days // 7
+        for day, level in zip(year_days(year), levels) if level
+    })
+
+
+# 2021 starts on a Friday, 2022 on a Saturday, 2023 on a Sunday, 2024
+# (a leap year) on a Monday
+@pytest.mark.parametrize("year", [2021, 2022, 2023, 2024])
+@pytest.mark.parametrize("density", [0.05, 0.5, 0.95])
+def test_year_summaries_match_a_per_day_count(year, density):
+    """Active days, longest streak and week folding agree with a list-based count."""
+    for seed in range(5):
+        levels = random_levels(year, year * 10 + seed, density)
+        packed = calendar(year, levels)
+        
+        assert len(packed.levels) == len(year_days(year))
+        assert list(packed.levels) == levels
+        assert packed.total == sum(levels)
+        assert packed.active_days() == sum(1 for level in levels if level)
+        assert packed.longest_streak() == reference_longest(levels)
+        assert packed.active_weeks() == reference_active_weeks(year, levels)
+
+
+@pytest.mark.parametrize("year", [2021, 2022, 2023, 2024])
+def test_partial_first_and_last_weeks_count_once(year):
+    """January 1st and December 31st each fall in their own partial week."""
+    levels = [0] * len(year_days(year))
+    levels[0] = levels[-1] = 1
+    
+    assert calendar(year, levels).active_weeks() == 2
+    assert reference_active_weeks(year, levels) == 2
+
+
+def test_week_boundaries_follow_sundays():
+    """Saturday and the next Sunday are different weeks; Sunday to Saturday is one."""
+    # 2023-01-07 is a Saturday
+    levels = [0] * 365
+    levels[6] = levels[7] = 1
+    assert calendar(2023, levels).active_weeks() == 2
+    
+    levels = [0] * 365
+    levels[7:14] = [1] * 7
+    assert calendar(2023, levels).active_weeks() == 1
+
+
+@pytest.mark.parametrize("mask, run", [(0, 0), (0b1, 1), (0b1011, 2), (0b1110111, 3), ((1 << 400) - 1, 400)])
+def test_longest_run(mask, run):
+    """Runs of set bits, including one longer than a year."""
+    assert longest_run(mask) == run
+
+
+def test_from_days_ignores_padding_and_marks_counts_active():
+    """GitHub's padding cells of the neighbouring years are dropped; a count without a level is active."""
+    days = [
+        ("2023-12-31", 4, 9),
+        ("2024-01-01", 2, 3),
+        ("2024-01-02", 0, 2),
+        ("2024-01-03", None, None),
+        ("2024-12-31", 9, 1),
+        ("2025-01-01", 4, 7),
+        (None, 1, 1),
+        ()
+    ]
+    
+    packed = YearCalendar.from_days(2024, days)
+    
+    assert (packed.levels[0], packed.levels[1], packed.levels[2], packed.levels[-1]) == (2, 1, 0, 4)
+    assert packed.total == 6
+    assert packed.active_days() == 3
+    assert YearCalendar.from_days(2024, days, total=40).total == 40
+
+
+def test_from_calendar_reads_the_heading_total():
+    """The yearly total comes from the calendar heading when there is one."""
+    raw = {"heading": "1,204 contributions in 2024", "days": [("2024-03-01", 1, 1)]}
+    
+    assert YearCalendar.from_calendar(2024, raw).total == 1204
+    assert YearCalendar.from_calendar(2024, {"heading": "", "days": raw["days"]}).total == 1
+
+
+def test_to_dict_round_trips():
+    """from_dict restores the packed levels and the summaries."""
+    packed = calendar(2024, random_levels(2024, 7))
+    
+    restored = YearCalendar.from_dict(packed.to_dict())
+    
+    assert restored.levels == packed.levels and restored.mask == packed.mask
+    assert restored.to_dict() == packed.to_dict()
+
+
+def test_lifetime_streak_crosses_year_boundaries():
+    """The concatenated masks keep a streak running from December into January."""
+    years = {year: [0] * len(year_days(year)) for year in (2022, 2023, 2024)}
+    # December 20th 2022 through January 10th 2024
+    years[2022][-12:] = [1] * 12
+    years[2023] = [1] * 365
+    years[2024][:10] = [1] * 10
+    calendars = [calendar(year, levels) for year, levels in years.items()]
+    
+    summary = summarize_history(list(reversed(calendars)))
+    
+    flags = [level for year in sorted(years) for level in years[year]]
+    assert summary["lifetime_longest_streak"] == reference_longest(flags) == 12 + 365 + 10
+    assert [entry["year"] for entry in summary["years"]] == [2022, 2023, 2024]
+    assert max(entry["longest_streak"] for entry in summary["years"]) == 365
+
+
+def test_lifetime_mask_matches_concatenated_days():
+    """Random multi-year histories agree with a streak over the concatenated day lists."""
+    for seed in range(10):
+        years = {year: random_levels(year, year * 10 + seed, density=0.9) for year in range(2019, 2025)}
+        
+        summary = summarize_history([calendar(year, levels) for year, levels in years.items()])
+        
+        flags = [level for year in sorted(years) for level in years[year]]
+        assert summary["lifetime_longest_streak"] == reference_longest(flags)
+        assert summary["lifetime_contributions"] == sum(flags)
+
+
+def test_missing_year_breaks_the_streak():
+    """A year without a calendar is empty, so streaks do not bridge it."""
+    full = {year: [1] * len(year_days(year)) for year in (2021, 2023)}
+    
+    summary = summarize_history([calendar(year, levels) for year, levels in full.items()])
+    
+    assert summary["lifetime_longest_streak"] == 365
+    assert summary["years_active"] == 2
+    # Active weeks are averaged over 2021-2023, the missing 2022 included
+    assert summary["mean_active_weeks"] == round((53 + 53) / 3, 1)
+
+
+def test_trim_empty_drops_leading_empty_years():
+    """Guessed years before the first contribution are dropped only with trim_empty."""
+    levels = random_levels(2024, 3)
+    calendars = [calendar(2022, [0] * 365), calendar(2023, [0] * 365), calendar(2024, levels)]
+    
+    kept = summarize_history(calendars)
+    trimmed = summarize_history(calendars, trim_empty=True)
+    
+    assert kept["first_year"] == trimmed["first_year"] == 2024
+    assert [entry["year"] for entry in kept["years"]] == [2022, 2023, 2024]
+    assert [entry["year"] for entry in trimmed["years"]] == [2024]
+    assert trimmed["mean_active_weeks"] == kept["mean_active_weeks"] == reference_active_weeks(2024, levels)
+    assert trimmed["packed_bytes"] < kept["packed_bytes"]
+
+
+def test_empty_history():
+    """No calendars summarize to zeros."""
+    summary = summarize_history([])
+    
+    assert summary["first_year"] is None
+    assert (summary["years_active"], summary["lifetime_longest_streak"], summary["mean_active_weeks"]) == (0, 0, 0.0)
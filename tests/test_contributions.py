@@ -0,0 +1,124 @@
+"""
+Tests for the contribution calendar statistics (app/agents/contributions.py)
+on hand-built calendars.
+
+Author: Recruiter Copilot
+"""
+from datetime import date, timedelta
+
+from app.agents.contributions import WEEKDAYS, summarize_calendar
+
+
+def build_calendar(start: date, counts):
+    """Calendar cells from start, one per count (None for a level-only active day)."""
+    days = []
+    for offset, count in enumerate(counts):
+        level = 0 if count == 0 else min(4, count or 1)
+        days.append([(start + timedelta(days=offset)).isoformat(), level, count])
+    return days
+
+
+# Monday, June 2nd 2025
+MONDAY = date(2025, 6, 2)
+
+
+def test_streaks_and_gaps():
+    """The longest active and inactive runs anywhere in the calendar."""
+    counts = [1, 2, 0, 0, 0, 3, 1, 1, 1, 0, 5]
+    stats = summarize_calendar(build_calendar(MONDAY, counts), today=MONDAY + timedelta(days=10))
+    
+    assert stats["longest_streak"] == 4
+    assert stats["longest_gap_days"] == 3
+    assert stats["active_days"] == 7
+    assert stats["contribution_streak"] == 1
+    assert stats["calendar_total"] == 14
+
+
+def test_empty_today_does_not_break_the_current_streak():
+    """No contributions yet today keeps yesterday's streak; an empty yesterday ends it."""
+    counts = [0, 1, 1, 1, 0]
+    today = MONDAY + timedelta(days=4)
+    
+    assert summarize_calendar(build_calendar(MONDAY, counts), today=today)["contribution_streak"] == 3
+    assert summarize_calendar(build_calendar(MONDAY, counts + [0]), today=today + timedelta(days=1))["contribution_streak"] == 0
+    assert summarize_calendar(build_calendar(MONDAY, [0, 1, 1, 1, 2]), today=today)["contribution_streak"] == 4
+
+
+def test_future_cells_are_ignored():
+    """GitHub's padding after today counts toward nothing, and today is the streak's end."""
+    counts = [1, 1, 1, 0, 0, 7, 7]
+    stats = summarize_calendar(build_calendar(MONDAY, counts), today=MONDAY + timedelta(days=3))
+    
+    assert stats["contribution_streak"] == 3
+    assert stats["longest_gap_days"] == 1
+    assert stats["calendar_total"] == 3
+
+
+def test_unordered_cells_are_sorted():
+    """Streaks are computed in date order whatever order the cells came in."""
+    days = build_calendar(MONDAY, [1, 1, 0, 1, 1, 1])
+    stats = summarize_calendar(list(reversed(days)), today=MONDAY + timedelta(days=5))
+    
+    assert (stats["longest_streak"], stats["contribution_streak"]) == (3, 3)
+
+
+def test_level_only_days_weigh_one_contribution():
+    """A day with a level but no count is active and counts once; a count without a level is active too."""
+    days = [
+        [MONDAY.isoformat(), 3, None],
+        [(MONDAY + timedelta(days=1)).isoformat(), 0, None],
+        [(MONDAY + timedelta(days=2)).isoformat(), 0, 4],
+        [(MONDAY + timedelta(days=3)).isoformat(), None, None],
+        [None, 4, 10],
+        []
+    ]
+    stats = summarize_calendar(days, today=MONDAY + timedelta(days=3))
+    
+    assert stats["calendar_total"] == 5
+    assert stats["active_days"] == 2
+    assert stats["longest_gap_days"] == 1
+    assert stats["weekday_distribution"]["Monday"] == 1
+    assert stats["weekday_distribution"]["Wednesday"] == 4
+
+
+def test_months_and_weekdays():
+    """Contributions are bucketed by calendar month and by weekday name."""
+    # Thursday, May 29th 2025 through Tuesday, June 3rd
+    start = date(2025, 5, 29)
+    counts = [2, 0, 3, 1, 4, 5]
+    stats = summarize_calendar(build_calendar(start, counts), today=date(2025, 6, 3))
+    
+    assert stats["contributions_by_month"] == [
+        {"month": "2025-05", "contributions": 5, "active_days": 2},
+        {"month": "2025-06", "contributions": 10, "active_days": 3}
+    ]
+    assert list(stats["weekday_distribution"]) == WEEKDAYS
+    assert stats["weekday_distribution"] == {
+        "Monday": 4, "Tuesday": 5, "Wednesday": 0, "Thursday": 2, "Friday": 0, "Saturday": 3, "Sunday": 1
+    }
+
+
+def test_year_long_calendar_matches_its_counts():
+    """Monthly and weekday totals both add up to the calendar total over a full year."""
+    start = date(2024, 1, 1)
+    counts = [(offset * 7) % 5 if offset % 11 else 0 for offset in range(366)]
+    stats = summarize_calendar(build_calendar(start, counts), today=date(2024, 12, 31))
+    
+    assert stats["calendar_total"] == sum(counts)
+    assert len(stats["contributions_by_month"]) == 12
+    assert sum(month["contributions"] for month in stats["contributions_by_month"]) == sum(counts)
+    assert sum(stats["weekday_distribution"].values()) == sum(counts)
+    assert stats["contributions_by_month"][1] == {
+        "month": "2024-02",
+        "contributions": sum(counts[31:60]),
+        "active_days": sum(1 for count in counts[31:60] if count)
+    }
+
+
+def test_empty_calendar():
+    """No cells give zeroed statistics."""
+    stats = summarize_calendar([], today=MONDAY)
+    
+    assert (stats["contribution_streak"], stats["longest_streak"], stats["longest_gap_days"]) == (0, 0, 0)
+    assert stats["contributions_by_month"] == []
+    assert set(stats["weekday_distribution"].values()) == {0}
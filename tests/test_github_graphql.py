@@ -0,0 +1,236 @@
+"""
+Tests for the GitHub GraphQL backend (app/agents/github_graphql.py) against
+an httpx.MockTransport stand-in for the GraphQL endpoint.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import json
+
+import httpx
+
+from app.agents.github_scraper import GitHubScraper
+
+
+GRAPHQL_URL = "https://graphql.test/graphql"
+
+
+def repo_node(name: str, language: str, size: int = 1000) -> dict:
+    """An owned-repository node of the RepositoryPage fragment."""
+    return {
+        "name": name,
+        "isFork": False,
+        "isArchived": False,
+        "primaryLanguage": {"name": language},
+        "languages": {"edges": [{"size": size, "node": {"name": language}}]}
+    }
+
+
+def repository_page(nodes: list, end_cursor: str = None) -> dict:
+    """A repositories connection; a cursor means more pages follow."""
+    return {
+        "totalCount": len(nodes),
+        "pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor},
+        "nodes": nodes
+    }
+
+
+def user_node(login: str, repositories: dict) -> dict:
+    """A user node of the UserFields fragment."""
+    return {
+        "login": login,
+        "name": login.title(),
+        "bio": None,
+        "location": None,
+        "company": None,
+        "websiteUrl": None,
+        "followers": {"totalCount": 10},
+        "following": {"totalCount": 2},
+        "repositories": repositories,
+        "pinnedItems": {"nodes": []},
+        "contributionsCollection": {
+            "contributionYears": [2024],
+            "contributionCalendar": {
+                "totalContributions": 3,
+                "weeks": [{"contributionDays": [
+                    {"date": "2024-06-01", "contributionCount": 3, "contributionLevel": "SECOND_QUARTILE"}
+                ]}]
+            }
+        }
+    }
+
+
+def graphql_scraper(**options) -> GitHubScraper:
+    """A GraphQL-backend scraper with no cache, history or activity sampling."""
+    return GitHubScraper(
+        backend="graphql",
+        github_token="test-token",
+        graphql_url=GRAPHQL_URL,
+        use_cache=False,
+        contribution_history=False,
+        repo_activity=False,
+        **options
+    )
+
+
+def test_repositories_are_paged_through(mock_http):
+    """Users with more than 100 repositories get their further pages by endCursor."""
+    def handler(request):
+        body = json.loads(request.content)
+        if "after" not in body["variables"]:
+            first = repository_page([repo_node(f"py{i}", "Python") for i in range(100)], end_cursor="c1")
+            return httpx.Response(200, json={"data": {"u0": user_node("prolific", first)}})
+        if body["variables"]["after"] == "c1":
+            page = repository_page([repo_node(f"go{i}", "Go") for i in range(100)], end_cursor="c2")
+        else:
+            page = repository_page([repo_node("last", "Rust")])
+        return httpx.Response(200, json={"data": {"user": {"repositories": page}}})
+    
+    requests = mock_http(handler)
+    result = asyncio.run(graphql_scraper().scrape("https://github.com/prolific"))
+    
+    assert len(requests) == 3
+    assert [json.loads(r.content)["variables"].get("after") for r in requests[1:]] == ["c1", "c2"]
+    counts = {language["name"]: language["repo_count"] for language in result["all_languages"]}
+    assert counts == {"Python": 100, "Go": 100, "Rust": 1}
+    assert result["repositories_truncated"] is False
+
+
+def test_repository_pages_are_capped(mock_http):
+    """Pages past max_repo_pages are left unread and the result says so."""
+    def handler(request):
+        body = json.loads(request.content)
+        cursor = body["variables"].get("after")
+        page = repository_page([repo_node(f"r{cursor}", "C")], end_cursor=f"{cursor or ''}x")
+        if cursor is None:
+            return httpx.Response(200, json={"data": {"u0": user_node("huge", page)}})
+        return httpx.Response(200, json={"data": {"user": {"repositories": page}}})
+    
+    requests = mock_http(handler)
+    result = asyncio.run(graphql_scraper(max_repo_pages=2).scrape("https://github.com/huge"))
+    
+    assert len(requests) == 2
+    assert result["repositories_truncated"] is True
+    assert result["all_languages"][0]["repo_count"] == 2
+
+
+def test_batch_is_one_aliased_request(mock_http):
+    """Each login gets its own alias; an unknown login comes back as None."""
+    def handler(request):
+        body = json.loads(request.content)
+        assert body["variables"] == {"u0": "octocat", "u1": "ghost"}
+        assert "u0: user(login: $u0)" in body["query"]
+        assert "u1: user(login: $u1)" in body["query"]
+        return httpx.Response(200, json={
+            "data": {"u0": user_node("octocat", repository_page([repo_node("hello", "Python")])), "u1": None},
+            "errors": [{"type": "NOT_FOUND", "path": ["u1"], "message": "Could not resolve to a User with the login of 'ghost'."}]
+        })
+    
+    requests = mock_http(handler)
+    results = asyncio.run(graphql_scraper().scrape_graphql_batch(
+        ["https://github.com/octocat", "https://github.com/ghost"]
+    ))
+    
+    assert len(requests) == 1
+    assert requests[0].headers["Authorization"] == "Bearer test-token"
+    assert results["ghost"] is None
+    assert results["octocat"]["name"] == "Octocat"
+    assert results["octocat"]["all_languages"][0]["name"] == "Python"
+
+
+def test_field_errors_keep_the_data(mock_http):
+    """An error inside a resolved user does not discard it."""
+    def handler(request):
+        return httpx.Response(200, json={
+            "data": {"u0": user_node("octocat", repository_page([])), "u1": None},
+            "errors": [
+                {"type": "FORBIDDEN", "path": ["u0", "pinnedItems"], "message": "Resource not accessible"},
+                {"type": "NOT_FOUND", "path": ["u1"], "message": "Could not resolve to a User"}
+            ]
+        })
+    
+    mock_http(handler)
+    results = asyncio.run(graphql_scraper().scrape_graphql_batch(["octocat", "ghost"]))
+    
+    assert results["octocat"]["username"] == "octocat"
+    assert results["ghost"] is None
+
+
+def test_empty_alias_without_not_found_falls_back_to_html(github_mirror):
+    """A user nulled by a resource-limit error is retried over HTML, not reported missing."""
+    def handler(request):
+        if request.url.host == "graphql.test":
+            return httpx.Response(200, json={
+                "data": {"u0": None},
+                "errors": [{"type": "RESOURCE_LIMITS_EXCEEDED", "path": ["u0"], "message": "Resource limits exceeded"}]
+            })
+    
+    github_mirror.install(handler)
+    scraper = GitHubScraper(**{
+        **github_mirror.options,
+        "backend": "graphql",
+        "github_token": "test-token",
+        "graphql_url": GRAPHQL_URL,
+        "contribution_history": False
+    })
+    result = asyncio.run(scraper.scrape("https://github.com/octocat"))
+    
+    assert "Resource limits exceeded" in result["graphql_fallback"]
+    assert result["name"] == "The Octocat"
+
+
+def test_errors_without_data_raise(mock_http):
+    """A response with errors and no data is a failed request."""
+    def handler(request):
+        return httpx.Response(200, json={"errors": [{"type": "RATE_LIMITED", "message": "API rate limit exceeded"}]})
+    
+    mock_http(handler)
+    try:
+        asyncio.run(graphql_scraper().scrape_graphql_batch(["octocat"]))
+    except RuntimeError as e:
+        assert "API rate limit exceeded" in str(e)
+    else:
+        raise AssertionError("expected a RuntimeError")
+
+
+def test_unknown_login_is_not_retried_over_html(github_mirror):
+    """scrape() raises for a login GraphQL reports as missing."""
+    def handler(request):
+        if request.url.host == "graphql.test":
+            return httpx.Response(200, json={
+                "data": {"u0": None},
+                "errors": [{"type": "NOT_FOUND", "path": ["u0"], "message": "Not found"}]
+            })
+    
+    requests = github_mirror.install(handler)
+    scraper = GitHubScraper(**{**github_mirror.options, "backend": "graphql", "github_token": "test-token", "graphql_url": GRAPHQL_URL})
+    try:
+        asyncio.run(scraper.scrape("https://github.com/ghost"))
+    except ValueError as e:
+        assert "not found" in str(e)
+    else:
+        raise AssertionError("expected a ValueError")
+    assert len(requests) == 1
+
+
+def test_graphql_failure_falls_back_to_html(github_mirror):
+    """An API outage retries the profile with the http backend."""
+    def handler(request):
+        if request.url.host == "graphql.test":
+            return httpx.Response(502, text="Bad Gateway")
+    
+    requests = github_mirror.install(handler)
+    scraper = GitHubScraper(**{
+        **github_mirror.options,
+        "backend": "graphql",
+        "github_token": "test-token",
+        "graphql_url": GRAPHQL_URL,
+        "contribution_history": False
+    })
+    result = asyncio.run(scraper.scrape("https://github.com/octocat"))
+    
+    assert requests[0].url.host == "graphql.test"
+    assert any(request.url.path == "/octocat/profile.html" for request in requests)
+    assert "502" in result["graphql_fallback"]
+    assert result["name"] == "The Octocat"
+    assert result["completeness"]["profile"] == 1.0
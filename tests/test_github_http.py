@@ -0,0 +1,196 @@
+"""
+Tests for the browserless GitHub backend (GitHubScraper backend="http")
+against the saved corpus pages served through httpx.MockTransport.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.agents.github_scraper import GitHubScraper
+
+
+def http_scraper(github_mirror, **options) -> GitHubScraper:
+    """An http-backend scraper reading the corpus mirror."""
+    return GitHubScraper(**{**github_mirror.options, "contribution_history": False, **options})
+
+
+def test_profile_is_scraped_from_the_corpus(github_mirror):
+    """Every phase is read from the server-rendered pages."""
+    requests = github_mirror.install()
+    result = asyncio.run(http_scraper(github_mirror).scrape("https://github.com/octocat"))
+    
+    assert (result["name"], result["followers"], result["following"]) == ("The Octocat", 18200, 9)
+    assert result["commits_12_months"] == 1234
+    assert [repo["name"] for repo in result["pinned_repos"]][:2] == ["Hello-World", "Spoon-Knife"]
+    assert result["top_languages"][0]["name"] == "JavaScript"
+    assert result["readme_complexity_score"] > 0
+    assert set(result["completeness"].values()) == {1.0}
+    
+    paths = {request.url.path for request in requests}
+    assert {"/octocat/profile.html", "/octocat/contributions.html", "/octocat/repositories-3.html"} <= paths
+    assert "/octocat/Hello-World/HEAD/README.md" in paths
+
+
+def test_contribution_graph_failure_is_missing_data(github_mirror):
+    """A failing non-profile page leaves its phase empty instead of failing the scrape."""
+    def handler(request):
+        if request.url.path.endswith("contributions.html"):
+            return httpx.Response(503, text="Service Unavailable")
+    
+    github_mirror.install(handler)
+    result = asyncio.run(http_scraper(github_mirror).scrape("https://github.com/octocat"))
+    
+    assert result["name"] == "The Octocat"
+    assert result["commits_12_months"] == 0
+    assert result["completeness"]["contributions"] == 0.0
+    assert result["completeness"]["profile"] == 1.0
+
+
+def test_repository_page_failure_keeps_the_pages_read(github_mirror):
+    """Languages come from the repositories pages that did load."""
+    def handler(request):
+        if request.url.path.endswith("repositories-2.html"):
+            return httpx.Response(500)
+    
+    github_mirror.install(handler)
+    result = asyncio.run(http_scraper(github_mirror).scrape("https://github.com/octocat"))
+    
+    assert result["all_languages"]
+    assert 0.0 < result["completeness"]["languages"] < 1.0
+
+
+@pytest.mark.parametrize("status, error", [(404, ValueError), (502, httpx.HTTPStatusError)])
+def test_profile_failure_fails_the_scrape_without_stray_fetches(github_mirror, status, error):
+    """A missing or failing profile page raises once the sibling fetches have finished."""
+    async def handler(request):
+        if request.url.path.endswith("profile.html"):
+            return httpx.Response(status)
+        # The other pages are still loading when the profile fails
+        await asyncio.sleep(0.05)
+    
+    requests = github_mirror.install(handler)
+    
+    async def scenario():
+        with pytest.raises(error):
+            await http_scraper(github_mirror).scrape("https://github.com/octocat")
+        return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    
+    assert asyncio.run(scenario()) == []
+    assert any(request.url.path.endswith("repositories-1.html") for request in requests)
+
+
+def test_readmes_take_one_api_request_per_repo_with_a_token(github_mirror):
+    """With a token the REST readme endpoint resolves the file name; no raw candidates are tried."""
+    def handler(request):
+        if request.url.host == "api.test":
+            # GET /repos/{owner}/{repo}/readme
+            _, username, repo, _ = request.url.path.strip("/").split("/")
+            assert request.headers["Accept"] == "application/vnd.github.raw"
+            assert request.headers["Authorization"] == "Bearer test-token"
+            return github_mirror.serve(httpx.Request("GET", f"https://raw.test/{username}/{repo}/HEAD/README.md"))
+    
+    requests = github_mirror.install(handler)
+    scraper = http_scraper(github_mirror, github_token="test-token", api_url="https://api.test")
+    result = asyncio.run(scraper.scrape("https://github.com/octocat"))
+    
+    readme_requests = [request for request in requests if request.url.path.endswith("/readme")]
+    assert len(readme_requests) == len(result["pinned_repos"])
+    assert not any(request.url.host == "raw.test" for request in requests)
+    assert result["readme_complexity_score"] > 0
+
+
+@pytest.mark.parametrize("token", [None, "test-token"])
+def test_readmes_of_other_owners_pinned_repos(github_mirror, token):
+    """A pinned "owner/name" repo is read from its owner, not the profile's login."""
+    def handler(request):
+        # The corpus keeps linguist's README under octocat; serve it only to its real owner
+        parts = request.url.path.strip("/").split("/")
+        owner, repo = parts[1:3] if request.url.host == "api.test" else parts[:2]
+        if owner != "github":
+            return httpx.Response(404)
+        return github_mirror.serve(httpx.Request("GET", f"https://raw.test/octocat/{repo}/HEAD/README.md"))
+    
+    requests = github_mirror.install(handler)
+    scraper = http_scraper(github_mirror, github_token=token, api_url="https://api.test")
+    score = asyncio.run(scraper._analyze_readme_complexity("octocat", [{"name": "github/linguist"}]))
+    
+    paths = [request.url.path for request in requests]
+    assert paths[0] in ("/github/linguist/HEAD/README.md", "/repos/github/linguist/readme")
+    assert score > 0
+
+
+def test_scrape_many_batches_and_isolates_failures(github_mirror):
+    """Profiles run `concurrency` at a time and come back in completion order; a missing one is an error item."""
+    async def handler(request):
+        # The missing profile answers last
+        if request.url.path == "/ghost/profile.html":
+            await asyncio.sleep(0.05)
+    
+    github_mirror.install(handler)
+    scraper = http_scraper(github_mirror)
+    scrape = scraper.scrape
+    running, peak = set(), []
+    
+    async def tracked(github_url, **options):
+        running.add(github_url)
+        peak.append(len(running))
+        try:
+            return await scrape(github_url, **options)
+        finally:
+            running.discard(github_url)
+    
+    scraper.scrape = tracked
+    urls = ["https://github.com/ghost", "https://github.com/octocat", "https://github.com/newcomer"]
+    
+    async def scenario():
+        return [item async for item in scraper.scrape_many(urls, concurrency=2)]
+    
+    items = asyncio.run(scenario())
+    
+    assert max(peak) == 2
+    assert [item["username"] for item in items][-1] == "ghost"
+    assert {item["username"] for item in items} == {"ghost", "octocat", "newcomer"}
+    by_user = {item["username"]: item for item in items}
+    assert by_user["octocat"]["status"] == "ok" and by_user["octocat"]["data"]["name"] == "The Octocat"
+    assert by_user["newcomer"]["status"] == "ok" and by_user["newcomer"]["error"] is None
+    assert by_user["ghost"]["status"] == "error" and by_user["ghost"]["data"] is None
+    assert "ghost" in by_user["ghost"]["error"]
+    stats = scraper.batch_stats
+    assert (stats["total"], stats["completed"], stats["succeeded"], stats["failed"]) == (3, 3, 2, 1)
+    assert stats["concurrency"] == 2
+
+
+def test_scrape_many_stopped_early_cancels_the_rest(github_mirror):
+    """Closing the generator after the first item cancels the profiles still running."""
+    async def handler(request):
+        if request.url.path == "/octocat/profile.html":
+            await asyncio.sleep(10)
+    
+    github_mirror.install(handler)
+    scraper = http_scraper(github_mirror)
+    scrape = scraper.scrape
+    cancelled = []
+    
+    async def tracked(github_url, **options):
+        try:
+            return await scrape(github_url, **options)
+        except asyncio.CancelledError:
+            cancelled.append(github_url)
+            raise
+    
+    scraper.scrape = tracked
+    
+    async def scenario():
+        batch = scraper.scrape_many(["https://github.com/octocat", "https://github.com/newcomer"], concurrency=2)
+        first = await batch.__anext__()
+        await batch.aclose()
+        return first
+    
+    first = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert first["username"] == "newcomer"
+    assert cancelled == ["https://github.com/octocat"]
+    assert scraper.batch_stats["completed"] == 1
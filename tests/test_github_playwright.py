@@ -0,0 +1,245 @@
+"""
+Tests for the Playwright GitHub backend's extraction, with page stubs
+rendering the saved corpus pages.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.agents.circuit_breaker import STATE_OPEN, CircuitBreaker, classify_error
+from app.agents.github_parsers import parse_profile_overview
+from app.agents.github_scraper import GitHubScraper
+from app.agents.scrape_deadline import ScrapeDeadline
+
+
+class CorpusPage:
+    """Page stub rendering the corpus page of a URL, with every selector attached."""
+    
+    def __init__(self, serve):
+        self.serve = serve
+        self.html = ""
+        self.closed = False
+    
+    async def goto(self, url, **kwargs):
+        self.html = self.serve(httpx.Request("GET", url)).text
+        return None
+    
+    async def wait_for_selector(self, selector, **kwargs):
+        return object()
+    
+    async def query_selector(self, selector):
+        return None
+    
+    async def content(self):
+        return self.html
+    
+    async def close(self):
+        self.closed = True
+
+
+class ErrorPage(CorpusPage):
+    """Page stub whose navigation gets an error response; no selector ever attaches."""
+    
+    def __init__(self, status):
+        super().__init__(lambda request: httpx.Response(status, text="<html></html>"))
+        self.status = status
+        self.selector_waits = 0
+    
+    async def goto(self, url, **kwargs):
+        await super().goto(url, **kwargs)
+        return SimpleNamespace(status=self.status, headers={})
+    
+    async def wait_for_selector(self, selector, **kwargs):
+        self.selector_waits += 1
+        raise AssertionError("an error page must not be waited on")
+
+
+class CorpusContext:
+    """Context stub whose pages render the corpus."""
+    
+    def __init__(self, serve):
+        self.serve = serve
+    
+    async def new_page(self):
+        return CorpusPage(self.serve)
+
+
+def test_profile_is_parsed_from_the_rendered_page(github_mirror):
+    """The profile overview and pinned repos come from one page.content() snapshot."""
+    scraper = GitHubScraper(**{**github_mirror.options, "backend": "playwright"})
+    page = CorpusPage(github_mirror.serve)
+    
+    profile_data, pinned_repos = asyncio.run(scraper._load_profile(page, "octocat"))
+    
+    html = page.html
+    assert profile_data == scraper._profile_overview_from_raw(parse_profile_overview(html))
+    assert (profile_data["name"], profile_data["followers"]) == ("The Octocat", 18200)
+    assert [repo["name"] for repo in pinned_repos][:2] == ["Hello-World", "Spoon-Knife"]
+
+
+def test_contributions_and_repository_pages_are_parsed(github_mirror):
+    """The contribution fragment and each repositories page are parsed like the http backend's."""
+    scraper = GitHubScraper(**{**github_mirror.options, "backend": "playwright"})
+    context = CorpusContext(github_mirror.serve)
+    
+    async def scenario():
+        contributions = await scraper._scrape_contribution_fragment(context, "octocat")
+        repositories = await scraper._scrape_repository_page(context, "octocat", 1)
+        return contributions, repositories
+    
+    contributions, repositories = asyncio.run(scenario())
+    
+    assert contributions["commits_12_months"] == 1234
+    assert repositories["total_pages"] == 3
+    assert repositories["repos"]
+
+
+@pytest.mark.parametrize("status, outcome", [(429, "blocked"), (503, "server_error")])
+def test_error_pages_open_the_circuit(github_mirror, status, outcome):
+    """A rate-limit or 5xx profile page raises like the http backend and opens the breaker."""
+    scraper = GitHubScraper(**{**github_mirror.options, "backend": "playwright"})
+    breaker = CircuitBreaker("github", failure_threshold=3, probe_interval=60)
+    
+    async def attempt():
+        page = ErrorPage(status)
+        with pytest.raises(httpx.HTTPStatusError) as error:
+            await scraper._load_profile(page, "octocat")
+        assert page.selector_waits == 0
+        return classify_error(error.value)
+    
+    for _ in range(3):
+        call = breaker.allow()
+        assert call is not None
+        breaker.record(call, asyncio.run(attempt()))
+    
+    assert breaker.last_failure["outcome"] == outcome
+    assert breaker.state == STATE_OPEN
+    assert breaker.allow() is None
+
+
+def test_error_repository_page_is_a_failed_page(github_mirror):
+    """A throttled repositories page is missing data, not an empty repo list."""
+    scraper = GitHubScraper(**{**github_mirror.options, "backend": "playwright"})
+    
+    class ThrottledContext:
+        async def new_page(self):
+            return ErrorPage(429)
+    
+    assert asyncio.run(scraper._scrape_repository_page(ThrottledContext(), "octocat", 2)) is None
+
+
+class RecordingPage(CorpusPage):
+    """Corpus page logging every browser call; the profile takes a while to load."""
+    
+    def __init__(self, serve, log):
+        super().__init__(serve)
+        self.log = log
+    
+    async def goto(self, url, **kwargs):
+        self.log.append(("goto", url))
+        if url.endswith("/profile.html"):
+            await asyncio.sleep(0.05)
+        result = await super().goto(url, **kwargs)
+        self.log.append(("loaded", url))
+        return result
+    
+    async def wait_for_selector(self, selector, **kwargs):
+        self.log.append(("wait_for_selector", selector))
+        return await super().wait_for_selector(selector, **kwargs)
+    
+    async def query_selector(self, selector):
+        self.log.append(("query_selector", selector))
+        return None
+    
+    async def content(self):
+        self.log.append(("content", None))
+        return await super().content()
+    
+    def __getattr__(self, name):
+        # evaluate, $$eval, inner_text, ... would each be another roundtrip
+        raise AssertionError(f"unexpected page call: {name}")
+
+
+class RecordingContext:
+    """Context stub handing out recording corpus pages and tracking how many are open."""
+    
+    def __init__(self, serve):
+        self.serve = serve
+        self.log = []
+        self.open = 0
+        self.peak = 0
+    
+    async def new_page(self):
+        self.open += 1
+        self.peak = max(self.peak, self.open)
+        page = RecordingPage(self.serve, self.log)
+        close = page.close
+        
+        async def closing():
+            self.open -= 1
+            await close()
+        
+        page.close = closing
+        return page
+
+
+def test_profile_extraction_is_one_content_roundtrip(github_mirror):
+    """After the navigation, the overview and pinned repos cost one 404 check and one page.content()."""
+    scraper = GitHubScraper(**{**github_mirror.options, "backend": "playwright"})
+    context = RecordingContext(github_mirror.serve)
+    
+    async def scenario():
+        page = await context.new_page()
+        return await scraper._load_profile(page, "octocat")
+    
+    profile_data, pinned_repos = asyncio.run(scenario())
+    
+    loaded = context.log.index(("loaded", "https://github.test/octocat/profile.html"))
+    calls = [call for call, _ in context.log[loaded + 1:] if call != "wait_for_selector"]
+    assert calls == ["query_selector", "content"]
+    assert profile_data["name"] == "The Octocat"
+    assert len(pinned_repos) == 6
+
+
+def test_repositories_tab_loads_alongside_the_profile(github_mirror):
+    """The repositories tab and the profile load in parallel pages; the profile is never reloaded."""
+    github_mirror.install()
+    scraper = GitHubScraper(**{
+        **github_mirror.options,
+        "backend": "playwright",
+        "javascript_enabled": False,
+        "block_resources": False,
+        "contribution_history": False
+    })
+    context = RecordingContext(github_mirror.serve)
+    
+    @asynccontextmanager
+    async def browser_context():
+        yield context
+    
+    scraper._browser_context = browser_context
+    deadline = ScrapeDeadline(None, scraper.phase_budgets)
+    
+    result = asyncio.run(scraper._scrape_playwright("octocat", deadline))
+    
+    log = context.log
+    profile = "https://github.test/octocat/profile.html"
+    repositories = "https://github.test/octocat/repositories-1.html"
+    assert log.count(("goto", profile)) == 1
+    # The first repositories page is requested before the profile has loaded
+    assert log.index(("goto", repositories)) < log.index(("loaded", profile))
+    assert context.peak >= 2 and context.open == 0
+    assert {url for call, url in log if call == "goto"} >= {
+        profile,
+        "https://github.test/octocat/contributions.html",
+        repositories,
+        "https://github.test/octocat/repositories-3.html"
+    }
+    assert result["name"] == "The Octocat"
+    assert result["top_languages"][0]["name"] == "JavaScript"
+    assert result["readme_complexity_score"] > 0
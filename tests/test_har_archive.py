@@ -0,0 +1,88 @@
+"""
+Tests for HAR recording (app/agents/har_archive.py): nothing secret may
+reach the HAR file on disk.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import json
+
+from app.agents import linkedin_scraper
+from app.agents.har_archive import HarArchive
+from app.agents.linkedin_scraper import LinkedInScraper
+
+
+SECRET = "AQEDAT-session-token"
+
+
+def secret_entry(url: str = "https://www.linkedin.com/in/jane-doe") -> dict:
+    """A HAR entry carrying credentials in both directions, as Playwright records it."""
+    return {
+        "startedDateTime": "2024-06-01T00:00:00Z",
+        "time": 12.0,
+        "request": {
+            "method": "GET",
+            "url": url,
+            "httpVersion": "HTTP/1.1",
+            "headers": [
+                {"name": "Accept", "value": "text/html"},
+                {"name": "Cookie", "value": f"li_at={SECRET}"},
+                {"name": "Authorization", "value": f"Bearer {SECRET}"}
+            ],
+            "queryString": [],
+            "cookies": [{"name": "li_at", "value": SECRET}],
+            "headersSize": -1,
+            "bodySize": 0
+        },
+        "response": {
+            "status": 200,
+            "statusText": "OK",
+            "httpVersion": "HTTP/1.1",
+            "headers": [
+                {"name": "Content-Type", "value": "text/html"},
+                {"name": "Set-Cookie", "value": f"li_at={SECRET}; Path=/; Secure"}
+            ],
+            "cookies": [{"name": "li_at", "value": SECRET}],
+            "content": {"size": 13, "mimeType": "text/html", "text": "<html></html>"},
+            "redirectURL": "",
+            "headersSize": -1,
+            "bodySize": 13
+        },
+        "cache": {},
+        "timings": {"send": 0, "wait": 12.0, "receive": 0}
+    }
+
+
+def test_redact_strips_request_and_response_credentials():
+    """Cookie, Authorization and Set-Cookie headers and both cookie lists are dropped."""
+    entry = HarArchive.redact(secret_entry())
+    
+    assert SECRET not in json.dumps(entry)
+    assert [header["name"] for header in entry["request"]["headers"]] == ["Accept"]
+    assert [header["name"] for header in entry["response"]["headers"]] == ["Content-Type"]
+    assert entry["request"]["cookies"] == entry["response"]["cookies"] == []
+
+
+def test_linkedin_recording_saves_a_redacted_har(fake_playwright, monkeypatch, tmp_path):
+    """A recorded LinkedIn scrape closes its context, so the HAR is collected and saved redacted."""
+    cookies_file = tmp_path / "linkedin_cookies.json"
+    cookies_file.write_text(json.dumps([{"name": "li_at", "value": SECRET, "domain": ".linkedin.com"}]))
+    har_path = tmp_path / "har" / "jane-doe.har"
+    monkeypatch.setattr(linkedin_scraper, "async_playwright", lambda: fake_playwright)
+    
+    scraper = LinkedInScraper(har_mode="record", har_path=str(har_path), persistent_session=False)
+    scraper.COOKIES_FILE = cookies_file
+    
+    async def scenario():
+        async with scraper._page() as page:
+            page.context.har_entries.append(secret_entry())
+        return page
+    
+    page = asyncio.run(scenario())
+    
+    assert page.context.closed
+    assert not list(har_path.parent.glob("*.part"))
+    saved = har_path.read_text()
+    assert SECRET not in saved
+    entries = json.loads(saved)["log"]["entries"]
+    assert [entry["request"]["url"] for entry in entries] == ["https://www.linkedin.com/in/jane-doe"]
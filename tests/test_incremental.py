@@ -0,0 +1,145 @@
+"""
+Tests for incremental re-scrapes (GitHubScraper._scrape_incremental) on the
+corpus mirror: an expired cache entry is refreshed from a two-request
+fingerprint.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import json
+
+import httpx
+
+from app.agents import har_archive
+from app.agents.github_scraper import GitHubScraper
+from app.agents.scrape_cache import ScrapeCache
+
+
+def refreshing_scraper(github_mirror, **options) -> GitHubScraper:
+    """A scraper whose cache entries are always expired, so every scrape refreshes."""
+    cache = ScrapeCache(ttl_seconds=0, max_age_seconds=0)
+    scraper = GitHubScraper(**{
+        **github_mirror.options,
+        "use_cache": True,
+        "incremental": True,
+        "contribution_history": False,
+        "cache": cache,
+        **options
+    })
+    cache.invalidate(scraper._cache_key("octocat"))
+    return scraper
+
+
+def test_unchanged_profile_costs_two_requests(github_mirror):
+    """Every phase is reused when the fingerprint matches."""
+    requests = github_mirror.install()
+    scraper = refreshing_scraper(github_mirror)
+    
+    async def scenario():
+        first = await scraper.scrape("https://github.com/octocat")
+        sent = len(requests)
+        second = await scraper.scrape("https://github.com/octocat")
+        return first, second, requests[sent:]
+    
+    first, second, refresh_requests = asyncio.run(scenario())
+    
+    assert "incremental" not in first
+    assert sorted(request.url.path for request in refresh_requests) == [
+        "/octocat/contributions.html", "/octocat/profile.html"
+    ]
+    assert second["incremental"]["changed"] == []
+    assert second["incremental"]["reused"] == ["languages", "readmes"]
+    assert second["all_languages"] == first["all_languages"]
+    assert second["readme_complexity_score"] == first["readme_complexity_score"]
+
+
+def _with_new_repository(github_mirror, changed: dict):
+    """Mirror handler adding a public repository once changed["repos"] is set."""
+    def handler(request):
+        if changed.get("repos") and request.url.path.endswith("profile.html"):
+            html = github_mirror.serve(request).text
+            return httpx.Response(200, text=html.replace('class="Counter">8</span>', 'class="Counter">9</span>'))
+    return handler
+
+
+def test_changed_repo_count_refreshes_languages_only(github_mirror):
+    """The http backend re-reads the repositories tab and keeps the READMEs."""
+    changed = {}
+    requests = github_mirror.install(_with_new_repository(github_mirror, changed))
+    scraper = refreshing_scraper(github_mirror)
+    
+    async def scenario():
+        await scraper.scrape("https://github.com/octocat")
+        changed["repos"] = True
+        sent = len(requests)
+        return await scraper.scrape("https://github.com/octocat"), requests[sent:]
+    
+    result, refresh_requests = asyncio.run(scenario())
+    
+    assert result["public_repos"] == 9
+    assert result["incremental"]["changed"] == ["public_repos"]
+    assert result["incremental"]["refreshed"] == ["profile", "contributions", "languages"]
+    assert result["incremental"]["reused"] == ["readmes"]
+    paths = [request.url.path for request in refresh_requests]
+    assert len(paths) == 5
+    assert not any(path.endswith("README.md") for path in paths)
+
+
+def test_playwright_backend_skips_the_fingerprint(github_mirror):
+    """A playwright refresh is a full playwright scrape with nothing fetched before it."""
+    requests = github_mirror.install()
+    scraper = refreshing_scraper(github_mirror)
+    cache_key = scraper._cache_key("octocat", "playwright")
+    scraper.cache.invalidate(cache_key)
+    browser_scrapes = []
+    
+    async def scrape_playwright(username, deadline):
+        # The corpus pages stand in for the rendered ones
+        browser_scrapes.append(len(requests))
+        result = await scraper._scrape_http(username, deadline)
+        result.update(backend="playwright", resource_blocking={"blocked": 0})
+        return result
+    
+    scraper._scrape_playwright = scrape_playwright
+    
+    async def scenario():
+        await scraper.scrape("https://github.com/octocat", backend="playwright")
+        sent = len(requests)
+        return await scraper.scrape("https://github.com/octocat", backend="playwright"), sent
+    
+    result, sent = asyncio.run(scenario())
+    
+    assert "incremental" not in result
+    assert (result["backend"], result["resource_blocking"]) == ("playwright", {"blocked": 0})
+    assert browser_scrapes[1] == sent
+    assert scraper.cache.peek(cache_key)[0]["backend"] == "playwright"
+
+
+def test_recorded_refresh_saves_the_fingerprint_requests(github_mirror, monkeypatch, tmp_path):
+    """In HAR record mode the incremental path writes its requests to the HAR."""
+    def streamed(request):
+        # A streamed body, so the recorder's response hook sees it read and timed
+        page = github_mirror.serve(request)
+        return httpx.Response(page.status_code, headers=page.headers, stream=httpx.ByteStream(page.content))
+    
+    monkeypatch.setattr(
+        har_archive, "create_http_client",
+        lambda **options: httpx.AsyncClient(transport=httpx.MockTransport(streamed), **options)
+    )
+    har_path = tmp_path / "octocat.har"
+    scraper = refreshing_scraper(github_mirror, har_mode="record", har_path=str(har_path))
+    
+    async def scenario():
+        await scraper.scrape("https://github.com/octocat")
+        har_path.unlink()
+        result = await scraper.scrape("https://github.com/octocat")
+        await scraper.close()
+        return result
+    
+    result = asyncio.run(scenario())
+    
+    assert result["incremental"]["changed"] == []
+    entries = json.loads(har_path.read_text())["log"]["entries"]
+    assert {entry["request"]["url"] for entry in entries} >= {
+        "https://github.test/octocat/profile.html", "https://github.test/octocat/contributions.html"
+    }
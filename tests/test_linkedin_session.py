@@ -0,0 +1,103 @@
+"""
+Tests for the warm LinkedIn session (app/agents/linkedin_session.py) on the
+fake Playwright driver.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import json
+
+from app.agents.linkedin_session import LinkedInSession
+
+
+COOKIE = {"name": "li_at", "value": "secret", "domain": ".linkedin.com", "path": "/"}
+
+
+def _started_session(fake_playwright, tmp_path, **options) -> LinkedInSession:
+    """A session running on the fake driver with a one-cookie export."""
+    cookies_file = tmp_path / "linkedin_cookies.json"
+    cookies_file.write_text(json.dumps([COOKIE]))
+    session = LinkedInSession(cookies_file=cookies_file, **options)
+    session._lock = asyncio.Lock()
+    session._playwright = fake_playwright
+    return session
+
+
+def test_context_stays_warm(fake_playwright, tmp_path):
+    """Scrapes share one browser and context; only pages are opened and closed."""
+    async def scenario():
+        session = _started_session(fake_playwright, tmp_path)
+        async with session.page() as first:
+            pass
+        async with session.page() as second:
+            pass
+        
+        assert first.context is second.context and first.closed
+        assert session.stats["browser_launches"] == 1
+        assert session.stats["auth_loads"] == 1
+        assert first.context.options["storage_state"]["cookies"] == [COOKIE]
+        await session.close()
+    
+    asyncio.run(scenario())
+
+
+def test_browser_is_recycled_after_max_pages(fake_playwright, tmp_path):
+    """The governor moves the session to a new browser, keeping rotated cookies."""
+    async def scenario():
+        session = _started_session(fake_playwright, tmp_path, max_pages=2)
+        async with session.page() as page:
+            page.context.cookies.append({**COOKIE, "name": "JSESSIONID", "value": "rotated"})
+        async with session.page():
+            pass
+        old_browser = session.browser
+        
+        async with session.page() as page:
+            assert page.context.browser is not old_browser
+            assert [cookie["value"] for cookie in page.context.cookies] == ["secret", "rotated"]
+        
+        assert not old_browser.connected
+        assert session.stats["browser_recycles"] == 1
+        assert session.report()["browser_pages"] == 1
+        await session.close()
+    
+    asyncio.run(scenario())
+
+
+def test_recycle_drains_in_flight_pages(fake_playwright, tmp_path):
+    """A page open during a recycle keeps its browser until it is released."""
+    async def scenario():
+        session = _started_session(fake_playwright, tmp_path, max_pages=1)
+        async with session.page() as in_flight:
+            async with session.page() as page:
+                assert page.context.browser is not in_flight.context.browser
+            assert in_flight.context.browser.connected
+            assert not in_flight.context.closed
+            assert session.report()["draining"] == 1
+        
+        assert in_flight.context.closed
+        assert not in_flight.context.browser.connected
+        assert session.report()["draining"] == 0
+        await session.close()
+    
+    asyncio.run(scenario())
+
+
+def test_rss_governor_measures_own_browser(fake_playwright, fake_proc, tmp_path):
+    """Only the session's own browser tree counts towards its RSS limit."""
+    async def scenario():
+        session = _started_session(fake_playwright, tmp_path, max_rss_mb=3, memory_check_interval=0)
+        async with session.page():
+            pass
+        async with session.page():
+            pass
+        assert session.report()["rss_mb"] == 2.0
+        assert session.stats["browser_recycles"] == 0
+        
+        fake_proc.rss_pages[1001] = 4 * fake_proc.page_mb
+        async with session.page():
+            pass
+        assert session.stats["browser_recycles"] == 1
+        assert session.report()["browser_pid"] == 1010
+        await session.close()
+    
+    asyncio.run(scenario())
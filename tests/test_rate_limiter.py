@@ -0,0 +1,242 @@
+"""
+Tests for the per-host rate limiter (app/agents/rate_limiter.py) on a fake
+clock: token refill, AIMD backoff, Retry-After / rate-limit reset parsing,
+RateLimitedTransport retries and the Playwright route/response hooks.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.agents import rate_limiter
+from app.agents.rate_limiter import HostRateLimiter, RateLimitedTransport
+
+
+class FakeClock:
+    """Stands in for time and asyncio.sleep in rate_limiter; sleeping advances it."""
+    
+    def __init__(self):
+        self.now = 1000.0
+        self.wall = 1_700_000_000.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    def time(self):
+        return self.wall + self.now
+    
+    async def sleep(self, seconds):
+        # Like a real sleep, time always moves on (a float remainder of a
+        # token would otherwise never accrue)
+        self.sleeps.append(round(seconds, 3))
+        self.now += max(seconds, 1e-6)
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake time for the limiter."""
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    monkeypatch.setattr(rate_limiter, "asyncio", SimpleNamespace(sleep=clock.sleep, Lock=asyncio.Lock))
+    return clock
+
+
+def test_tokens_refill_at_the_host_rate(clock):
+    """A burst goes out at once; further requests wait 1/rate each."""
+    limiter = HostRateLimiter(rate=2.0, burst=2)
+    
+    async def scenario():
+        return [await limiter.acquire("https://github.com/octocat") for _ in range(4)]
+    
+    assert asyncio.run(scenario()) == [0.0, 0.0, 0.5, 0.5]
+    report = limiter.report()["github.com"]
+    assert (report["requests"], report["max_wait_seconds"], report["total_wait_seconds"]) == (4, 0.5, 1.0)
+    
+    # Idle time refills up to the burst, no further
+    clock.now += 10
+    assert limiter.report()["github.com"]["tokens"] == 2.0
+
+
+def test_host_limits_and_share(clock):
+    """Domain-suffix overrides apply per host, scaled by the limiter's share."""
+    limiter = HostRateLimiter(rate=2.0, burst=5, share=0.5)
+    
+    async def scenario():
+        await limiter.acquire("https://www.linkedin.com/in/jane")
+        await limiter.acquire("raw.githubusercontent.com")
+    
+    asyncio.run(scenario())
+    report = limiter.report()
+    assert (report["www.linkedin.com"]["base_rate"], report["www.linkedin.com"]["burst"]) == (0.25, 1)
+    assert (report["raw.githubusercontent.com"]["base_rate"], report["raw.githubusercontent.com"]["burst"]) == (5.0, 10)
+
+
+def test_throttling_halves_the_rate_and_success_restores_it(clock):
+    """Multiplicative decrease with doubling backoff, then additive increase."""
+    limiter = HostRateLimiter(rate=2.0, burst=2)
+    
+    assert limiter.observe("github.com", 429, {}) == 1.0
+    assert limiter.observe("github.com", 429, {}) == 2.0
+    bucket = limiter._buckets["github.com"]
+    assert (bucket.rate, bucket.tokens, bucket.throttled) == (0.5, 0.0, 2)
+    assert limiter.report()["github.com"]["blocked_for_seconds"] == 2.0
+    
+    # The rate never drops below a tenth of the configured one
+    for _ in range(5):
+        limiter.observe("github.com", 429, {})
+    assert bucket.rate == pytest.approx(0.2)
+    
+    # Each success adds a tenth of the configured rate back
+    assert limiter.observe("github.com", 200, {}) is None
+    assert (bucket.rate, bucket.backoff) == (pytest.approx(0.4), 0.0)
+    for _ in range(20):
+        limiter.observe("github.com", 200, {})
+    assert bucket.rate == 2.0
+    
+    # Client errors neither throttle nor restore
+    bucket.rate = 1.0
+    assert limiter.observe("github.com", 404, {}) is None
+    assert bucket.rate == 1.0
+
+
+def test_blocked_host_waits_out_the_backoff(clock):
+    """acquire() sleeps until the block ends; no tokens accrue meanwhile."""
+    limiter = HostRateLimiter(rate=2.0, burst=2)
+    limiter.observe("github.com", 429, {"retry-after": "7"})
+    
+    waited = asyncio.run(limiter.acquire("github.com"))
+    
+    # Then one token at the halved rate
+    assert clock.sleeps[:2] == [7.0, 1.0]
+    assert waited == pytest.approx(8.0)
+
+
+def test_retry_after_and_rate_limit_reset_are_parsed(clock):
+    """Retry-After wins, an exhausted x-ratelimit-reset is next; both are capped at max_backoff."""
+    limiter = HostRateLimiter(max_backoff=60.0)
+    reset = str(int(clock.time()) + 30)
+    
+    assert limiter.observe("a.test", 429, httpx.Headers({"Retry-After": "12"})) == 12.0
+    assert limiter.observe("b.test", 403, httpx.Headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})) == 30.0
+    assert limiter.observe("c.test", 429, {"retry-after": "600"}) == 60.0
+    # An HTTP-date Retry-After is not understood: exponential backoff instead
+    assert limiter.observe("d.test", 429, {"retry-after": "Wed, 21 Oct 2026 07:28:00 GMT"}) == 1.0
+
+
+@pytest.mark.parametrize("status, headers, body, throttled", [
+    (429, {}, None, True),
+    (999, {}, None, True),
+    (403, {"x-ratelimit-remaining": "0"}, None, True),
+    (403, {}, "You have exceeded a secondary rate limit.", True),
+    (403, {}, "Resource not accessible by integration", False),
+    (403, {"x-ratelimit-remaining": "12"}, None, False),
+    (500, {}, None, False)
+])
+def test_secondary_limit_403s_are_recognised(status, headers, body, throttled):
+    """Only rate-limit 403s count as throttling, not permission errors."""
+    assert HostRateLimiter.is_throttled(status, headers, body) is throttled
+
+
+def test_transport_retries_throttled_requests(clock):
+    """A throttled request is retried after its backoff, up to max_retries times."""
+    statuses = [429, 403, 200]
+    
+    def handler(request):
+        status = statuses.pop(0)
+        if status == 403:
+            return httpx.Response(403, text="secondary rate limit")
+        return httpx.Response(status, headers={"Retry-After": "3"} if status == 429 else {})
+    
+    limiter = HostRateLimiter(rate=10.0, burst=10)
+    client = httpx.AsyncClient(transport=RateLimitedTransport(httpx.MockTransport(handler), limiter))
+    
+    response = asyncio.run(client.get("https://api.test/repos"))
+    
+    assert response.status_code == 200 and statuses == []
+    # Retry-After, a token at the halved rate, then the 403's exponential backoff
+    assert clock.sleeps[:3] == [3.0, 0.2, 1.0]
+    assert limiter.report()["api.test"]["throttled"] == 2
+
+
+def test_transport_returns_the_last_throttled_response(clock):
+    """After max_retries the throttled response is handed to the caller."""
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(429)
+    
+    transport = RateLimitedTransport(httpx.MockTransport(handler), HostRateLimiter(), max_retries=1)
+    response = asyncio.run(httpx.AsyncClient(transport=transport).get("https://api.test/repos"))
+    
+    assert response.status_code == 429
+    assert len(requests) == 2
+
+
+class FakeTarget:
+    """Playwright context/page stub recording route handlers and listeners."""
+    
+    def __init__(self):
+        self.routes = []
+        self.listeners = {}
+    
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+    
+    def on(self, event, handler):
+        self.listeners.setdefault(event, []).append(handler)
+    
+    def remove_listener(self, event, handler):
+        self.listeners[event].remove(handler)
+
+
+class FakeRoute:
+    """Route stub for one request."""
+    
+    def __init__(self, url, resource_type):
+        self.request = SimpleNamespace(url=url, resource_type=resource_type)
+        self.fell_back = False
+    
+    async def fallback(self):
+        self.fell_back = True
+
+
+def test_playwright_hooks_limit_documents_and_observe_responses(clock):
+    """Documents and XHRs take tokens, other resources pass; 403 bodies are read for secondary limits."""
+    limiter = HostRateLimiter(rate=2.0, burst=2)
+    target = FakeTarget()
+    
+    async def scenario():
+        await limiter.attach(target)
+        pattern, handler = target.routes[0]
+        routes = [FakeRoute("https://github.com/octocat", kind) for kind in ("document", "image", "fetch")]
+        for route in routes:
+            await handler(route)
+        
+        async def text():
+            return "secondary rate limit"
+        
+        response = SimpleNamespace(
+            url="https://github.com/octocat",
+            status=403,
+            headers={},
+            request=SimpleNamespace(resource_type="document"),
+            text=text
+        )
+        await target.listeners["response"][0](response)
+        return pattern, routes
+    
+    pattern, routes = asyncio.run(scenario())
+    
+    assert pattern == "**/*"
+    assert all(route.fell_back for route in routes)
+    report = limiter.report()["github.com"]
+    assert (report["requests"], report["throttled"]) == (2, 1)
+    
+    limiter.detach(target)
+    assert target.listeners["response"] == []
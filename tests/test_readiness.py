@@ -0,0 +1,52 @@
+"""
+Tests for selector-driven readiness waits (app/agents/readiness.py) with
+the LinkedIn profile spec.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from app.agents.linkedin_scraper import LinkedInScraper
+from app.agents.readiness import wait_ready
+
+
+class SelectorPage:
+    """Page stub whose wait_for_selector only finds the attached selectors."""
+    
+    def __init__(self, attached):
+        self.attached = set(attached)
+        self.waits = []
+    
+    async def wait_for_selector(self, selector, state="attached", timeout=30000):
+        self.waits.append((selector.split(", ")[0], timeout))
+        if any(part in self.attached for part in selector.split(", ")):
+            return object()
+        raise PlaywrightTimeout(f"Timeout {timeout}ms exceeded waiting for {selector}")
+
+
+def test_profile_without_experience_is_ready():
+    """Only the name heading is required; the experience section gets a short optional wait."""
+    spec = LinkedInScraper.READINESS["profile"]
+    page = SelectorPage(["h1.text-heading-xlarge"])
+    
+    assert asyncio.run(wait_ready(page, spec)) is True
+    assert page.waits[0][0] == "h1.text-heading-xlarge"
+    assert page.waits[1] == ("section#experience", spec["optional_timeout"])
+
+
+def test_missing_name_heading_is_not_ready():
+    """Without the required heading the wait fails and the optional selectors are skipped."""
+    page = SelectorPage(["section#experience"])
+    
+    assert asyncio.run(wait_ready(page, LinkedInScraper.READINESS["profile"])) is False
+    assert [selector for selector, _ in page.waits] == ["h1.text-heading-xlarge"]
+
+
+def test_auth_wall_ends_the_wait():
+    """A terminal selector satisfies the required and optional waits at once."""
+    spec = LinkedInScraper.READINESS["profile"]
+    page = SelectorPage([spec["terminal"][0]])
+    
+    assert asyncio.run(wait_ready(page, spec)) is True
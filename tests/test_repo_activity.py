@@ -0,0 +1,154 @@
+"""
+Tests for the REST channel of the repository activity sampler
+(app/agents/repo_activity.py) against an httpx.MockTransport API.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+
+import httpx
+
+from app.agents.repo_activity import RepoActivitySampler
+from app.agents.scrape_cache import ScrapeCache
+
+
+API_URL = "https://api.github.test"
+
+COMMIT = {"sha": "abc123", "commit": {"committer": {"date": "2024-05-30T12:00:00Z"}}}
+
+
+def rest_sampler(handler, cache: ScrapeCache, **options) -> RepoActivitySampler:
+    """A sampler (REST only unless given a token) whose requests go to handler."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return RepoActivitySampler(client, api_url=API_URL, cache=cache, **options)
+
+
+def fresh_cache(*repos) -> ScrapeCache:
+    """A scrape cache without samples of repos."""
+    cache = ScrapeCache()
+    for owner, name in repos:
+        cache.invalidate(RepoActivitySampler._key((owner, name)))
+    return cache
+
+
+def github_api(requests: list, commits_response, etags: bool = True):
+    """Handler answering the commits and languages endpoints, 304 on a matching ETag."""
+    def handler(request):
+        requests.append(request)
+        endpoint = "commits" if request.url.path.endswith("/commits") else "languages"
+        etag = f'"{endpoint}-v1"'
+        if etags and request.headers.get("if-none-match") == etag:
+            return httpx.Response(304)
+        headers = {"ETag": etag} if etags else {}
+        if endpoint == "languages":
+            return httpx.Response(200, json={"Python": 12000, "Shell": 300}, headers=headers)
+        response = commits_response()
+        response.headers.update(headers)
+        return response
+    return handler
+
+
+def test_first_fetch_reads_commit_count_from_the_last_link():
+    """With per_page=1 the rel="last" page number is the commit count."""
+    repo = ("octocat", "activity-first")
+    requests = []
+    link = f'<{API_URL}/repositories/1/commits?per_page=1&page=2>; rel="next", <{API_URL}/repositories/1/commits?per_page=1&page=42>; rel="last"'
+    sampler = rest_sampler(
+        github_api(requests, lambda: httpx.Response(200, json=[COMMIT], headers={"Link": link})),
+        fresh_cache(repo)
+    )
+    
+    samples = asyncio.run(sampler.sample([repo]))
+    
+    assert samples[repo] == {
+        "last_commit_at": "2024-05-30T12:00:00Z",
+        "commit_count": 42,
+        "language_bytes": {"Python": 12000, "Shell": 300},
+        "source": "rest"
+    }
+    assert sorted(request.url.path for request in requests) == [
+        "/repos/octocat/activity-first/commits", "/repos/octocat/activity-first/languages"
+    ]
+    assert not any("if-none-match" in request.headers for request in requests)
+    assert sampler.report() == {"cache_hits": 0, "not_modified": 0, "fetched": 2, "failed": 0}
+
+
+def test_expired_sample_is_revalidated_by_etag():
+    """A second sample past the TTL sends If-None-Match and reuses the 304'd parts."""
+    repo = ("octocat", "activity-etag")
+    requests = []
+    handler = github_api(requests, lambda: httpx.Response(200, json=[COMMIT]))
+    cache = fresh_cache(repo)
+    
+    first = asyncio.run(rest_sampler(handler, cache, ttl_seconds=0).sample([repo]))
+    sampler = rest_sampler(handler, cache, ttl_seconds=0)
+    second = asyncio.run(sampler.sample([repo]))
+    
+    assert second == first
+    revalidations = requests[2:]
+    assert sorted(request.headers["if-none-match"] for request in revalidations) == ['"commits-v1"', '"languages-v1"']
+    assert sampler.report() == {"cache_hits": 0, "not_modified": 2, "fetched": 0, "failed": 0}
+    
+    # Within the TTL the cached sample is used without any request
+    cached = rest_sampler(handler, cache, ttl_seconds=3600)
+    assert asyncio.run(cached.sample([repo])) == first
+    assert len(requests) == 4
+    assert cached.report()["cache_hits"] == 1
+
+
+def test_empty_repository_has_no_commits():
+    """GitHub answers 409 for the commits of an empty repository."""
+    repo = ("octocat", "activity-empty")
+    sampler = rest_sampler(
+        github_api([], lambda: httpx.Response(409, json={"message": "Git Repository is empty."})),
+        fresh_cache(repo)
+    )
+    
+    samples = asyncio.run(sampler.sample([repo]))
+    
+    assert samples[repo]["last_commit_at"] is None
+    assert samples[repo]["commit_count"] == 0
+    assert samples[repo]["language_bytes"] == {"Python": 12000, "Shell": 300}
+    assert sampler.report()["failed"] == 0
+
+
+def test_single_commit_without_link_header():
+    """No Link header means the one page holds every commit."""
+    repo = ("octocat", "activity-single")
+    sampler = rest_sampler(
+        github_api([], lambda: httpx.Response(200, json=[COMMIT]), etags=False),
+        fresh_cache(repo)
+    )
+    
+    samples = asyncio.run(sampler.sample([repo]))
+    
+    assert samples[repo]["commit_count"] == 1
+    assert samples[repo]["last_commit_at"] == "2024-05-30T12:00:00Z"
+
+
+def test_failed_repository_is_left_out():
+    """A server error drops that repository's sample and counts the failure."""
+    repo = ("octocat", "activity-broken")
+    sampler = rest_sampler(github_api([], lambda: httpx.Response(500)), fresh_cache(repo))
+    
+    assert asyncio.run(sampler.sample([repo])) == {}
+    assert sampler.report()["failed"] == 1
+
+
+def test_rest_requests_are_authorized_with_the_token():
+    """With a token, the REST fallback after a GraphQL failure sends it as a bearer token."""
+    repo = ("octocat", "activity-token")
+    requests = []
+    rest = github_api(requests, lambda: httpx.Response(200, json=[COMMIT]))
+    
+    def handler(request):
+        if request.url.path == "/graphql":
+            return httpx.Response(502)
+        return rest(request)
+    
+    sampler = rest_sampler(handler, fresh_cache(repo), token="ghp_test", graphql_url=f"{API_URL}/graphql")
+    samples = asyncio.run(sampler.sample([repo]))
+    
+    assert samples[repo]["source"] == "rest"
+    assert len(requests) == 2
+    assert all(request.headers["authorization"] == "Bearer ghp_test" for request in requests)
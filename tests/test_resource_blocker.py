@@ -0,0 +1,111 @@
+"""
+Tests for the fast-mode resource blocker (app/agents/resource_blocker.py):
+which requests are let through or aborted, and the per-scrape report.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.agents.github_scraper import GitHubScraper
+from app.agents.linkedin_scraper import LinkedInScraper
+from app.agents.resource_blocker import ResourceBlocker
+
+
+class FakeRoute:
+    """Route stub recording whether the request fell back or was aborted."""
+    
+    def __init__(self, url, resource_type):
+        self.request = SimpleNamespace(url=url, resource_type=resource_type)
+        self.outcome = None
+    
+    async def fallback(self):
+        self.outcome = "fallback"
+    
+    async def abort(self):
+        self.outcome = "abort"
+
+
+@pytest.mark.parametrize("url, resource_type, allowed", [
+    ("https://github.com/octocat", "document", True),
+    ("https://github.com/octocat?tab=repositories", "fetch", True),
+    ("https://github.githubassets.com/assets/behaviors.js", "script", True),
+    ("https://github.com/octocat/contributions", "xhr", True),
+    ("https://avatars.githubusercontent.com/u/583231", "image", False),
+    ("https://github.githubassets.com/assets/light.css", "stylesheet", False),
+    ("https://github.githubassets.com/assets/mona-sans.woff2", "font", False),
+    ("https://github.com/octocat/video.mp4", "media", False),
+    ("https://collector.github.com/github/collect", "fetch", False),
+    ("https://www.googletagmanager.com/gtm.js", "script", False),
+    ("https://notgithub.com/octocat", "document", False),
+    ("https://GitHub.com/octocat", "document", True)
+])
+def test_github_routing(url, resource_type, allowed):
+    """Only allow-listed types from first-party hosts (and their subdomains) pass; beacons never do."""
+    assert ResourceBlocker(GitHubScraper.ALLOWED_HOSTS).is_allowed(url, resource_type) is allowed
+
+
+@pytest.mark.parametrize("url, resource_type, allowed", [
+    ("https://www.linkedin.com/in/jane", "document", True),
+    ("https://static.licdn.com/aero-v1/sc/h/app.js", "script", True),
+    ("https://media.licdn.com/dms/image/profile.jpg", "image", False),
+    ("https://px.ads.linkedin.com/collect", "xhr", False),
+    ("https://snap.licdn.com/li.lms-analytics/insight.min.js", "script", True)
+])
+def test_linkedin_routing(url, resource_type, allowed):
+    """The LinkedIn allow-list covers linkedin.com and licdn.com."""
+    assert ResourceBlocker(LinkedInScraper.ALLOWED_HOSTS).is_allowed(url, resource_type) is allowed
+
+
+def test_custom_lists_replace_the_defaults():
+    """Explicit resource types and blocked hosts replace the defaults; an empty blocked list blocks nothing extra."""
+    blocker = ResourceBlocker([" Example.test ", ""], allowed_resource_types=["document", "image"], blocked_hosts=[])
+    
+    assert blocker.allowed_hosts == ("example.test",)
+    assert blocker.is_allowed("https://cdn.example.test/a.png", "image")
+    assert not blocker.is_allowed("https://example.test/app.js", "script")
+    assert ResourceBlocker(["github.com"], blocked_hosts=[]).is_allowed("https://collector.github.com/x", "fetch")
+
+
+def test_route_handler_aborts_and_counts():
+    """Allowed requests fall back to earlier handlers; the rest are aborted and tallied by type."""
+    blocker = ResourceBlocker(GitHubScraper.ALLOWED_HOSTS)
+    routes = [
+        FakeRoute("https://github.com/octocat", "document"),
+        FakeRoute("https://avatars.githubusercontent.com/u/1", "image"),
+        FakeRoute("https://avatars.githubusercontent.com/u/2", "image"),
+        FakeRoute("https://github.githubassets.com/assets/mona-sans.woff2", "font"),
+        FakeRoute("https://collector.github.com/github/collect", "fetch"),
+        FakeRoute("https://github.com/manifest.json", "manifest")
+    ]
+    
+    async def scenario():
+        for route in routes:
+            await blocker._handle_route(route)
+    
+    asyncio.run(scenario())
+    
+    assert [route.outcome for route in routes] == ["fallback", "abort", "abort", "abort", "abort", "abort"]
+    report = blocker.report()
+    assert (report["allowed_requests"], report["blocked_requests"]) == (1, 5)
+    assert report["blocked_by_type"] == {"image": 2, "font": 1, "fetch": 1, "manifest": 1}
+    # Typical sizes per type, "other" for unlisted types: an estimate, and the report says so
+    assert report["bytes_saved_estimate"] == 2 * 20_000 + 40_000 + 5_000 + 5_000
+    assert "not measured" in report["bytes_saved_basis"]
+
+
+def test_attach_routes_every_request():
+    """The handler is installed for all URLs on the context or page."""
+    routes = []
+    target = SimpleNamespace()
+    
+    async def route(pattern, handler):
+        routes.append((pattern, handler))
+    
+    target.route = route
+    blocker = ResourceBlocker(["github.com"])
+    asyncio.run(blocker.attach(target))
+    
+    assert routes == [("**/*", blocker._handle_route)]
@@ -0,0 +1,80 @@
+"""
+Tests for the scrape cache (app/agents/scrape_cache.py) behind
+GitHubScraper.scrape(), with the saved corpus pages as GitHub.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+
+from app.agents.github_scraper import GitHubScraper
+from app.agents.scrape_cache import ScrapeCache
+from app.config import settings
+
+
+def test_cache_hit_does_not_report_the_original_scrape_timings(github_mirror):
+    """A hit carries a cache_hit timings block, not the stored scrape's navigations."""
+    requests = github_mirror.install()
+    cache = ScrapeCache()
+    scraper = GitHubScraper(**{**github_mirror.options, "use_cache": True, "contribution_history": False}, cache=cache)
+    cache.invalidate(scraper._cache_key("octocat"))
+    
+    async def scenario():
+        scraped = await scraper.scrape("https://github.com/octocat")
+        sent, hits = len(requests), cache.stats["hits"]
+        hit = await scraper.scrape("https://github.com/octocat")
+        assert len(requests) == sent
+        assert cache.stats["hits"] == hits + 1
+        return scraped, hit
+    
+    scraped, hit = asyncio.run(scenario())
+    
+    assert scraped["timings"]["phases"]
+    assert "cache_hit" not in scraped["timings"]
+    assert hit["timings"]["cache_hit"] is True
+    assert hit["timings"]["phases"] == {} and hit["timings"]["navigations"] == []
+    assert hit["name"] == scraped["name"]
+    
+    # The fallback used while the GitHub circuit is open is a hit too
+    assert scraper.cached("https://github.com/octocat")["timings"]["cache_hit"] is True
+
+
+def test_cache_key_separates_result_changing_options(github_mirror):
+    """Scrapes with different options never share a cached result."""
+    options = {
+        "use_cache": True,
+        "contribution_history": False,
+        "repo_activity": settings.github_repo_activity
+    }
+    
+    assert GitHubScraper(**options)._cache_key("OctoCat") == "github:octocat"
+    assert GitHubScraper(**options, exclude_forks=True, max_repo_pages=2)._cache_key("octocat") == (
+        "github:octocat:exclude_forks:pages=2"
+    )
+    assert GitHubScraper(**options, base_url="https://github.test")._cache_key("octocat") == (
+        "github:octocat:origin=github.test"
+    )
+    keys = {
+        GitHubScraper(**{**options, **changed})._cache_key("octocat")
+        for changed in (
+            {},
+            {"exclude_forks": True},
+            {"exclude_archived": True},
+            {"max_repo_pages": 3},
+            {"contribution_history": True},
+            {"contribution_history": True, "history_max_years": 2},
+            {"repo_activity": True, "activity_top_n": 2},
+            {"base_url": "https://github.test"},
+            {"raw_base_url": "https://raw.test"},
+            {"page_urls": {"profile": "{base}/{username}/profile.html"}},
+            {"javascript_enabled": False},
+            {"block_resources": not settings.scraper_block_resources},
+            {"github_token": "test-token"},
+            github_mirror.options
+        )
+    }
+    assert len(keys) == 14
+    
+    # Each backend returns its own result shape
+    scraper = GitHubScraper(**options, backend="graphql")
+    assert scraper._cache_key("octocat") == scraper._cache_key("octocat", "graphql")
+    assert len({scraper._cache_key("octocat", backend) for backend in GitHubScraper.BACKENDS}) == 3
@@ -0,0 +1,158 @@
+"""
+Tests for time-bounded scrapes (app/agents/scrape_deadline.py): the
+per-phase budget math, partial results on timeout and completeness.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.agents import scrape_deadline
+from app.agents.scrape_deadline import ScrapeDeadline
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock for the deadline; advance it with clock.now."""
+    clock = SimpleNamespace(now=100.0)
+    monkeypatch.setattr(scrape_deadline, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_phase_budget_is_its_share_capped_by_what_is_left(clock):
+    """budget() is min(remaining, seconds * share); unknown phases get the whole deadline."""
+    deadline = ScrapeDeadline(10, {"profile": 0.4, "readmes": 0.3})
+    
+    assert deadline.budget("profile") == 4.0
+    assert deadline.budget("other") == 10.0
+    
+    clock.now += 7.5
+    assert deadline.remaining() == 2.5
+    assert deadline.budget("profile") == 2.5
+    assert deadline.budget("readmes") == 2.5
+    
+    clock.now += 0.5
+    assert deadline.budget("readmes") == 2.0
+    
+    clock.now += 5
+    assert deadline.remaining() == 0.0
+    assert deadline.budget("profile") == 0.0
+
+
+@pytest.mark.parametrize("seconds", [None, 0])
+def test_no_deadline_means_no_budgets(clock, seconds):
+    """Without a deadline phases run unbounded."""
+    deadline = ScrapeDeadline(seconds, {"profile": 0.4})
+    
+    assert (deadline.seconds, deadline.remaining(), deadline.budget("profile")) == (None, None, None)
+    assert deadline.report()["seconds"] is None
+
+
+def test_run_passes_the_phase_budget_to_wait_for(clock, monkeypatch):
+    """Each phase is awaited with the budget it has when it starts."""
+    timeouts = []
+    wait_for = asyncio.wait_for
+    
+    async def recording_wait_for(work, timeout):
+        timeouts.append(timeout)
+        return await wait_for(work, timeout)
+    
+    monkeypatch.setattr(scrape_deadline.asyncio, "wait_for", recording_wait_for)
+    deadline = ScrapeDeadline(20, {"profile": 0.4, "readmes": 0.3})
+    
+    async def phase(value):
+        # Every phase takes 7 fake seconds
+        clock.now += 7
+        return value
+    
+    async def scenario():
+        return [
+            await deadline.run("profile", phase("p"), partial=lambda: None),
+            await deadline.run("readmes", phase("r"), partial=lambda: None),
+            # A second profile phase gets what is left, not its 8 seconds
+            await deadline.run("profile", phase("p"), partial=lambda: None)
+        ]
+    
+    assert asyncio.run(scenario()) == ["p", "r", "p"]
+    assert timeouts == [8.0, 6.0, 6.0]
+    assert deadline.completeness() == {"profile": 1.0, "readmes": 1.0}
+
+
+def test_timed_out_phase_returns_its_partial_data():
+    """A phase that overruns is cancelled and replaced by partial(); its completeness is recorded."""
+    gathered = []
+    cancelled = asyncio.Event()
+    
+    async def slow_phase():
+        try:
+            for item in range(100):
+                gathered.append(item)
+                await asyncio.sleep(0.01 if item < 3 else 10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+    
+    deadline = ScrapeDeadline(1.0, {"languages": 0.1, "readmes": 0.5})
+    
+    async def scenario():
+        started = time.monotonic()
+        result = await deadline.run(
+            "languages",
+            slow_phase(),
+            partial=lambda: list(gathered),
+            completeness=lambda: len(gathered) / 8
+        )
+        return result, time.monotonic() - started
+    
+    result, elapsed = asyncio.run(scenario())
+    
+    assert result == [0, 1, 2, 3]
+    assert elapsed < 0.5
+    assert cancelled.is_set()
+    assert deadline.timed_out == ["languages"]
+    # The phase that never ran counts as missing
+    assert deadline.completeness() == {"languages": 0.5, "readmes": 0.0}
+    assert deadline.report()["timed_out"] == ["languages"]
+
+
+def test_timed_out_phase_without_completeness_is_empty():
+    """Without a completeness callback a timeout counts as 0.0, a finished phase as 1.0."""
+    deadline = ScrapeDeadline(0.5, {"profile": 0.1, "history": 0.1})
+    
+    async def scenario():
+        missing = await deadline.run("profile", asyncio.sleep(10), partial=lambda: {})
+        finished = await deadline.run("history", asyncio.sleep(0, "done"), partial=lambda: None)
+        return missing, finished
+    
+    assert asyncio.run(scenario()) == ({}, "done")
+    assert deadline.completeness() == {"profile": 0.0, "history": 1.0}
+
+
+def test_finished_phase_reports_its_own_completeness():
+    """A phase that finishes with part of its data (e.g. failed pages) keeps that value, clamped and rounded."""
+    deadline = ScrapeDeadline(None, {"languages": 0.5, "readmes": 0.5})
+    
+    async def scenario():
+        await deadline.run("languages", asyncio.sleep(0), partial=list, completeness=lambda: 2 / 3)
+        await deadline.run("readmes", asyncio.sleep(0), partial=list, completeness=lambda: 1.7)
+    
+    asyncio.run(scenario())
+    
+    assert deadline.completeness() == {"languages": 0.67, "readmes": 1.0}
+    assert deadline.timed_out == []
+
+
+def test_phase_errors_propagate():
+    """Only timeouts are turned into partial data."""
+    deadline = ScrapeDeadline(5, {"profile": 0.4})
+    
+    async def failing():
+        raise ValueError("GitHub profile not found: ghost")
+    
+    with pytest.raises(ValueError):
+        asyncio.run(deadline.run("profile", failing(), partial=lambda: {}))
+    assert deadline.timed_out == []
+    assert deadline.completeness() == {"profile": 0.0}
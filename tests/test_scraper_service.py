@@ -0,0 +1,157 @@
+"""
+Tests for the out-of-process scraper service (app/agents/scraper_service.py):
+job routing, worker control requests and pool restarts, with a thread pool
+standing in for the worker processes.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+
+import pytest
+
+from app.agents import scrape_cache, scraper_service
+from app.agents.scraper_service import ScraperService
+
+
+def running_service(monkeypatch, run_job, **options) -> ScraperService:
+    """A started service whose jobs run run_job(source, url, options, timeout) on threads."""
+    monkeypatch.setattr(scraper_service, "_run_job", run_job)
+    service = ScraperService(workers=2, circuit_breakers=False, **options)
+    service._slots = asyncio.Semaphore(service.workers)
+    service._executor = ThreadPoolExecutor(max_workers=service.workers)
+    service._claimed = SimpleNamespace(value=0)
+    return service
+
+
+def test_jobs_run_inline_until_the_service_is_started(monkeypatch):
+    """A stopped service scrapes in-process with the source's scraper."""
+    scraped = []
+    
+    async def scrape(source, url, options):
+        scraped.append((source, url, options))
+        return {"source": source}
+    
+    monkeypatch.setattr(scraper_service, "_scrape", scrape)
+    service = ScraperService(circuit_breakers=False)
+    
+    result = asyncio.run(service.scrape("linkedin", "https://linkedin.com/in/jane", headless=True))
+    
+    assert result == {"source": "linkedin"}
+    assert scraped == [("linkedin", "https://linkedin.com/in/jane", {"headless": True})]
+    assert service.stats["inline"] == 1 and service.stats["submitted"] == 0
+    with pytest.raises(ValueError, match="Unknown scrape source"):
+        asyncio.run(service.scrape("gitlab", "https://gitlab.com/octocat"))
+
+
+def test_running_service_submits_one_job_per_url_and_options(monkeypatch):
+    """Concurrent jobs for the same URL and options share a submission; other options get their own."""
+    jobs = []
+    
+    def run_job(source, url, options, timeout):
+        jobs.append((source, url, options))
+        time.sleep(0.05)
+        return {"source": source, "url": url}
+    
+    service = running_service(monkeypatch, run_job)
+    
+    async def scenario():
+        return await asyncio.gather(
+            service.scrape("github", "https://github.com/octocat"),
+            service.scrape("github", "https://github.com/OctoCat/"),
+            service.scrape("github", "https://github.com/octocat", backend="http")
+        )
+    
+    results = asyncio.run(scenario())
+    service._executor.shutdown()
+    
+    assert [result["source"] for result in results] == ["github"] * 3
+    assert sorted(job[2].get("backend", "") for job in jobs) == ["", "http"]
+    assert service.stats["submitted"] == service.stats["completed"] == 2
+    assert service.report()["in_flight"] == 0
+
+
+def _serve_worker(monkeypatch, worker_end):
+    """Answer control requests on worker_end from a worker loop running in a thread."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    monkeypatch.setattr(scraper_service, "_worker_loop", loop)
+    threading.Thread(target=scraper_service._serve_control, args=(worker_end,), daemon=True).start()
+    return loop
+
+
+def test_cancel_refreshes_reaches_every_worker(monkeypatch):
+    """The control pipe carries the command and key to each worker's scrape cache."""
+    cancelled = []
+    monkeypatch.setattr(scrape_cache, "get_scrape_cache", lambda: SimpleNamespace(
+        cancel_refreshes=lambda key: cancelled.append(key) or 1
+    ))
+    service = running_service(monkeypatch, None)
+    api_end, worker_end = multiprocessing.Pipe()
+    loop = _serve_worker(monkeypatch, worker_end)
+    service._control = [api_end]
+    service._claimed.value = 1
+    
+    asyncio.run(service.cancel_refreshes("github:octocat"))
+    replies = asyncio.run(service._broadcast("cancel_refreshes"))
+    
+    assert cancelled == ["github:octocat", None]
+    assert replies[0]["cancelled"] == 1
+    service._close_control()
+    service._executor.shutdown()
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def test_health_sections_take_one_round_trip(monkeypatch):
+    """Several report sections come from one broadcast; a silent worker costs one control timeout."""
+    monkeypatch.setattr(scraper_service, "CONTROL_TIMEOUT_SECONDS", 0.1)
+    service = running_service(monkeypatch, None)
+    api_end, _ = multiprocessing.Pipe()
+    service._control = [api_end]
+    service._claimed.value = 1
+    broadcasts = []
+    broadcast = service._broadcast
+    
+    async def counted(command, arg=None):
+        broadcasts.append(command)
+        return await broadcast(command, arg)
+    
+    service._broadcast = counted
+    sections = asyncio.run(service.process_sections({"browser_pool": {"status": "stopped"}, "linkedin_session": {}}))
+    
+    assert broadcasts == ["report"]
+    assert sections["browser_pool"] == {"api_process": {"status": "stopped"}, "workers": [{"status": "unresponsive"}]}
+    assert sections["linkedin_session"]["workers"] == [{"status": "unresponsive"}]
+    service._close_control()
+    service._executor.shutdown()
+
+
+@pytest.mark.parametrize("failure", ["broken", "wedged"])
+def test_lost_or_wedged_worker_restarts_the_pool(monkeypatch, failure):
+    """A broken pool or a job overrunning its timeout plus grace gets a fresh pool."""
+    monkeypatch.setattr(scraper_service, "WEDGED_GRACE_SECONDS", 0)
+    release = threading.Event()
+    
+    def run_job(source, url, options, timeout):
+        if failure == "broken":
+            raise BrokenProcessPool("worker died")
+        release.wait(5)
+    
+    service = running_service(monkeypatch, run_job, job_timeout=0.05)
+    executor = service._executor
+    
+    async def scenario():
+        with pytest.raises((BrokenProcessPool, asyncio.TimeoutError)):
+            await service.scrape("github", "https://github.com/octocat")
+        release.set()
+        assert service.running and service._executor is not executor
+        assert (service.stats["pool_restarts"], service.stats["failed"]) == (1, 1)
+        await service.close()
+    
+    asyncio.run(scenario())
+    assert not service.running
@@ -0,0 +1,146 @@
+"""
+Tests for single-flight coalescing (app/agents/single_flight.py) and the
+keys GitHubScraper.scrape() and LinkedInScraper.scrape() use with it.
+
+Author: Recruiter Copilot
+"""
+import asyncio
+
+import pytest
+
+from app.agents.github_scraper import GitHubScraper
+from app.agents.linkedin_scraper import LinkedInScraper
+from app.agents.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    """Joiners get a copy of the leader's result; the work runs once."""
+    async def scenario():
+        flight = SingleFlight()
+        runs = []
+        
+        async def work():
+            runs.append(1)
+            await asyncio.sleep(0.01)
+            return {"languages": ["Python"]}
+        
+        first, second = await asyncio.gather(flight.do("github:octocat", work), flight.do("github:octocat", work))
+        assert first == second and first is not second
+        assert len(runs) == 1
+        assert flight.report() == {"calls": 2, "executions": 1, "coalesced": 1, "join_timeouts": 0, "in_flight": 0}
+    
+    asyncio.run(scenario())
+
+
+def test_join_is_bounded_by_its_timeout():
+    """A joiner gives up after its timeout; the shared call keeps running for the leader."""
+    async def scenario():
+        flight = SingleFlight()
+        
+        async def slow():
+            await asyncio.sleep(0.2)
+            return "done"
+        
+        leader = asyncio.ensure_future(flight.do("github:octocat", slow))
+        await asyncio.sleep(0)
+        with pytest.raises(asyncio.TimeoutError, match="github:octocat"):
+            await flight.do("github:octocat", slow, timeout=0.01)
+        
+        assert await leader == "done"
+        assert flight.stats["join_timeouts"] == 1
+    
+    asyncio.run(scenario())
+
+
+def _slow_scraper(calls: list, seconds: float = 0.05) -> GitHubScraper:
+    """A scraper whose backends only record their calls."""
+    scraper = GitHubScraper(use_cache=False, contribution_history=False, repo_activity=False)
+    
+    async def scrape_backend(username, backend, deadline=None):
+        calls.append(backend)
+        await asyncio.sleep(seconds)
+        return {"username": username, "backend": backend}
+    
+    scraper._scrape_backend = scrape_backend
+    return scraper
+
+
+def test_scrapes_with_different_backends_are_not_coalesced():
+    """Each backend gets its own flight; the same backend shares one."""
+    async def scenario():
+        calls = []
+        scraper = _slow_scraper(calls)
+        results = await asyncio.gather(
+            scraper.scrape("https://github.com/octocat", backend="http"),
+            scraper.scrape("https://github.com/octocat", backend="graphql"),
+            scraper.scrape("https://github.com/Octocat/", backend="http")
+        )
+        assert sorted(calls) == ["graphql", "http"]
+        assert [result["backend"] for result in results] == ["http", "graphql", "http"]
+    
+    asyncio.run(scenario())
+
+
+def test_scrapes_with_different_options_are_not_coalesced():
+    """A scrape never joins one gathering a different result."""
+    async def scenario():
+        calls = []
+        scraper = _slow_scraper(calls)
+        filtered = _slow_scraper(calls)
+        filtered.exclude_forks = True
+        await asyncio.gather(
+            scraper.scrape("https://github.com/octocat", backend="http"),
+            filtered.scrape("https://github.com/octocat", backend="http"),
+            filtered.scrape("https://github.com/octocat", backend="http")
+        )
+        assert calls == ["http", "http"]
+    
+    asyncio.run(scenario())
+
+
+def test_joined_scrape_respects_the_callers_deadline():
+    """A caller with a short deadline does not wait out a longer scrape it joined."""
+    async def scenario():
+        calls = []
+        scraper = _slow_scraper(calls, seconds=0.3)
+        leader = asyncio.ensure_future(scraper.scrape("https://github.com/octocat", backend="http", deadline=0))
+        await asyncio.sleep(0)
+        with pytest.raises(asyncio.TimeoutError):
+            await scraper.scrape("https://github.com/octocat", backend="http", deadline=0.02)
+        
+        assert (await leader)["username"] == "octocat"
+        assert calls == ["http"]
+    
+    asyncio.run(scenario())
+
+
+def test_linkedin_scrapes_with_different_options_are_not_coalesced():
+    """JavaScript, session and HAR options each get their own LinkedIn flight."""
+    async def scenario():
+        calls = []
+        
+        def scraper(**options):
+            linkedin = LinkedInScraper(**{"persistent_session": True, "block_resources": True, **options})
+            
+            async def scrape(linkedin_url):
+                calls.append(options)
+                await asyncio.sleep(0.05)
+                return {"linkedin_url": linkedin_url}
+            
+            linkedin._scrape = scrape
+            return linkedin
+        
+        url = "https://www.linkedin.com/in/jane-doe/"
+        default = scraper()
+        await asyncio.gather(
+            default.scrape(url),
+            default.scrape("https://linkedin.com/in/Jane-Doe"),
+            scraper(javascript_enabled=False).scrape(url),
+            scraper(persistent_session=False).scrape(url)
+        )
+        assert calls == [{}, {"javascript_enabled": False}, {"persistent_session": False}]
+        
+        recorder = scraper(har_mode="record", har_path="linkedin.har")
+        assert recorder._flight_key(url) == "linkedin:in/jane-doe:har=record:linkedin.har"
+    
+    asyncio.run(scenario())